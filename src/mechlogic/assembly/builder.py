@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import Any, Optional, Dict, List
 
 import cadquery as cq
@@ -57,12 +58,13 @@ class AssemblyBuilder:
 
         # Create assembly
         assembly = cq.Assembly(name=self.spec.element.name)
+        locations = self.layout.to_locations_batch()
 
         # Generate each part and add to assembly
         for part_id, placement in self.layout.parts.items():
             generator = self._generators.get(placement.part_type)
             if generator is None:
-                print(f"Warning: No generator for part type {placement.part_type}")
+                print(f"Warning: No generator for part type {placement.part_type.name}")
                 continue
 
             # Generate part geometry
@@ -71,14 +73,14 @@ class AssemblyBuilder:
 
             # Get metadata
             meta = generator.get_metadata(self.spec)
-            meta.part_id = part_id  # Override with actual part_id
+            meta = replace(meta, part_id=part_id)  # Override with actual part_id
             self.metadata[part_id] = meta
 
             # Add to assembly with placement
             assembly.add(
                 part,
                 name=part_id,
-                loc=placement.to_location(),
+                loc=locations[part_id],
                 color=self._get_color(placement.part_type),
             )
 
@@ -111,7 +113,7 @@ class AssemblyBuilder:
                 "name": meta.name,
                 "material": meta.material,
                 "count": meta.count,
-                "dimensions": meta.dimensions,
+                "dimensions": dict(meta.dimensions),
                 "notes": meta.notes,
             })
         return bom
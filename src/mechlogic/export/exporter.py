@@ -127,7 +127,7 @@ class Exporter:
                     "name": meta.name,
                     "material": meta.material,
                     "count": meta.count,
-                    "dimensions": meta.dimensions,
+                    "dimensions": dict(meta.dimensions),
                     "notes": meta.notes,
                 }
                 for meta in metadata.values()
@@ -57,7 +57,7 @@ class AxleGenerator:
             part_type = PartType.LEVER_PIVOT
 
         return PartMetadata(
-            part_id=part_type.value,
+            part_id=part_type.name.lower(),
             part_type=part_type,
             name=f"Axle ({self.axle_type.upper()})",
             material="Steel rod" if self.axle_type == "main" else "PLA",
@@ -10,6 +10,9 @@ Full D-flat axles are simple:
   clears the D-flat everywhere
 """
 
+import functools
+import math
+
 import cadquery as cq
 
 
@@ -36,6 +39,35 @@ def make_d_flat_profile(diameter: float, d_flat_depth: float) -> cq.Workplane:
     return circle.cut(cut_box)
 
 
+def make_d_flat_wire(diameter: float, d_flat_depth: float) -> cq.Wire:
+    """Create a closed D-flat outline in the XY plane, centered at origin.
+
+    Unlike make_d_flat_profile this is a single wire (flat chord on +Y plus
+    the arc around -Y), so it can be used directly as a sketch face.
+
+    Args:
+        diameter: Cylinder diameter in mm.
+        d_flat_depth: Depth of the flat cut from the +Y edge in mm.
+
+    Returns:
+        CQ Wire of the D outline.
+    """
+    radius = diameter / 2
+    if d_flat_depth <= 0:
+        return cq.Wire.makeCircle(radius, cq.Vector(0, 0, 0), cq.Vector(0, 0, 1))
+
+    flat_y = radius - d_flat_depth  # Y of the flat face
+    half_chord = math.sqrt(radius ** 2 - flat_y ** 2)
+    return cq.Wire.assembleEdges([
+        cq.Edge.makeLine(cq.Vector(-half_chord, flat_y, 0), cq.Vector(half_chord, flat_y, 0)),
+        cq.Edge.makeThreePointArc(
+            cq.Vector(half_chord, flat_y, 0),
+            cq.Vector(0, -radius, 0),
+            cq.Vector(-half_chord, flat_y, 0),
+        ),
+    ])
+
+
 def make_d_flat_cylinder(
     diameter: float, length: float, d_flat_depth: float,
 ) -> cq.Workplane:
@@ -84,22 +116,19 @@ def make_d_flat_axle(
         CQ Workplane solid.
     """
     radius = diameter / 2
-    flat_y = radius - d_flat_depth
 
-    # Build circular cross-section in YZ, extrude along X
-    axle = (
-        cq.Workplane("YZ")
-        .circle(radius)
-        .extrude(length)
-    )
+    # Build the cylinder along X directly, then cut the flat along +Y
+    axle = cq.Solid.makeCylinder(radius, length, cq.Vector(0, 0, 0), cq.Vector(1, 0, 0))
+    return cq.Workplane(obj=axle.cut(_d_flat_cut_box_x(diameter, length, d_flat_depth)))
 
-    # Cut the flat along +Y for the full length
-    cut_box = (
-        cq.Workplane("XY")
-        .box(length + 2, d_flat_depth + 1, diameter + 2, centered=True)
-        .translate((length / 2, radius - d_flat_depth / 2 + 0.5, 0))
+
+def _d_flat_cut_box_x(diameter: float, length: float, d_flat_depth: float) -> cq.Solid:
+    """Box that removes the +Y flat from an axle along X starting at X=0."""
+    radius = diameter / 2
+    return cq.Solid.makeBox(
+        length + 2, d_flat_depth + 1, diameter + 2,
+        cq.Vector(-1, radius - d_flat_depth, -radius - 1),
     )
-    return axle.cut(cut_box)
 
 
 def add_groove_to_axle(
@@ -135,6 +164,113 @@ def add_groove_to_axle(
     return axle.cut(groove_ring)
 
 
+def make_grooved_d_flat_axle(
+    diameter: float,
+    length: float,
+    d_flat_depth: float,
+    groove_positions: tuple[float, ...] = (),
+) -> cq.Workplane:
+    """Create a D-flat X-axis axle with retention grooves, memoized.
+
+    Built by make_d_flat_axle_with_grooves. Identical axles are built once;
+    place them with a Location rather than translating. The returned
+    Workplane is shared between callers and must not be modified.
+
+    Args:
+        diameter: Axle diameter in mm.
+        length: Total axle length in mm.
+        d_flat_depth: Depth of flat cut in mm.
+        groove_positions: Groove X centers relative to the axle start.
+
+    Returns:
+        CQ Workplane solid starting at X=0.
+    """
+    # Round so offsets computed from different origins share a cache entry
+    key = tuple(round(x, 6) for x in groove_positions)
+    return _grooved_d_flat_axle(diameter, length, d_flat_depth, key)
+
+
+@functools.lru_cache(maxsize=64)
+def _grooved_d_flat_axle(
+    diameter: float,
+    length: float,
+    d_flat_depth: float,
+    groove_positions: tuple[float, ...],
+) -> cq.Workplane:
+    """Cached body of make_grooved_d_flat_axle."""
+    return make_d_flat_axle_with_grooves(diameter, length, d_flat_depth, groove_positions)
+
+
+def make_d_flat_axle_with_grooves(
+    diameter: float,
+    length: float,
+    d_flat_depth: float,
+    groove_positions: tuple[float, ...] = (),
+    groove_depth: float = 0.75,
+    groove_width: float = 1.5,
+) -> cq.Workplane:
+    """Create a D-flat X-axis axle with retention grooves in one revolve.
+
+    Same geometry as make_d_flat_axle followed by add_groove_to_axle for each
+    groove, but the grooves are notches in the revolved axial profile, so the
+    only boolean is the single D-flat cut.
+
+    Args:
+        diameter: Axle diameter in mm.
+        length: Total axle length in mm.
+        d_flat_depth: Depth of flat cut in mm.
+        groove_positions: X centers of the grooves.
+        groove_depth: Depth of each groove per side in mm.
+        groove_width: Width of each groove in X in mm.
+
+    Returns:
+        CQ Workplane solid starting at X=0.
+    """
+    radius = diameter / 2
+    groove_radius = radius - groove_depth
+
+    # Groove spans clipped to the axle, with overlapping grooves merged
+    spans: list[list[float]] = []
+    for x_position in sorted(groove_positions):
+        start = max(x_position - groove_width / 2, 0.0)
+        end = min(x_position + groove_width / 2, length)
+        if end <= start:
+            continue
+        if spans and start <= spans[-1][1]:
+            spans[-1][1] = max(spans[-1][1], end)
+        else:
+            spans.append([start, end])
+
+    # Half cross-section in the XY plane (Y = radius), revolved about X.
+    # The top edge steps down to groove_radius across each span; a span
+    # touching an axle end lowers that end face instead.
+    points = [(0.0, 0.0)]
+    for start, end in spans:
+        points += [(start, radius), (start, groove_radius),
+                   (end, groove_radius), (end, radius)]
+    points += [(length, radius), (length, 0.0)]
+    if spans and spans[0][0] == 0.0:
+        del points[1]
+    else:
+        points.insert(1, (0.0, radius))
+    if spans and spans[-1][1] == length:
+        del points[-3:-1]
+    outline = [points[0]]
+    for point in points[1:]:
+        if point != outline[-1]:
+            outline.append(point)
+
+    axle = (
+        cq.Workplane("XY")
+        .polyline(outline)
+        .close()
+        .revolve(360, (0, 0, 0), (1, 0, 0))
+    )
+
+    # Cut the flat along +Y for the full length
+    return axle.cut(_d_flat_cut_box_x(diameter, length, d_flat_depth))
+
+
 def add_groove_to_axle_z(
     axle: cq.Workplane,
     z_position: float,
@@ -328,17 +464,11 @@ def make_d_flat_axle_along_z(
     """
     radius = diameter / 2
 
-    axle = (
-        cq.Workplane("XY")
-        .circle(radius)
-        .extrude(length)
-        .translate((0, 0, z_start))
-    )
+    axle = cq.Solid.makeCylinder(radius, length, cq.Vector(0, 0, z_start), cq.Vector(0, 0, 1))
 
     # Cut the flat along +Y for the full length
-    cut_box = (
-        cq.Workplane("XY")
-        .box(diameter + 2, d_flat_depth + 1, length + 2, centered=True)
-        .translate((0, radius - d_flat_depth / 2 + 0.5, z_start + length / 2))
+    cut_box = cq.Solid.makeBox(
+        diameter + 2, d_flat_depth + 1, length + 2,
+        cq.Vector(-radius - 1, radius - d_flat_depth, z_start - 1),
     )
-    return axle.cut(cut_box)
+    return cq.Workplane(obj=axle.cut(cut_box))
@@ -1,6 +1,11 @@
 """Base protocol for part generators."""
 
-from typing import Protocol
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from pickle import PicklingError
+from typing import Callable, Optional, Protocol, Sequence
 
 import cadquery as cq
 
@@ -33,3 +38,48 @@ class PartGenerator(Protocol):
             Part metadata including name, dimensions, material
         """
         ...
+
+
+def shape_to_brep(shape: cq.Shape) -> bytes:
+    """Serialize a shape to BREP bytes for transfer between processes."""
+    buf = BytesIO()
+    shape.exportBrep(buf)
+    return buf.getvalue()
+
+
+def shape_from_brep(data: bytes) -> cq.Workplane:
+    """Deserialize BREP bytes produced by shape_to_brep."""
+    return cq.Workplane(obj=cq.Shape.importBrep(BytesIO(data)))
+
+
+@functools.lru_cache(maxsize=None)
+def _process_pool() -> ProcessPoolExecutor:
+    """Process pool shared by every parallel build, started on first use."""
+    return ProcessPoolExecutor()
+
+
+def build_in_processes(
+    jobs: Sequence[tuple[Callable[..., bytes], tuple]],
+) -> Optional[list[cq.Shape]]:
+    """Run shape-building jobs on the shared process pool.
+
+    Each job is ``(fn, args)``, where ``fn`` is a module-level function
+    returning shape_to_brep bytes. The shapes come back in job order.
+
+    Returns:
+        The shapes, or None if the work could not be done in worker
+        processes (no process support, a broken pool, or unpicklable
+        arguments); callers then build the shapes in-process.
+    """
+    try:
+        pool = _process_pool()
+        futures = [pool.submit(fn, *args) for fn, args in jobs]
+        return [shape_from_brep(future.result()).val() for future in futures]
+    except BrokenProcessPool:
+        # Start a fresh pool next time
+        _process_pool.cache_clear()
+        return None
+    except (OSError, RuntimeError, PicklingError, AttributeError):
+        # AttributeError is how pickle rejects local objects; a genuine
+        # error in the job resurfaces when the caller builds in-process
+        return None
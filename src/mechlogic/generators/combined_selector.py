@@ -6,11 +6,13 @@ Creates a complete selector mechanism with:
 - Rotating the driving bevel gear moves the shift lever to select gears
 """
 
+from typing import Optional
+
 import cadquery as cq
 
 from ..models.spec import LogicElementSpec
 from ..models.geometry import PartPlacement, PartMetadata, PartType
-from .layout import LayoutCalculator
+from .layout import LayoutCalculator, SelectorLayout
 from .selector_mechanism import SelectorMechanismGenerator
 from .bevel_lever import BevelLeverGenerator
 
@@ -56,6 +58,7 @@ class CombinedSelectorGenerator:
         spec: LogicElementSpec,
         origin: tuple[float, float, float] = (0, 0, 0),
         name_prefix: str = "",
+        layout: Optional[SelectorLayout] = None,
     ) -> None:
         """Add combined selector mechanism to an existing assembly.
 
@@ -64,13 +67,22 @@ class CombinedSelectorGenerator:
             spec: The logic element specification.
             origin: The (x, y, z) origin point.
             name_prefix: Optional prefix for component names.
+            layout: Precomputed selector layout for ``spec``. Computed here if
+                not given.
         """
         ox, oy, oz = origin
-        selector_layout = LayoutCalculator.calculate_selector_layout(spec)
+        selector_layout = layout
+        if selector_layout is None:
+            selector_layout = LayoutCalculator.calculate_selector_layout(spec)
 
         # Add selector mechanism (gears + clutch, no lever)
         selector_gen = SelectorMechanismGenerator(include_axle=self.include_axles)
-        selector_gen.add_to_assembly(assy, spec, origin=origin, name_prefix=name_prefix)
+        selector_gen.add_to_assembly(
+            assy, spec,
+            origin=origin,
+            name_prefix=name_prefix,
+            layout=selector_layout,
+        )
 
         # Add bevel lever (bevel gears + shift lever) at the clutch position
         # The lever fork engages the clutch at clutch_center
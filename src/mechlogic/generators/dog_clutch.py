@@ -272,7 +272,7 @@ class DogClutchGenerator:
         clutch_od = gear_od * 0.4
 
         return PartMetadata(
-            part_id=PartType.DOG_CLUTCH.value,
+            part_id=PartType.DOG_CLUTCH.name.lower(),
             part_type=PartType.DOG_CLUTCH,
             name="Sliding Dog Clutch",
             material="PLA",
@@ -104,7 +104,7 @@ class FlexureBlockGenerator:
         flexure = spec.flexure
 
         return PartMetadata(
-            part_id=PartType.FLEXURE_BLOCK.value,
+            part_id=PartType.FLEXURE_BLOCK.name.lower(),
             part_type=PartType.FLEXURE_BLOCK,
             name="Flexure Block (Living Hinge)",
             material="PLA",
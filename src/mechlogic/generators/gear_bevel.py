@@ -7,6 +7,7 @@ References:
     - https://github.com/meadiode/cq_gears (CadQuery involute gear library)
 """
 
+import functools
 import math
 
 import cadquery as cq
@@ -17,6 +18,13 @@ from ..models.geometry import PartPlacement, PartMetadata, PartType
 from .axle_profile import add_d_flat_to_bore
 
 
+@functools.lru_cache(maxsize=128)
+def _cone_distance(module: float, teeth: int) -> float:
+    """Pitch cone distance of a 45° bevel gear, memoized per (module, teeth)."""
+    pitch_radius = (module * teeth) / 2
+    return pitch_radius / math.sin(math.radians(45.0))
+
+
 class BevelGearGenerator:
     """Generator for bevel gears (90-degree axis conversion).
 
@@ -70,10 +78,7 @@ class BevelGearGenerator:
 
     def get_cone_distance(self, spec: LogicElementSpec) -> float:
         """Calculate the pitch cone distance (apex to pitch circle)."""
-        module = spec.gears.module
-        teeth = spec.gears.bevel_teeth
-        pitch_radius = (module * teeth) / 2
-        return pitch_radius / math.sin(math.radians(45.0))
+        return _cone_distance(spec.gears.module, spec.gears.bevel_teeth)
 
     def get_face_width(self, spec: LogicElementSpec) -> float:
         """Calculate face width (tooth length along cone surface).
@@ -82,9 +87,7 @@ class BevelGearGenerator:
         or 10x the module.
         """
         module = spec.gears.module
-        teeth = spec.gears.bevel_teeth
-        pitch_radius = (module * teeth) / 2
-        cone_distance = pitch_radius / math.sin(math.radians(45.0))
+        cone_distance = _cone_distance(module, spec.gears.bevel_teeth)
         return min(cone_distance * 0.30, 10 * module)
 
     def get_metadata(self, spec: LogicElementSpec) -> PartMetadata:
@@ -100,7 +103,7 @@ class BevelGearGenerator:
         part_type = PartType.BEVEL_DRIVE if self.gear_id == "driving" else PartType.BEVEL_DRIVEN
 
         return PartMetadata(
-            part_id=part_type.value,
+            part_id=part_type.name.lower(),
             part_type=part_type,
             name=f"Bevel Gear ({self.gear_id})",
             material="PLA",
@@ -1,5 +1,6 @@
 """Spur gear generator using cq_gears for proper involute teeth."""
 
+import functools
 import math
 
 import cadquery as cq
@@ -145,7 +146,7 @@ class SpurGearGenerator:
         part_type = PartType.GEAR_A if self.gear_id == "a" else PartType.GEAR_B
 
         return PartMetadata(
-            part_id=part_type.value,
+            part_id=part_type.name.lower(),
             part_type=part_type,
             name=f"Coaxial Gear {self.gear_id.upper()}",
             material="PLA",
@@ -159,3 +160,29 @@ class SpurGearGenerator:
                 "bore_diameter": spec.primary_shaft_diameter + spec.tolerances.shaft_clearance,
             },
         )
+
+
+@functools.lru_cache(maxsize=128)
+def make_spur_gear_along_x(
+    spec: LogicElementSpec,
+    gear_id: str,
+    include_dog_teeth: bool = True,
+) -> cq.Workplane:
+    """Build a spur gear rotated so its axis runs along X, memoized per spec.
+
+    Gear geometry does not depend on placement, so identical gears are built
+    once and positioned with a Location when added to an assembly. The
+    returned Workplane is shared between callers and must not be modified.
+
+    Args:
+        spec: The logic element specification.
+        gear_id: "a" or "b" to identify which coaxial gear.
+        include_dog_teeth: If True, add dog clutch teeth to one face.
+
+    Returns:
+        CadQuery Workplane with the rotated gear.
+    """
+    gen = SpurGearGenerator(gear_id=gear_id, include_dog_teeth=include_dog_teeth)
+    part_type = PartType.GEAR_A if gear_id == "a" else PartType.GEAR_B
+    placement = PartPlacement(part_type=part_type, part_id=f"gear_{gear_id}")
+    return gen.generate(spec, placement).rotate((0, 0, 0), (0, 1, 0), 90)
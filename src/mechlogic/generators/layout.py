@@ -3,12 +3,30 @@
 Centralizes position and dimension calculations used across multiple generators.
 """
 
+import functools
 from dataclasses import dataclass, field
 from typing import List, Tuple
 
 from ..models.spec import LogicElementSpec
 from .gear_bevel import BevelGearGenerator
 
+try:
+    from numba import njit as _numba_njit
+except ImportError:  # numba is an optional extra (pip install mechlogic[jit])
+    _numba_njit = None
+
+
+def jit_kernel(func):
+    """Compile a scalar layout kernel with Numba when it is installed.
+
+    Kernels must take and return plain floats (or tuples of floats). Without
+    numba the function is returned unchanged, so results are identical either
+    way; compiled kernels are cached on disk to avoid recompiling per process.
+    """
+    if _numba_njit is None:
+        return func
+    return _numba_njit(cache=True)(func)
+
 
 @dataclass
 class SplitSnapParams:
@@ -43,7 +61,7 @@ class ConnectionLayout:
     bolt_diameter: float = 3.2               # M3 clearance hole
 
 
-@dataclass
+@dataclass(frozen=True)
 class SelectorLayout:
     """Calculated positions for a selector mechanism."""
     gear_a_center: float
@@ -54,7 +72,7 @@ class SelectorLayout:
     shaft_diameter: float
 
 
-@dataclass
+@dataclass(frozen=True)
 class BevelLayout:
     """Calculated positions for a bevel gear pair."""
     mesh_distance: float
@@ -62,7 +80,7 @@ class BevelLayout:
     cone_distance: float
 
 
-@dataclass
+@dataclass(frozen=True)
 class HousingLayout:
     """Calculated positions for housing plates and axles."""
     left_plate_x: float
@@ -75,7 +93,7 @@ class HousingLayout:
     axle_overhang: float
 
 
-@dataclass
+@dataclass(frozen=True)
 class MuxLayout:
     """Calculated positions for a complete mux assembly."""
     selector: SelectorLayout
@@ -89,8 +107,80 @@ class MuxLayout:
     spur_pitch_diameter: float
 
 
+@jit_kernel
+def _selector_layout_math(
+    face_width: float,
+    clutch_width: float,
+    gear_spacing: float,
+    dog_tooth_height: float,
+    plate_thickness: float,
+    device_length_x: float,
+) -> tuple:
+    """Selector gear/clutch X positions (pure scalar arithmetic).
+
+    Returns:
+        (gear_a_center, clutch_center, gear_b_center, engagement_travel)
+    """
+    clutch_half_span = clutch_width / 2 + dog_tooth_height
+    gear_teeth_end = face_width + dog_tooth_height
+
+    # Calculate uncentered positions first
+    # These positions represent where the gear's X=0 point lands after rotation
+    gear_a_uncentered = 0.0
+    clutch_uncentered = gear_teeth_end + gear_spacing + clutch_half_span
+    engagement_travel = gear_spacing + dog_tooth_height
+    gear_b_uncentered = clutch_uncentered + engagement_travel + clutch_half_span
+
+    # Calculate actual mechanism bounding box edges (after rotation)
+    # Gear A: left edge at position, right edge at position + face_width + dog_tooth_height
+    # Gear B: left edge at position - dog_tooth_height, right edge at position + face_width
+    mechanism_left_edge = gear_a_uncentered  # Gear A left edge
+    mechanism_right_edge = gear_b_uncentered + face_width  # Gear B right edge
+
+    # Housing inner faces (where mechanism should fit between)
+    left_plate_inner = plate_thickness / 2
+    right_plate_inner = device_length_x - plate_thickness / 2
+
+    # Calculate offset to center mechanism between housing inner faces
+    mechanism_center = (mechanism_left_edge + mechanism_right_edge) / 2
+    housing_center = (left_plate_inner + right_plate_inner) / 2
+    centering_offset = housing_center - mechanism_center
+
+    # Apply centering offset
+    gear_a_center = gear_a_uncentered + centering_offset
+    clutch_center = clutch_uncentered + centering_offset
+    gear_b_center = gear_b_uncentered + centering_offset
+
+    return gear_a_center, clutch_center, gear_b_center, engagement_travel
+
+
+@jit_kernel
+def _housing_layout_math(device_length_x: float, axle_overhang: float) -> tuple:
+    """Housing plate and axle X extents (pure scalar arithmetic).
+
+    Returns:
+        (left_plate_x, right_plate_x, axle_start_x, axle_end_x, axle_length)
+    """
+    # Housing plates at start and end of device
+    left_plate_x = 0.0
+    right_plate_x = device_length_x
+
+    # Axles extend past housing plates by axle_overhang
+    axle_start_x = left_plate_x - axle_overhang
+    axle_end_x = right_plate_x + axle_overhang
+    axle_length = axle_end_x - axle_start_x
+
+    return left_plate_x, right_plate_x, axle_start_x, axle_end_x, axle_length
+
+
 class LayoutCalculator:
-    """Calculates component positions for mechanical assemblies."""
+    """Calculates component positions for mechanical assemblies.
+
+    The bevel and mux layouts are memoized per spec (specs are hashable),
+    so the returned layouts are frozen and shared between callers. The
+    selector and housing layouts are a few lines of arithmetic, cheaper than
+    hashing the spec, so they are computed on every call.
+    """
 
     @staticmethod
     def calculate_selector_layout(spec: LogicElementSpec) -> SelectorLayout:
@@ -114,35 +204,14 @@ class LayoutCalculator:
         dog_tooth_height = spec.gears.dog_clutch.tooth_height
         plate_thickness = spec.geometry.housing_thickness
 
-        clutch_half_span = clutch_width / 2 + dog_tooth_height
-        gear_teeth_end = face_width + dog_tooth_height
-
-        # Calculate uncentered positions first
-        # These positions represent where the gear's X=0 point lands after rotation
-        gear_a_uncentered = 0
-        clutch_uncentered = gear_teeth_end + gear_spacing + clutch_half_span
-        engagement_travel = gear_spacing + dog_tooth_height
-        gear_b_uncentered = clutch_uncentered + engagement_travel + clutch_half_span
-
-        # Calculate actual mechanism bounding box edges (after rotation)
-        # Gear A: left edge at position, right edge at position + face_width + dog_tooth_height
-        # Gear B: left edge at position - dog_tooth_height, right edge at position + face_width
-        mechanism_left_edge = gear_a_uncentered  # Gear A left edge
-        mechanism_right_edge = gear_b_uncentered + face_width  # Gear B right edge
-
-        # Housing inner faces (where mechanism should fit between)
-        left_plate_inner = plate_thickness / 2
-        right_plate_inner = spec.geometry.device_length_x - plate_thickness / 2
-
-        # Calculate offset to center mechanism between housing inner faces
-        mechanism_center = (mechanism_left_edge + mechanism_right_edge) / 2
-        housing_center = (left_plate_inner + right_plate_inner) / 2
-        centering_offset = housing_center - mechanism_center
-
-        # Apply centering offset
-        gear_a_center = gear_a_uncentered + centering_offset
-        clutch_center = clutch_uncentered + centering_offset
-        gear_b_center = gear_b_uncentered + centering_offset
+        gear_a_center, clutch_center, gear_b_center, engagement_travel = _selector_layout_math(
+            float(face_width),
+            float(clutch_width),
+            float(gear_spacing),
+            float(dog_tooth_height),
+            float(plate_thickness),
+            float(spec.geometry.device_length_x),
+        )
 
         return SelectorLayout(
             gear_a_center=gear_a_center,
@@ -154,6 +223,7 @@ class LayoutCalculator:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def calculate_bevel_layout(spec: LogicElementSpec) -> BevelLayout:
         """Calculate positions for bevel gear pair.
 
@@ -221,14 +291,9 @@ class LayoutCalculator:
         axle_overhang = spec.geometry.axle_overhang
         plate_thickness = spec.geometry.housing_thickness
 
-        # Housing plates at start and end of device
-        left_plate_x = 0.0
-        right_plate_x = device_length_x
-
-        # Axles extend past housing plates by axle_overhang
-        axle_start_x = left_plate_x - axle_overhang
-        axle_end_x = right_plate_x + axle_overhang
-        axle_length = axle_end_x - axle_start_x
+        (
+            left_plate_x, right_plate_x, axle_start_x, axle_end_x, axle_length,
+        ) = _housing_layout_math(float(device_length_x), float(axle_overhang))
 
         return HousingLayout(
             left_plate_x=left_plate_x,
@@ -242,6 +307,7 @@ class LayoutCalculator:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def calculate_mux_layout(spec: LogicElementSpec) -> MuxLayout:
         """Calculate complete layout for a mux assembly.
 
@@ -132,26 +132,32 @@ class MotorAssemblyGenerator:
         # Motor housing mount plate is at axle_end_x (with plate extending in -X)
         coupling_x = (housing_right_outer + axle_end_x) / 2
 
+        # One shared coupling shape, placed by location
+        coupling = coupling_gen.generate()
+
         # Coupling A
-        coupling_a = coupling_gen.generate_positioned(
-            position=(coupling_x, 0.0, mux_layout.input_a_z),
-            motor_side='+X',
+        assy.add(
+            coupling,
+            name="coupling_a",
+            loc=coupling_gen.get_location((coupling_x, 0.0, mux_layout.input_a_z), motor_side='+X'),
+            color=cq.Color(0.7, 0.5, 0.2),
         )
-        assy.add(coupling_a, name="coupling_a", color=cq.Color(0.7, 0.5, 0.2))
 
         # Coupling B
-        coupling_b = coupling_gen.generate_positioned(
-            position=(coupling_x, 0.0, mux_layout.input_b_z),
-            motor_side='+X',
+        assy.add(
+            coupling,
+            name="coupling_b",
+            loc=coupling_gen.get_location((coupling_x, 0.0, mux_layout.input_b_z), motor_side='+X'),
+            color=cq.Color(0.7, 0.5, 0.2),
         )
-        assy.add(coupling_b, name="coupling_b", color=cq.Color(0.7, 0.5, 0.2))
 
         # Coupling S
-        coupling_s = coupling_gen.generate_positioned(
-            position=(coupling_x, mux_layout.pivot_y, 0.0),
-            motor_side='+X',
+        assy.add(
+            coupling,
+            name="coupling_s",
+            loc=coupling_gen.get_location((coupling_x, mux_layout.pivot_y, 0.0), motor_side='+X'),
+            color=cq.Color(0.7, 0.5, 0.2),
         )
-        assy.add(coupling_s, name="coupling_s", color=cq.Color(0.7, 0.5, 0.2))
 
     def generate_housing_only(self, spec: LogicElementSpec, motor: str = 'a') -> cq.Assembly:
         """Generate just one motor housing, positioned.
@@ -7,6 +7,8 @@ Motor position:
 - Motor S: Y=36 (pivot_y), Z=0 (aligned with S/bevel driver axle)
 """
 
+import math
+
 import cadquery as cq
 from dataclasses import dataclass
 from typing import Optional
@@ -141,55 +143,71 @@ class LeftMotorMountGenerator:
             Solid representing the pocket (to be subtracted from plate)
         """
         p = self.params
-        motor = p.motor
 
         # Motor body pocket dimensions
-        body_radius = motor.body_diameter / 2 + p.motor_body_clearance
-        flat_half_width = motor.flat_width / 2 + p.motor_body_clearance
-
-        # Create D-shaped pocket by starting with cylinder and cutting flats
-        # Extrude in +X direction (matching right mount)
-        cylinder = (
-            cq.Workplane('YZ')
-            .center(motor_y, motor_z)
-            .circle(body_radius)
-            .extrude(pocket_depth)
-        )
-
-        # Cut off material outside the flat region
-        # We keep only the region where |Y - motor_y| <= flat_half_width
-        # Cut a box on the -Y side beyond the flat
-        cut_box_minus_y = (
-            cq.Workplane('YZ')
-            .center(motor_y - flat_half_width - body_radius, motor_z)
-            .rect(body_radius * 2, body_radius * 2)
-            .extrude(pocket_depth)
-        )
-        # Cut a box on the +Y side beyond the flat
-        cut_box_plus_y = (
-            cq.Workplane('YZ')
-            .center(motor_y + flat_half_width + body_radius, motor_z)
-            .rect(body_radius * 2, body_radius * 2)
-            .extrude(pocket_depth)
-        )
-
-        pocket = cylinder.cut(cut_box_minus_y).cut(cut_box_plus_y)
+        body_radius = p.body_radius
+        flat_half_width = p.flat_half_width
+
+        # Build the D-shaped outline directly: two flat sides at
+        # Y = motor_y ± flat_half_width joined by arcs of the body circle,
+        # extruded in +X. No booleans needed.
+        if flat_half_width < body_radius:
+            arc_half_height = math.sqrt(body_radius ** 2 - flat_half_width ** 2)
+            y_lo, y_hi = motor_y - flat_half_width, motor_y + flat_half_width
+            z_lo, z_hi = motor_z - arc_half_height, motor_z + arc_half_height
+            outline = cq.Wire.assembleEdges([
+                cq.Edge.makeLine(cq.Vector(0, y_hi, z_lo), cq.Vector(0, y_hi, z_hi)),
+                cq.Edge.makeThreePointArc(
+                    cq.Vector(0, y_hi, z_hi),
+                    cq.Vector(0, motor_y, motor_z + body_radius),
+                    cq.Vector(0, y_lo, z_hi),
+                ),
+                cq.Edge.makeLine(cq.Vector(0, y_lo, z_hi), cq.Vector(0, y_lo, z_lo)),
+                cq.Edge.makeThreePointArc(
+                    cq.Vector(0, y_lo, z_lo),
+                    cq.Vector(0, motor_y, motor_z - body_radius),
+                    cq.Vector(0, y_hi, z_lo),
+                ),
+            ])
+            body = cq.Solid.extrudeLinear(outline, [], cq.Vector(pocket_depth, 0, 0))
+        else:
+            # Flats wider than the body: plain cylindrical pocket
+            body = cq.Solid.makeCylinder(
+                body_radius, pocket_depth,
+                pnt=cq.Vector(0, motor_y, motor_z),
+                dir=cq.Vector(1, 0, 0),
+            )
+        pocket = cq.Workplane(obj=body)
 
         # Add tab slots if enabled
         if p.include_tab_slots:
-            tab_width = motor.tab_width + p.tab_clearance * 2
-            tab_length = motor.tab_length + p.tab_clearance
-            tab_thickness = motor.tab_thickness + p.tab_clearance * 2
+            tab_width, tab_length, tab_thickness = p.tab_slot_dims
 
             # Tab slots extend from the flat sides in ±Y direction
-            # Positioned at the motor center Z
-            for y_dir in [-1, 1]:
-                tab_slot = (
+            # Positioned at the motor center Z. If the span between the flats
+            # lies inside the body pocket, both slots are drawn as one strip
+            # across it; otherwise each slot is added separately.
+            strip_fits = (
+                flat_half_width < body_radius
+                and tab_thickness <= pocket_depth
+                and tab_width / 2 <= math.sqrt(body_radius ** 2 - flat_half_width ** 2)
+            )
+            if strip_fits:
+                tab_slots = [
+                    cq.Workplane('YZ')
+                    .center(motor_y, motor_z)
+                    .rect(2 * (flat_half_width + tab_length), tab_width)
+                    .extrude(tab_thickness)
+                ]
+            else:
+                tab_slots = [
                     cq.Workplane('YZ')
                     .center(motor_y + y_dir * (flat_half_width + tab_length / 2), motor_z)
                     .rect(tab_length, tab_width)
                     .extrude(tab_thickness)
-                )
+                    for y_dir in (-1, 1)
+                ]
+            for tab_slot in tab_slots:
                 pocket = pocket.union(tab_slot)
 
         return pocket
@@ -208,13 +226,24 @@ class LeftMotorMountGenerator:
         motor = p.motor
 
         # Create the base plate (in YZ plane, extruded in -X toward housing)
-        plate = (
-            cq.Workplane('YZ')
-            .center(layout.plate_center_y, layout.plate_center_z)
-            .rect(layout.plate_width_y, layout.plate_height_z)
-            .extrude(-p.plate_thickness)  # Extrude in -X (away from motors)
-            .translate((layout.plate_x, 0, 0))
+        # Built as a single box primitive spanning X from plate_x - plate_thickness
+        # to plate_x. The workplane sits on the +X face, centered on the plate,
+        # so the holes below are drilled from it directly (plate-relative
+        # positions) without re-selecting the face after each cut.
+        plate_solid = cq.Solid.makeBox(
+            p.plate_thickness, layout.plate_width_y, layout.plate_height_z,
+            pnt=cq.Vector(
+                layout.plate_x - p.plate_thickness,
+                layout.plate_center_y - layout.plate_width_y / 2,
+                layout.plate_center_z - layout.plate_height_z / 2,
+            ),
         )
+        front_plane = cq.Plane(
+            origin=(layout.plate_x, layout.plate_center_y, layout.plate_center_z),
+            xDir=(0, 1, 0),
+            normal=(1, 0, 0),
+        )
+        plate = cq.Workplane(front_plane, obj=plate_solid)
 
         # Cut motor pocket (D-shaped with tab slots)
         pocket = self._create_motor_pocket(
@@ -225,22 +254,19 @@ class LeftMotorMountGenerator:
         plate = plate.cut(pocket_positioned)
 
         # Add shaft through-hole
-        shaft_hole_diameter = motor.shaft_diameter + 2 * p.shaft_clearance
+        shaft_hole_diameter = p.shaft_hole_diameter
         motor_position_relative = [
             (layout.motor_s_y - layout.plate_center_y, layout.motor_s_z - layout.plate_center_z),
         ]
         plate = (
             plate
-            .faces(">X")
-            .workplane()
             .pushPoints(motor_position_relative)
             .hole(shaft_hole_diameter)
         )
 
         # Add tab screw holes (through-holes for M2 screws to secure motor tabs)
         if p.include_tab_slots:
-            flat_half_width = motor.flat_width / 2 + p.motor_body_clearance
-            tab_screw_offset = flat_half_width + motor.tab_hole_offset
+            tab_screw_offset = p.flat_half_width + motor.tab_hole_offset
 
             tab_screw_positions = [
                 (layout.motor_s_y - tab_screw_offset - layout.plate_center_y,
@@ -251,8 +277,6 @@ class LeftMotorMountGenerator:
 
             plate = (
                 plate
-                .faces(">X")
-                .workplane()
                 .pushPoints(tab_screw_positions)
                 .hole(p.tab_screw_diameter)
             )
@@ -264,8 +288,6 @@ class LeftMotorMountGenerator:
         ]
         plate = (
             plate
-            .faces(">X")
-            .workplane()
             .pushPoints(mounting_hole_points)
             .hole(p.mounting_hole_diameter)
         )
@@ -302,7 +324,6 @@ class LeftMotorMountGenerator:
         # Base plate extends in +X direction (away from housing, toward motors)
         base_x_start = vertical_plate_front_x
         base_x_end = base_x_start + p.base_depth
-        base_center_x = (base_x_start + base_x_end) / 2
 
         # Base Y extent matches vertical plate
         base_y_min = layout.plate_center_y - layout.plate_width_y / 2
@@ -314,13 +335,12 @@ class LeftMotorMountGenerator:
         base_z_min = layout.plate_center_z - layout.plate_height_z / 2
         base_z_top = base_z_min + p.base_thickness
 
-        # Create base plate (horizontal, in XY plane)
-        base = (
-            cq.Workplane('XY')
-            .center(base_center_x, base_center_y)
-            .rect(p.base_depth, base_width_y)
-            .extrude(p.base_thickness)
-            .translate((0, 0, base_z_min))
+        # Create base plate (horizontal, in XY plane).
+        # Solids are built directly in world coordinates to skip the
+        # Workplane sketch/extrude/translate round-trips.
+        base = cq.Solid.makeBox(
+            p.base_depth, base_width_y, p.base_thickness,
+            pnt=cq.Vector(base_x_start, base_y_min, base_z_min),
         )
 
         # Add triangular gussets for rigidity
@@ -337,20 +357,25 @@ class LeftMotorMountGenerator:
         else:
             gusset_y_positions = [base_center_y]
 
+        gussets = []
         for gusset_y in gusset_y_positions:
-            # Create triangular gusset profile (extends in +X from vertical plate)
-            gusset = (
-                cq.Workplane('XZ')
-                .moveTo(base_x_start, base_z_top)  # At vertical plate base
-                .lineTo(base_x_start + gusset_depth, base_z_top)  # Extends in +X
-                .lineTo(base_x_start, base_z_top + gusset_height)  # Up the vertical plate
-                .close()
-                .extrude(p.gusset_thickness)
-                .translate((0, gusset_y - p.gusset_thickness / 2, 0))
+            # Triangular gusset profile in the XZ plane, extruded in -Y
+            # (matches the XZ workplane normal)
+            profile_y = gusset_y - p.gusset_thickness / 2
+            profile = cq.Wire.makePolygon(
+                [
+                    cq.Vector(base_x_start, profile_y, base_z_top),  # At vertical plate base
+                    cq.Vector(base_x_start + gusset_depth, profile_y, base_z_top),  # Extends in +X
+                    cq.Vector(base_x_start, profile_y, base_z_top + gusset_height),  # Up the vertical plate
+                ],
+                close=True,
+            )
+            gussets.append(
+                cq.Solid.extrudeLinear(profile, [], cq.Vector(0, -p.gusset_thickness, 0))
             )
-            base = base.union(gusset)
 
         # Add feet for stability (cylindrical standoffs under base)
+        feet = []
         if p.foot_height > 0:
             foot_inset = p.foot_diameter / 2 + 3.0
             foot_positions = [
@@ -361,17 +386,18 @@ class LeftMotorMountGenerator:
             ]
 
             for foot_x, foot_y in foot_positions:
-                foot = (
-                    cq.Workplane('XY')
-                    .center(foot_x, foot_y)
-                    .circle(p.foot_diameter / 2)
-                    .extrude(-p.foot_height)
-                    .translate((0, 0, base_z_min))
+                feet.append(
+                    cq.Solid.makeCylinder(
+                        p.foot_diameter / 2, p.foot_height,
+                        pnt=cq.Vector(foot_x, foot_y, base_z_min - p.foot_height),
+                        dir=cq.Vector(0, 0, 1),
+                    )
                 )
-                base = base.union(foot)
 
         # Union base structure with vertical plate
-        return plate.union(base)
+        base = cq.Workplane(obj=base.fuse(*gussets, *feet, glue=True).clean())
+        # The base only touches the plate at planar faces
+        return plate.union(base, glue=True)
 
     def get_layout(self) -> LeftMotorMountLayout:
         """Get the calculated layout."""
@@ -65,10 +65,40 @@ class MotorMountParams:
     foot_height: float = 5.0            # Height of feet/standoffs under base
     foot_diameter: float = 10.0         # Diameter of feet
 
-
-@dataclass
+    # Derived pocket/hole dimensions
+
+    @property
+    def body_radius(self) -> float:
+        """Radius of the motor body pocket, including clearance."""
+        return self.motor.body_diameter / 2 + self.motor_body_clearance
+
+    @property
+    def flat_half_width(self) -> float:
+        """Half-width across the pocket flats, including clearance."""
+        return self.motor.flat_width / 2 + self.motor_body_clearance
+
+    @property
+    def tab_slot_dims(self) -> tuple[float, float, float]:
+        """(width, length, thickness) of each tab slot, including clearance."""
+        motor = self.motor
+        return (
+            motor.tab_width + self.tab_clearance * 2,
+            motor.tab_length + self.tab_clearance,
+            motor.tab_thickness + self.tab_clearance * 2,
+        )
+
+    @property
+    def shaft_hole_diameter(self) -> float:
+        """Diameter of the motor shaft clearance hole."""
+        return self.motor.shaft_diameter + 2 * self.shaft_clearance
+
+
+@dataclass(frozen=True)
 class ShaftCouplingParams:
-    """Parameters for motor-to-mechanism shaft coupling."""
+    """Parameters for motor-to-mechanism shaft coupling.
+
+    Frozen so generated couplings can be cached per parameter set.
+    """
 
     motor_shaft_diameter: float = 2.0   # Motor side bore
     mechanism_shaft_diameter: float = 6.0  # Mechanism side bore
@@ -8,17 +8,23 @@ Motor positions:
 - Motor B: Y=0, Z=-36 (aligned with Input B axle)
 """
 
+import functools
+import math
+
 import cadquery as cq
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
+
 from ..models.spec import LogicElementSpec
 from .motor_mount_params import Motor130Params, MotorMountParams
-from .layout import LayoutCalculator
+from .layout import LayoutCalculator, jit_kernel
 from .lower_housing import LowerHousingParams
+from .base import build_in_processes, shape_to_brep
 
 
-@dataclass
+@dataclass(frozen=True)
 class RightMotorMountLayout:
     """Calculated layout for right motor mount."""
 
@@ -36,7 +42,118 @@ class RightMotorMountLayout:
     motor_b_z: float
 
     # Mounting hole positions
-    mounting_hole_positions: list  # List of (y, z) tuples
+    mounting_hole_positions: tuple  # Tuple of (y, z) tuples
+
+
+@jit_kernel
+def _layout_math(
+    motor_body_diameter: float,
+    motor_body_clearance: float,
+    mounting_hole_inset: float,
+    mounting_hole_diameter: float,
+    motor_y: float,
+    motor_a_z: float,
+    motor_b_z: float,
+) -> tuple:
+    """Plate extent for the right motor mount (pure scalar arithmetic).
+
+    Returns:
+        (plate_width_y, plate_center_y, plate_height_z, plate_center_z, z_min, z_max)
+    """
+    # Calculate plate size to cover both motors with margin
+    motor_radius = motor_body_diameter / 2 + motor_body_clearance
+    margin = mounting_hole_inset + mounting_hole_diameter / 2 + 5.0
+
+    # Y extent: center on motor Y with margin for mounting holes
+    plate_width_y = motor_body_diameter + 2 * margin
+    plate_center_y = motor_y
+
+    # Z extent: from motor B bottom to motor A top
+    z_min = motor_b_z - motor_radius - margin
+    z_max = motor_a_z + motor_radius + margin
+    plate_height_z = z_max - z_min
+    plate_center_z = (z_min + z_max) / 2
+
+    return plate_width_y, plate_center_y, plate_height_z, plate_center_z, z_min, z_max
+
+
+# Default positions (motor_y, motor_a_z, motor_b_z, plate_x) used when no
+# spec is given
+_DEFAULT_POSITIONS = (0.0, 36.0, -36.0, 48.0)
+_DEFAULT_PARAMS = MotorMountParams()
+
+
+def _build_layout(
+    p: MotorMountParams,
+    motor_y: float,
+    motor_a_z: float,
+    motor_b_z: float,
+    plate_x: float,
+) -> RightMotorMountLayout:
+    """Build the plate layout for the given motor positions."""
+    motor = p.motor
+
+    # Calculate plate size to cover both motors with margin
+    (
+        plate_width_y, plate_center_y, plate_height_z, plate_center_z, z_min, z_max,
+    ) = _layout_math(
+        float(motor.body_diameter),
+        float(p.motor_body_clearance),
+        float(p.mounting_hole_inset),
+        float(p.mounting_hole_diameter),
+        float(motor_y),
+        float(motor_a_z),
+        float(motor_b_z),
+    )
+
+    # Mounting hole positions (corners of plate)
+    hole_inset = p.mounting_hole_inset
+    mounting_holes = (
+        (plate_center_y - plate_width_y / 2 + hole_inset, z_min + hole_inset),
+        (plate_center_y + plate_width_y / 2 - hole_inset, z_min + hole_inset),
+        (plate_center_y - plate_width_y / 2 + hole_inset, z_max - hole_inset),
+        (plate_center_y + plate_width_y / 2 - hole_inset, z_max - hole_inset),
+    )
+
+    return RightMotorMountLayout(
+        plate_x=plate_x,
+        plate_center_y=plate_center_y,
+        plate_center_z=plate_center_z,
+        plate_width_y=plate_width_y,
+        plate_height_z=plate_height_z,
+        motor_a_y=motor_y,
+        motor_a_z=motor_a_z,
+        motor_b_y=motor_y,
+        motor_b_z=motor_b_z,
+        mounting_hole_positions=mounting_holes,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _default_layout() -> RightMotorMountLayout:
+    """Layout for default params and positions, built once and shared."""
+    return _build_layout(_DEFAULT_PARAMS, *_DEFAULT_POSITIONS)
+
+
+def _motor_pocket_brep(
+    params: MotorMountParams,
+    motor_y: float,
+    motor_z: float,
+    pocket_depth: float,
+) -> bytes:
+    """Build the motor pocket in a worker process."""
+    gen = RightMotorMountGenerator(params=params)
+    pocket = gen._create_motor_pocket(motor_y, motor_z, pocket_depth)
+    return shape_to_brep(pocket.val())
+
+
+def _support_structure_brep(
+    params: MotorMountParams,
+    layout: "RightMotorMountLayout",
+) -> bytes:
+    """Build the base/gusset/feet group in a worker process."""
+    gen = RightMotorMountGenerator(params=params)
+    return shape_to_brep(gen._create_support_structure(layout).val())
 
 
 class RightMotorMountGenerator:
@@ -62,8 +179,12 @@ class RightMotorMountGenerator:
         if self._layout is not None:
             return self._layout
 
+        if self.spec is None and self.params == _DEFAULT_PARAMS:
+            # Default params and positions: share one precomputed layout
+            self._layout = _default_layout()
+            return self._layout
+
         p = self.params
-        motor = p.motor
 
         if self.spec is not None:
             # Get positions from spec
@@ -79,46 +200,9 @@ class RightMotorMountGenerator:
             plate_x = housing_right_outer + p.housing_gap
         else:
             # Default positions
-            motor_a_z = 36.0
-            motor_b_z = -36.0
-            motor_y = 0.0
-            plate_x = 48.0  # Default position
-
-        # Calculate plate size to cover both motors with margin
-        motor_radius = motor.body_diameter / 2 + p.motor_body_clearance
-        margin = p.mounting_hole_inset + p.mounting_hole_diameter / 2 + 5.0
-
-        # Y extent: center on motor Y with margin for mounting holes
-        plate_width_y = motor.body_diameter + 2 * margin
-        plate_center_y = motor_y
-
-        # Z extent: from motor B bottom to motor A top
-        z_min = motor_b_z - motor_radius - margin
-        z_max = motor_a_z + motor_radius + margin
-        plate_height_z = z_max - z_min
-        plate_center_z = (z_min + z_max) / 2
-
-        # Mounting hole positions (corners of plate)
-        hole_inset = p.mounting_hole_inset
-        mounting_holes = [
-            (plate_center_y - plate_width_y / 2 + hole_inset, z_min + hole_inset),
-            (plate_center_y + plate_width_y / 2 - hole_inset, z_min + hole_inset),
-            (plate_center_y - plate_width_y / 2 + hole_inset, z_max - hole_inset),
-            (plate_center_y + plate_width_y / 2 - hole_inset, z_max - hole_inset),
-        ]
+            motor_y, motor_a_z, motor_b_z, plate_x = _DEFAULT_POSITIONS
 
-        self._layout = RightMotorMountLayout(
-            plate_x=plate_x,
-            plate_center_y=plate_center_y,
-            plate_center_z=plate_center_z,
-            plate_width_y=plate_width_y,
-            plate_height_z=plate_height_z,
-            motor_a_y=motor_y,
-            motor_a_z=motor_a_z,
-            motor_b_y=motor_y,
-            motor_b_z=motor_b_z,
-            mounting_hole_positions=mounting_holes,
-        )
+        self._layout = _build_layout(p, motor_y, motor_a_z, motor_b_z, plate_x)
 
         return self._layout
 
@@ -144,65 +228,89 @@ class RightMotorMountGenerator:
             Solid representing the pocket (to be subtracted from plate)
         """
         p = self.params
-        motor = p.motor
 
         # Motor body pocket dimensions
-        body_radius = motor.body_diameter / 2 + p.motor_body_clearance
-        flat_half_width = motor.flat_width / 2 + p.motor_body_clearance
-
-        # Create D-shaped pocket by starting with cylinder and cutting flats
-        # First create the full cylinder
-        cylinder = (
-            cq.Workplane('YZ')
-            .center(motor_y, motor_z)
-            .circle(body_radius)
-            .extrude(pocket_depth)
-        )
-
-        # Cut off material outside the flat region
-        # We keep only the region where |Y - motor_y| <= flat_half_width
-        # Cut a box on the -Y side beyond the flat
-        cut_box_minus_y = (
-            cq.Workplane('YZ')
-            .center(motor_y - flat_half_width - body_radius, motor_z)
-            .rect(body_radius * 2, body_radius * 2)
-            .extrude(pocket_depth)
-        )
-        # Cut a box on the +Y side beyond the flat
-        cut_box_plus_y = (
-            cq.Workplane('YZ')
-            .center(motor_y + flat_half_width + body_radius, motor_z)
-            .rect(body_radius * 2, body_radius * 2)
-            .extrude(pocket_depth)
-        )
-
-        pocket = cylinder.cut(cut_box_minus_y).cut(cut_box_plus_y)
+        body_radius = p.body_radius
+        flat_half_width = p.flat_half_width
+
+        # Build the D-shaped outline directly: two flat sides at
+        # Y = motor_y ± flat_half_width joined by arcs of the body circle,
+        # extruded in +X. No booleans needed.
+        if flat_half_width < body_radius:
+            arc_half_height = math.sqrt(body_radius ** 2 - flat_half_width ** 2)
+            y_lo, y_hi = motor_y - flat_half_width, motor_y + flat_half_width
+            z_lo, z_hi = motor_z - arc_half_height, motor_z + arc_half_height
+            outline = cq.Wire.assembleEdges([
+                cq.Edge.makeLine(cq.Vector(0, y_hi, z_lo), cq.Vector(0, y_hi, z_hi)),
+                cq.Edge.makeThreePointArc(
+                    cq.Vector(0, y_hi, z_hi),
+                    cq.Vector(0, motor_y, motor_z + body_radius),
+                    cq.Vector(0, y_lo, z_hi),
+                ),
+                cq.Edge.makeLine(cq.Vector(0, y_lo, z_hi), cq.Vector(0, y_lo, z_lo)),
+                cq.Edge.makeThreePointArc(
+                    cq.Vector(0, y_lo, z_lo),
+                    cq.Vector(0, motor_y, motor_z - body_radius),
+                    cq.Vector(0, y_hi, z_lo),
+                ),
+            ])
+            body = cq.Solid.extrudeLinear(outline, [], cq.Vector(pocket_depth, 0, 0))
+        else:
+            # Flats wider than the body: plain cylindrical pocket
+            body = cq.Solid.makeCylinder(
+                body_radius, pocket_depth,
+                pnt=cq.Vector(0, motor_y, motor_z),
+                dir=cq.Vector(1, 0, 0),
+            )
+        pocket = cq.Workplane(obj=body)
 
         # Add tab slots if enabled
         if p.include_tab_slots:
-            tab_width = motor.tab_width + p.tab_clearance * 2
-            tab_length = motor.tab_length + p.tab_clearance
-            tab_thickness = motor.tab_thickness + p.tab_clearance * 2
+            tab_width, tab_length, tab_thickness = p.tab_slot_dims
 
             # Tab slots extend from the flat sides in ±Y direction
-            # Positioned at the motor center Z
-            for y_dir in [-1, 1]:
-                tab_slot = (
+            # Positioned at the motor center Z. If the span between the flats
+            # lies inside the body pocket, both slots are drawn as one strip
+            # across it; otherwise each slot is added separately.
+            strip_fits = (
+                flat_half_width < body_radius
+                and tab_thickness <= pocket_depth
+                and tab_width / 2 <= math.sqrt(body_radius ** 2 - flat_half_width ** 2)
+            )
+            if strip_fits:
+                tab_slots = [
+                    cq.Workplane('YZ')
+                    .center(motor_y, motor_z)
+                    .rect(2 * (flat_half_width + tab_length), tab_width)
+                    .extrude(tab_thickness)
+                ]
+            else:
+                tab_slots = [
                     cq.Workplane('YZ')
                     .center(motor_y + y_dir * (flat_half_width + tab_length / 2), motor_z)
                     .rect(tab_length, tab_width)
                     .extrude(tab_thickness)
-                )
+                    for y_dir in (-1, 1)
+                ]
+            for tab_slot in tab_slots:
                 pocket = pocket.union(tab_slot)
 
         return pocket
 
-    def generate(self) -> cq.Workplane:
+    def generate(self, parallel: bool = False) -> cq.Workplane:
         """Generate the right motor mount plate.
 
         Creates a plate with D-shaped motor pockets that prevent rotation,
         including tab slots for motor mounting tabs and screw holes.
 
+        Args:
+            parallel: If True, build the motor pocket and the self-supporting
+                structure in worker processes (falls back to in-process if
+                that fails). The hole cutters stay in-process: they are
+                drilled straight into the plate. Only worthwhile when the
+                worker start-up cost is amortized (e.g. large batch
+                generation).
+
         Returns:
             CadQuery Workplane with the motor mount plate.
         """
@@ -210,82 +318,100 @@ class RightMotorMountGenerator:
         p = self.params
         motor = p.motor
 
-        # Create the base plate (in YZ plane, extruded in -X)
-        plate = (
-            cq.Workplane('YZ')
-            .center(layout.plate_center_y, layout.plate_center_z)
-            .rect(layout.plate_width_y, layout.plate_height_z)
-            .extrude(-p.plate_thickness)  # Extrude in -X (away from housing)
-            .translate((layout.plate_x, 0, 0))
-        )
-
-        # Cut motor pockets (D-shaped with tab slots)
         motor_positions = [
             (layout.motor_a_y, layout.motor_a_z),
             (layout.motor_b_y, layout.motor_b_z),
         ]
 
-        for motor_y, motor_z in motor_positions:
-            pocket = self._create_motor_pocket(motor_y, motor_z, p.motor_pocket_depth)
-            # Position pocket at +X face of plate (inner face toward housing)
-            pocket_positioned = pocket.translate((layout.plate_x, 0, 0))
-            plate = plate.cut(pocket_positioned)
+        # Independent sub-solids (pocket, support structure). Both motors use
+        # the same pocket geometry, so it is built once at the origin and
+        # translated into place for each motor.
+        built = None
+        if parallel:
+            jobs = [(_motor_pocket_brep, (p, 0.0, 0.0, p.motor_pocket_depth))]
+            if p.self_supporting:
+                jobs.append((_support_structure_brep, (p, layout)))
+            built = build_in_processes(jobs)
+
+        if built is not None:
+            template_pocket = cq.Workplane(obj=built[0])
+            support = cq.Workplane(obj=built[1]) if p.self_supporting else None
+        else:
+            template_pocket = self._create_motor_pocket(0.0, 0.0, p.motor_pocket_depth)
+            support = self._create_support_structure(layout) if p.self_supporting else None
 
-        # Add shaft through-holes
-        shaft_hole_diameter = motor.shaft_diameter + 2 * p.shaft_clearance
-        motor_positions_relative = [
-            (layout.motor_a_y - layout.plate_center_y, layout.motor_a_z - layout.plate_center_z),
-            (layout.motor_b_y - layout.plate_center_y, layout.motor_b_z - layout.plate_center_z),
+        # Create the base plate (in YZ plane, extruded in -X)
+        # Built as a single box primitive spanning X from plate_x - plate_thickness
+        # to plate_x. The workplane sits on the +X face, centered on the plate,
+        # so the holes below are drilled from it directly (plate-relative
+        # positions) without re-selecting the face after each cut.
+        plate_solid = cq.Solid.makeBox(
+            p.plate_thickness, layout.plate_width_y, layout.plate_height_z,
+            pnt=cq.Vector(
+                layout.plate_x - p.plate_thickness,
+                layout.plate_center_y - layout.plate_width_y / 2,
+                layout.plate_center_z - layout.plate_height_z / 2,
+            ),
+        )
+        front_plane = cq.Plane(
+            origin=(layout.plate_x, layout.plate_center_y, layout.plate_center_z),
+            xDir=(0, 1, 0),
+            normal=(1, 0, 0),
+        )
+
+        # Cut motor pockets (D-shaped with tab slots), positioned at the +X
+        # face of the plate (inner face toward housing). Both pockets go into
+        # a single boolean so OCC can process the tools together.
+        pockets_positioned = [
+            template_pocket.val().translate(cq.Vector(layout.plate_x, motor_y, motor_z))
+            for motor_y, motor_z in motor_positions
         ]
+        plate = cq.Workplane(
+            front_plane, obj=plate_solid.cut(*pockets_positioned).clean()
+        )
+
+        # Hole positions relative to the plate center, computed for all
+        # motors at once
+        plate_center = np.array([layout.plate_center_y, layout.plate_center_z])
+        motor_centers = np.array(motor_positions) - plate_center
+
+        # Add shaft through-holes
+        shaft_hole_diameter = p.shaft_hole_diameter
         plate = (
             plate
-            .faces(">X")
-            .workplane()
-            .pushPoints(motor_positions_relative)
+            .pushPoints(motor_centers.tolist())
             .hole(shaft_hole_diameter)
         )
 
         # Add tab screw holes (through-holes for M2 screws to secure motor tabs)
         if p.include_tab_slots:
-            flat_half_width = motor.flat_width / 2 + p.motor_body_clearance
-            tab_screw_offset = flat_half_width + motor.tab_hole_offset
-
-            tab_screw_positions = []
-            for motor_y, motor_z in motor_positions:
-                # Two screw holes per motor (one on each side)
-                tab_screw_positions.append(
-                    (motor_y - tab_screw_offset - layout.plate_center_y,
-                     motor_z - layout.plate_center_z)
-                )
-                tab_screw_positions.append(
-                    (motor_y + tab_screw_offset - layout.plate_center_y,
-                     motor_z - layout.plate_center_z)
-                )
+            tab_screw_offset = p.flat_half_width + motor.tab_hole_offset
+
+            # Two screw holes per motor (one on each side), broadcast over motors
+            side_offsets = np.array([[-tab_screw_offset, 0.0], [tab_screw_offset, 0.0]])
+            tab_screw_positions = (
+                motor_centers[:, np.newaxis, :] + side_offsets[np.newaxis, :, :]
+            ).reshape(-1, 2)
 
             plate = (
                 plate
-                .faces(">X")
-                .workplane()
-                .pushPoints(tab_screw_positions)
+                .pushPoints(tab_screw_positions.tolist())
                 .hole(p.tab_screw_diameter)
             )
 
         # Add mounting holes (through-holes for bolts to attach to housing)
-        mounting_hole_points = [
-            (y - layout.plate_center_y, z - layout.plate_center_z)
-            for y, z in layout.mounting_hole_positions
-        ]
+        mounting_hole_points = np.array(layout.mounting_hole_positions) - plate_center
         plate = (
             plate
-            .faces(">X")
-            .workplane()
-            .pushPoints(mounting_hole_points)
+            .pushPoints(mounting_hole_points.tolist())
             .hole(p.mounting_hole_diameter)
         )
 
         # Add self-supporting structure if enabled
-        if p.self_supporting:
-            plate = self._add_self_supporting_structure(plate, layout)
+        if support is not None:
+            # Support only touches the plate at planar faces, so the faster
+            # glue mode of the fuse applies
+            plate = plate.union(support, glue=True)
 
         return plate
 
@@ -310,6 +436,21 @@ class RightMotorMountGenerator:
         Returns:
             Combined plate with self-supporting structure
         """
+        # The support only touches the plate at planar faces
+        return plate.union(self._create_support_structure(layout), glue=True)
+
+    def _create_support_structure(
+        self,
+        layout: RightMotorMountLayout,
+    ) -> cq.Workplane:
+        """Create the base plate, gussets, and feet (without the vertical plate).
+
+        Args:
+            layout: Layout information
+
+        Returns:
+            Base structure to be unioned with the vertical plate
+        """
         p = self.params
 
         # Calculate dimensions
@@ -320,7 +461,6 @@ class RightMotorMountGenerator:
         # Base plate extends in +X direction (away from housing, toward motor side)
         base_x_start = vertical_plate_front_x              # Attached to vertical plate
         base_x_end = base_x_start + p.base_depth           # Extends in +X (away from housing)
-        base_center_x = (base_x_start + base_x_end) / 2
 
         # Base Y extent matches vertical plate
         base_y_min = layout.plate_center_y - layout.plate_width_y / 2
@@ -332,13 +472,12 @@ class RightMotorMountGenerator:
         base_z_min = layout.plate_center_z - layout.plate_height_z / 2
         base_z_top = base_z_min + p.base_thickness
 
-        # Create base plate (horizontal, in XY plane)
-        base = (
-            cq.Workplane('XY')
-            .center(base_center_x, base_center_y)
-            .rect(p.base_depth, base_width_y)
-            .extrude(p.base_thickness)
-            .translate((0, 0, base_z_min))
+        # Create base plate (horizontal, in XY plane).
+        # Solids are built directly in world coordinates to skip the
+        # Workplane sketch/extrude/translate round-trips.
+        base = cq.Solid.makeBox(
+            p.base_depth, base_width_y, p.base_thickness,
+            pnt=cq.Vector(base_x_start, base_y_min, base_z_min),
         )
 
         # Add triangular gussets for rigidity
@@ -355,20 +494,25 @@ class RightMotorMountGenerator:
         else:
             gusset_y_positions = [base_center_y]
 
+        gussets = []
         for gusset_y in gusset_y_positions:
-            # Create triangular gusset profile (extends in +X direction from vertical plate)
-            gusset = (
-                cq.Workplane('XZ')
-                .moveTo(base_x_start, base_z_top)  # At vertical plate base
-                .lineTo(base_x_start + gusset_depth, base_z_top)  # Extends in +X
-                .lineTo(base_x_start, base_z_top + gusset_height)  # Up the vertical plate
-                .close()
-                .extrude(p.gusset_thickness)
-                .translate((0, gusset_y - p.gusset_thickness / 2, 0))
+            # Triangular gusset profile in the XZ plane, extruded in -Y
+            # (matches the XZ workplane normal)
+            profile_y = gusset_y - p.gusset_thickness / 2
+            profile = cq.Wire.makePolygon(
+                [
+                    cq.Vector(base_x_start, profile_y, base_z_top),  # At vertical plate base
+                    cq.Vector(base_x_start + gusset_depth, profile_y, base_z_top),  # Extends in +X
+                    cq.Vector(base_x_start, profile_y, base_z_top + gusset_height),  # Up the vertical plate
+                ],
+                close=True,
+            )
+            gussets.append(
+                cq.Solid.extrudeLinear(profile, [], cq.Vector(0, -p.gusset_thickness, 0))
             )
-            base = base.union(gusset)
 
         # Add feet for stability (cylindrical standoffs under base)
+        feet = []
         if p.foot_height > 0:
             foot_inset = p.foot_diameter / 2 + 3.0  # Inset from edges
             foot_positions = [
@@ -379,17 +523,15 @@ class RightMotorMountGenerator:
             ]
 
             for foot_x, foot_y in foot_positions:
-                foot = (
-                    cq.Workplane('XY')
-                    .center(foot_x, foot_y)
-                    .circle(p.foot_diameter / 2)
-                    .extrude(-p.foot_height)
-                    .translate((0, 0, base_z_min))
+                feet.append(
+                    cq.Solid.makeCylinder(
+                        p.foot_diameter / 2, p.foot_height,
+                        pnt=cq.Vector(foot_x, foot_y, base_z_min - p.foot_height),
+                        dir=cq.Vector(0, 0, 1),
+                    )
                 )
-                base = base.union(foot)
 
-        # Union base structure with vertical plate
-        return plate.union(base)
+        return cq.Workplane(obj=base.fuse(*gussets, *feet, glue=True).clean())
 
     def get_layout(self) -> RightMotorMountLayout:
         """Get the calculated layout."""
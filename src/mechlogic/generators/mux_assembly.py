@@ -6,16 +6,77 @@ Creates the complete 2-to-1 multiplexer assembly including:
 - All axles
 """
 
+import functools
+from typing import Optional
+
 import cadquery as cq
 
 from ..models.spec import LogicElementSpec
 from ..models.geometry import PartPlacement, PartMetadata, PartType
-from .layout import LayoutCalculator
+from .layout import LayoutCalculator, SelectorLayout
 from .mux_selector import MuxSelectorGenerator
 from .lower_housing import LowerHousingGenerator, LowerHousingParams
 from .bevel_lever_with_upper_housing import BevelLeverWithUpperHousingGenerator
 
 
+@functools.lru_cache(maxsize=32)
+def _cached_shape(
+    kind: str,
+    spec: LogicElementSpec,
+    origin: tuple[float, float, float],
+    include_flexure: bool,
+    lower_housing_y_max: float,
+):
+    """Build an upper housing BRep once per (kind, spec, origin).
+
+    Returns (generator, shape). The generator is returned alongside the shape
+    because it carries the wall positions and flexure parameters computed
+    while building the housing. Cached shapes are shared between assemblies,
+    so callers must not modify them in place.
+
+    Args:
+        kind: "upper_housing" or "split_upper_housing".
+        spec: The logic element specification.
+        origin: The upper housing origin (at clutch axis).
+        include_flexure: Whether the housing carries the serpentine flexure.
+        lower_housing_y_max: Top Y of the lower housing (for wall extension).
+    """
+    # Option A: Only left/right walls extend down (no L-shaped front/back)
+    housing_gen = BevelLeverWithUpperHousingGenerator(
+        include_axles=True,  # Bevel axles with D-flat profiles and grooves
+        include_flexure=include_flexure,
+        extend_to_lower_housing=True,
+        lower_housing_y_max=lower_housing_y_max,
+        l_shaped_front_back=False,  # Option A: simpler wall extension
+    )
+
+    if kind == "upper_housing":
+        shape = housing_gen._generate_upper_housing(spec, origin)
+    elif kind == "split_upper_housing":
+        shape = housing_gen.generate_split_upper_housing(spec, origin)
+    else:
+        raise ValueError(f"Unknown cached shape kind: {kind}")
+
+    return housing_gen, shape
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_flexure(
+    housing_kind: str,
+    spec: LogicElementSpec,
+    origin: tuple[float, float, float],
+    lower_housing_y_max: float,
+) -> cq.Workplane:
+    """Build the serpentine flexure once per cached upper housing.
+
+    Uses the flexure generator set up while building the housing of
+    housing_kind, so no other housing variant is built. Like the housing
+    shapes, the result is shared and must not be modified in place.
+    """
+    housing_gen, _ = _cached_shape(housing_kind, spec, origin, True, lower_housing_y_max)
+    return housing_gen._flexure_gen.generate()
+
+
 class MuxAssemblyGenerator:
     """Generator for a complete mux assembly with housing.
 
@@ -60,13 +121,21 @@ class MuxAssemblyGenerator:
         """
         assy = cq.Assembly()
 
+        # Derived once per generate() and shared by both housing branches
+        lower_params = LowerHousingParams.from_spec(spec)
+        selector_layout = LayoutCalculator.calculate_selector_layout(spec)
+
         # Add lower housing first (so it's behind the mechanism visually)
         if self.include_housing:
-            self._add_lower_housing(assy, spec)
+            self._add_lower_housing(assy, spec, lower_params=lower_params)
 
         # Add upper housing (bevel lever housing with flexure)
         if self.include_upper_housing:
-            self._add_upper_housing(assy, spec)
+            self._add_upper_housing(
+                assy, spec,
+                lower_params=lower_params,
+                selector_layout=selector_layout,
+            )
 
         # Add the complete mux selector mechanism
         # Bevel axles come from BevelLeverWithUpperHousingGenerator (properly sized
@@ -76,9 +145,16 @@ class MuxAssemblyGenerator:
 
         return assy
 
-    def _add_lower_housing(self, assy: cq.Assembly, spec: LogicElementSpec) -> None:
+    def _add_lower_housing(
+        self,
+        assy: cq.Assembly,
+        spec: LogicElementSpec,
+        lower_params: Optional[LowerHousingParams] = None,
+    ) -> None:
         """Add lower housing enclosure to the assembly."""
-        housing_gen = LowerHousingGenerator(spec=spec)
+        if lower_params is None:
+            lower_params = LowerHousingParams.from_spec(spec)
+        housing_gen = LowerHousingGenerator(params=lower_params)
 
         if self.split_housing:
             left_half, right_half = housing_gen.generate_split()
@@ -96,41 +172,48 @@ class MuxAssemblyGenerator:
                 assy.add(side_plates, name="housing_side_plates", color=cq.Color(0.75, 0.75, 0.75))
                 assy.add(front_back_walls, name="housing_front_back", color=cq.Color(0.5, 0.5, 0.5))
 
-    def _add_upper_housing(self, assy: cq.Assembly, spec: LogicElementSpec) -> None:
+    def _add_upper_housing(
+        self,
+        assy: cq.Assembly,
+        spec: LogicElementSpec,
+        lower_params: Optional[LowerHousingParams] = None,
+        selector_layout: Optional[SelectorLayout] = None,
+    ) -> None:
         """Add upper housing (bevel lever housing with flexure) to the assembly.
 
         The upper housing is positioned at the clutch center, same as the bevel lever.
         The walls are extended down to connect with the lower housing.
         """
-        selector_layout = LayoutCalculator.calculate_selector_layout(spec)
+        if selector_layout is None:
+            selector_layout = LayoutCalculator.calculate_selector_layout(spec)
 
         # Upper housing origin is at clutch center (same as bevel lever)
         origin = (selector_layout.clutch_center, 0, 0)
 
         # Get lower housing Y position for wall extension
-        from .lower_housing import LowerHousingParams
-        lower_params = LowerHousingParams.from_spec(spec)
+        if lower_params is None:
+            lower_params = LowerHousingParams.from_spec(spec)
         lower_housing_y_max = lower_params.plate_y_max  # Top of lower housing
 
-        # Generate upper housing with or without flexure, with wall extension
-        # Option A: Only left/right walls extend down (no L-shaped front/back)
-        upper_housing_gen = BevelLeverWithUpperHousingGenerator(
-            include_axles=True,  # Bevel axles with D-flat profiles and grooves
-            include_flexure=self.include_flexure,
-            extend_to_lower_housing=True,
-            lower_housing_y_max=lower_housing_y_max,
-            l_shaped_front_back=False,  # Option A: simpler wall extension
-        )
-
+        # Generate upper housing with or without flexure, with wall extension.
+        # Shapes are memoized per (spec, origin) so repeated generate() calls
+        # reuse the same BReps.
+        housing_kind = "split_upper_housing" if self.split_housing else "upper_housing"
         if self.split_housing:
-            left_half, right_half = upper_housing_gen.generate_split_upper_housing(spec, origin)
+            upper_housing_gen, (left_half, right_half) = _cached_shape(
+                housing_kind, spec, origin,
+                self.include_flexure, lower_housing_y_max,
+            )
             alpha = 0.3 if self.housing_transparent else 1.0
             assy.add(left_half, name="upper_housing_left",
                      color=cq.Color(0.7, 0.7, 0.7, alpha))
             assy.add(right_half, name="upper_housing_right",
                      color=cq.Color(0.6, 0.6, 0.6, alpha))
         else:
-            upper_housing = upper_housing_gen._generate_upper_housing(spec, origin)
+            upper_housing_gen, upper_housing = _cached_shape(
+                housing_kind, spec, origin,
+                self.include_flexure, lower_housing_y_max,
+            )
             if self.housing_transparent:
                 assy.add(upper_housing, name="upper_housing", color=cq.Color(0.7, 0.7, 0.7, 0.3))
             else:
@@ -141,20 +224,24 @@ class MuxAssemblyGenerator:
 
         # Add flexure if enabled
         if self.include_flexure:
-            self._add_flexure(assy, spec, upper_housing_gen, origin)
+            self._add_flexure(
+                assy, spec, upper_housing_gen, housing_kind, origin, lower_housing_y_max
+            )
 
     def _add_flexure(
         self,
         assy: cq.Assembly,
         spec: LogicElementSpec,
         housing_gen: BevelLeverWithUpperHousingGenerator,
+        housing_kind: str,
         origin: tuple[float, float, float],
+        lower_housing_y_max: float,
     ) -> None:
         """Add serpentine flexure to the assembly."""
         wp = housing_gen._wall_positions
 
-        # Generate flexure
-        flexure_shape = housing_gen._flexure_gen.generate()
+        # Generate flexure (memoized alongside the upper housing in use)
+        flexure_shape = _cached_flexure(housing_kind, spec, origin, lower_housing_y_max)
 
         # Position flexure on inside of left wall (must match _add_flexure in BevelLeverWithUpperHousingGenerator)
         left_wall_x = wp['left_wall_x']
@@ -8,14 +8,90 @@ Creates a complete 2-to-1 mux mechanism with:
 - Dog clutch selects between A and B for the output
 """
 
+import functools
+import operator
+import os
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Iterable, Optional
+
 import cadquery as cq
 
 from ..models.spec import LogicElementSpec
 from ..models.geometry import PartPlacement, PartMetadata, PartType
-from .gear_spur import SpurGearGenerator
+from .gear_spur import make_spur_gear_along_x
 from .layout import LayoutCalculator, MuxLayout
 from .combined_selector import CombinedSelectorGenerator
-from .axle_profile import make_d_flat_axle, add_groove_to_axle
+from .axle_profile import make_grooved_d_flat_axle
+
+
+# Component colors, shared across calls
+_COLOR_INPUT_GEAR_A = cq.Color("lightsteelblue")
+_COLOR_INPUT_GEAR_B = cq.Color("sandybrown")
+_COLOR_AXLE = cq.Color("gray")
+
+# Per-side input gear/axle table: (gear id, (x, z) getter on MuxLayout, color)
+_INPUT_SIDES = (
+    ("a", operator.attrgetter("input_a_x", "input_a_z"), _COLOR_INPUT_GEAR_A),
+    ("b", operator.attrgetter("input_b_x", "input_b_z"), _COLOR_INPUT_GEAR_B),
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _metadata_for(spec: LogicElementSpec) -> PartMetadata:
+    """Build the (shared) mux selector metadata for a spec."""
+    layout = LayoutCalculator.calculate_mux_layout(spec)
+
+    return PartMetadata(
+        part_id="mux_selector",
+        part_type=PartType.GEAR_A,
+        name="2-to-1 Mux Selector Mechanism",
+        material="PLA",
+        count=1,
+        dimensions=MappingProxyType({
+            "gear_a_x": layout.selector.gear_a_center,
+            "gear_b_x": layout.selector.gear_b_center,
+            "input_a_z": layout.input_a_z,
+            "input_b_z": layout.input_b_z,
+            "pivot_y": layout.pivot_y,
+        }),
+        notes="Assembly: 2-input mux with bevel gear selector control",
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _prototype_assembly(
+    spec: LogicElementSpec,
+    include_axles: bool,
+    include_bevel_axles: bool,
+) -> cq.Assembly:
+    """Build the mux mechanism once at the origin for instancing.
+
+    Shared by every add_instance() call with the same spec and options;
+    cq.Assembly.add copies the tree but not the shapes, so the cached
+    prototype is never modified.
+    """
+    gen = MuxSelectorGenerator(
+        include_axles=include_axles,
+        include_bevel_axles=include_bevel_axles,
+    )
+    assy = cq.Assembly(name="mux_selector")
+    gen.add_to_assembly(assy, spec, origin=(0, 0, 0))
+    return assy
+
+
+def _add_prototype(
+    assy: cq.Assembly,
+    prototype: cq.Assembly,
+    placement: PartPlacement,
+    name_prefix: str,
+) -> None:
+    """Add a placed instance of a prototype mux assembly."""
+    assy.add(
+        prototype,
+        name=f"{name_prefix}mux_selector",
+        loc=placement.to_location(),
+    )
 
 
 class MuxSelectorGenerator:
@@ -75,50 +151,77 @@ class MuxSelectorGenerator:
             include_axles=self.include_axles,
             include_bevel_axles=self.include_bevel_axles,
         )
-        combined_gen.add_to_assembly(assy, spec, origin=origin, name_prefix=name_prefix)
-
-        # Add input gears
-        self._add_input_gears(assy, spec, layout, origin, name_prefix)
+        combined_gen.add_to_assembly(
+            assy, spec,
+            origin=origin,
+            name_prefix=name_prefix,
+            layout=layout.selector,
+        )
 
-        if self.include_axles:
-            self._add_input_axles(assy, spec, layout, origin, name_prefix)
+        # Add input gears and their axles
+        self._add_inputs(assy, spec, layout, origin, name_prefix)
 
-    def _add_input_gears(
+    def add_instance(
         self,
         assy: cq.Assembly,
         spec: LogicElementSpec,
-        layout: MuxLayout,
-        origin: tuple[float, float, float],
-        name_prefix: str,
+        placement: PartPlacement,
+        name_prefix: str = "",
     ) -> None:
-        """Add input gears to the assembly."""
-        ox, oy, oz = origin
+        """Add a shared instance of the mux mechanism as a sub-assembly.
 
-        gear_a_gen = SpurGearGenerator(gear_id="a", include_dog_teeth=False)
-        gear_b_gen = SpurGearGenerator(gear_id="b", include_dog_teeth=False)
-        placement_generic = PartPlacement(part_type=PartType.GEAR_A, part_id="input")
-
-        # Input gear A (above Gear A)
-        input_gear_a = gear_a_gen.generate(spec, placement_generic)
-        input_a_rotated = input_gear_a.rotate((0, 0, 0), (0, 1, 0), 90)
-        assy.add(
-            input_a_rotated,
-            name=f"{name_prefix}input_gear_a" if name_prefix else "input_gear_a",
-            loc=cq.Location(cq.Vector(ox + layout.input_a_x, oy, oz + layout.input_a_z)),
-            color=cq.Color("lightsteelblue"),
-        )
+        Unlike add_to_assembly, repeated calls with the same spec reuse one
+        prototype's shapes and only differ by location, which is much cheaper
+        when composing many identical mux elements. The components are nested
+        under a child assembly named ``{name_prefix}mux_selector``.
 
-        # Input gear B (below Gear B)
-        input_gear_b = gear_b_gen.generate(spec, placement_generic)
-        input_b_rotated = input_gear_b.rotate((0, 0, 0), (0, 1, 0), 90)
-        assy.add(
-            input_b_rotated,
-            name=f"{name_prefix}input_gear_b" if name_prefix else "input_gear_b",
-            loc=cq.Location(cq.Vector(ox + layout.input_b_x, oy, oz + layout.input_b_z)),
-            color=cq.Color("sandybrown"),
-        )
+        Args:
+            assy: The assembly to add the instance to.
+            spec: The logic element specification.
+            placement: Where to place this instance.
+            name_prefix: Optional prefix for the sub-assembly name.
+        """
+        prototype = _prototype_assembly(spec, self.include_axles, self.include_bevel_axles)
+        _add_prototype(assy, prototype, placement, name_prefix)
+
+    def build_many(
+        self,
+        specs_and_placements: Iterable[tuple[LogicElementSpec, PartPlacement]],
+        max_workers: Optional[int] = None,
+    ) -> cq.Assembly:
+        """Build an assembly of many mux instances.
+
+        The prototype for each distinct spec is built once on a thread pool,
+        then every placement is added as an instance of its prototype.
+        Instances are named after their placement's part_id.
+
+        Args:
+            specs_and_placements: (spec, placement) pairs, one per mux.
+            max_workers: Thread pool size. Defaults to the CPU count.
+
+        Returns:
+            CadQuery Assembly containing one sub-assembly per placement.
+        """
+        items = list(specs_and_placements)
 
-    def _add_input_axles(
+        # One build per distinct spec, so no two threads race on the same
+        # prototype cache entry. Keep the results rather than re-reading the
+        # (bounded) prototype cache, which may have evicted them by now.
+        unique_specs = list(dict.fromkeys(spec for spec, _ in items))
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            prototypes = dict(zip(unique_specs, pool.map(
+                lambda spec: _prototype_assembly(
+                    spec, self.include_axles, self.include_bevel_axles
+                ),
+                unique_specs,
+            )))
+
+        assy = cq.Assembly()
+        for spec, placement in items:
+            _add_prototype(assy, prototypes[spec], placement, f"{placement.part_id}_")
+        return assy
+
+    def _add_inputs(
         self,
         assy: cq.Assembly,
         spec: LogicElementSpec,
@@ -126,11 +229,13 @@ class MuxSelectorGenerator:
         origin: tuple[float, float, float],
         name_prefix: str,
     ) -> None:
-        """Add input axles (D-flat profile) to the assembly.
+        """Add input gears and (optionally) their D-flat axles to the assembly.
 
-        Housing walls provide axial retention for gears.
+        Input gear A sits above Gear A and input gear B below Gear B. Housing
+        walls provide axial retention for the gears.
         """
         ox, oy, oz = origin
+        prefix = name_prefix or ""
         shaft_diameter = layout.selector.shaft_diameter
         d_flat_depth = spec.tolerances.d_flat_depth
 
@@ -140,23 +245,35 @@ class MuxSelectorGenerator:
         face_width = spec.geometry.gear_face_width
         groove_offset = 1.0  # mm from gear edge
 
-        for axle_name, axle_z, gear_x in [
-            ("input_a_axle", layout.input_a_z, layout.input_a_x),
-            ("input_b_axle", layout.input_b_z, layout.input_b_x),
-        ]:
-            axle = make_d_flat_axle(shaft_diameter, axle_length, d_flat_depth)
-            axle = axle.translate((axle_start, oy, oz + axle_z))
+        axles = []
+        for side, input_position, color in _INPUT_SIDES:
+            gear_x, gear_z = input_position(layout)
+            assy.add(
+                make_spur_gear_along_x(spec, side, include_dog_teeth=False),
+                name=prefix + "input_gear_" + side,
+                loc=cq.Location(cq.Vector(ox + gear_x, oy, oz + gear_z)),
+                color=color,
+            )
+
+            if not self.include_axles:
+                continue
 
             # Add C-clip retention grooves flanking the gear
             groove_x_left = ox + gear_x - groove_offset
             groove_x_right = ox + gear_x + face_width + groove_offset
-            axle = add_groove_to_axle(axle, groove_x_left, shaft_diameter)
-            axle = add_groove_to_axle(axle, groove_x_right, shaft_diameter)
+            axle = make_grooved_d_flat_axle(
+                shaft_diameter, axle_length, d_flat_depth,
+                (groove_x_left - axle_start, groove_x_right - axle_start),
+            )
+            axles.append(axle.val().moved(cq.Location(cq.Vector(axle_start, oy, oz + gear_z))))
 
+        # Both input axles share a color and are always present together, so
+        # they go into the assembly as one compound
+        if axles:
             assy.add(
-                axle,
-                name=f"{name_prefix}{axle_name}" if name_prefix else axle_name,
-                color=cq.Color("gray")
+                cq.Compound.makeCompound(axles),
+                name=prefix + "input_axles",
+                color=_COLOR_AXLE,
             )
 
     def get_layout(self, spec: LogicElementSpec) -> MuxLayout:
@@ -164,21 +281,9 @@ class MuxSelectorGenerator:
         return LayoutCalculator.calculate_mux_layout(spec)
 
     def get_metadata(self, spec: LogicElementSpec) -> PartMetadata:
-        """Get metadata for this assembly."""
-        layout = LayoutCalculator.calculate_mux_layout(spec)
+        """Get metadata for this assembly.
 
-        return PartMetadata(
-            part_id="mux_selector",
-            part_type=PartType.GEAR_A,
-            name="2-to-1 Mux Selector Mechanism",
-            material="PLA",
-            count=1,
-            dimensions={
-                "gear_a_x": layout.selector.gear_a_center,
-                "gear_b_x": layout.selector.gear_b_center,
-                "input_a_z": layout.input_a_z,
-                "input_b_z": layout.input_b_z,
-                "pivot_y": layout.pivot_y,
-            },
-            notes="Assembly: 2-input mux with bevel gear selector control",
-        )
+        The result is memoized per spec and shared between callers; its
+        dimensions mapping is read-only.
+        """
+        return _metadata_for(spec)
@@ -10,14 +10,28 @@ housing walls) to allow external gears to be mounted on the input axles
 for linking purposes (e.g., X and inverse-X).
 """
 
+from typing import Optional
+
 import cadquery as cq
 
 from ..models.spec import LogicElementSpec
 from ..models.geometry import PartPlacement, PartMetadata, PartType
-from .gear_spur import SpurGearGenerator
+from .gear_spur import make_spur_gear_along_x
 from .dog_clutch import DogClutchGenerator
 from .layout import LayoutCalculator, SelectorLayout, HousingLayout
-from .axle_profile import make_d_flat_axle, add_groove_to_axle
+from .axle_profile import make_grooved_d_flat_axle
+
+
+# Component colors and placements, shared across calls
+_COLOR_GEAR_A = cq.Color("steelblue")
+_COLOR_GEAR_B = cq.Color("darkorange")
+_COLOR_CLUTCH = cq.Color("forestgreen")
+_COLOR_CLUTCH_SLEEVE = cq.Color("limegreen")
+_COLOR_AXLE = cq.Color("gray")
+_PLACEMENT_DOG_CLUTCH = PartPlacement(part_type=PartType.DOG_CLUTCH, part_id="dog_clutch")
+
+# Turns a part built along Z onto the X axis (same as rotating 90° about Y)
+_ROT_Y90 = cq.Location(cq.Vector(0, 0, 0), cq.Vector(0, 1, 0), 90)
 
 
 class SelectorMechanismGenerator:
@@ -30,6 +44,9 @@ class SelectorMechanismGenerator:
     to add the shift control mechanism (bevel gears + lever).
     """
 
+    # DogClutchGenerator is stateless, so one instance serves every call
+    _clutch_gen = DogClutchGenerator()
+
     def __init__(self, include_axle: bool = True, two_piece_clutch: bool = True):
         """Initialize the selector mechanism generator.
 
@@ -61,6 +78,7 @@ class SelectorMechanismGenerator:
         spec: LogicElementSpec,
         origin: tuple[float, float, float] = (0, 0, 0),
         name_prefix: str = "",
+        layout: Optional[SelectorLayout] = None,
     ) -> None:
         """Add selector mechanism to an existing assembly.
 
@@ -71,65 +89,61 @@ class SelectorMechanismGenerator:
             spec: The logic element specification.
             origin: The (x, y, z) origin point for the selector axis.
             name_prefix: Optional prefix for component names.
+            layout: Precomputed selector layout for ``spec``. Computed here if
+                not given.
         """
-        layout = LayoutCalculator.calculate_selector_layout(spec)
+        if layout is None:
+            layout = LayoutCalculator.calculate_selector_layout(spec)
         ox, oy, oz = origin
+        prefix = name_prefix or ""
 
-        # Generate components
-        gear_a_gen = SpurGearGenerator(gear_id="a")
-        gear_b_gen = SpurGearGenerator(gear_id="b")
-        clutch_gen = DogClutchGenerator()
-
-        placement_a = PartPlacement(part_type=PartType.GEAR_A, part_id="gear_a")
-        placement_b = PartPlacement(part_type=PartType.GEAR_B, part_id="gear_b")
-
-        gear_a = gear_a_gen.generate(spec, placement_a)
-        gear_b = gear_b_gen.generate(spec, placement_b)
+        # Generate components (gears are memoized per spec)
+        clutch_gen = self._clutch_gen
 
         # Add components (rotated so axle is along X)
-        gear_a_rotated = gear_a.rotate((0, 0, 0), (0, 1, 0), 90)
+        gear_a_rotated = make_spur_gear_along_x(spec, "a")
         assy.add(
             gear_a_rotated,
-            name=f"{name_prefix}gear_a" if name_prefix else "gear_a",
+            name=prefix + "gear_a",
             loc=cq.Location(cq.Vector(ox + layout.gear_a_center, oy, oz)),
-            color=cq.Color("steelblue"),
+            color=_COLOR_GEAR_A,
         )
 
-        gear_b_rotated = gear_b.rotate((0, 0, 0), (0, 1, 0), 90)
+        gear_b_rotated = make_spur_gear_along_x(spec, "b")
         assy.add(
             gear_b_rotated,
-            name=f"{name_prefix}gear_b" if name_prefix else "gear_b",
+            name=prefix + "gear_b",
             loc=cq.Location(cq.Vector(ox + layout.gear_b_center, oy, oz)),
-            color=cq.Color("darkorange"),
+            color=_COLOR_GEAR_B,
         )
 
+        # Clutch parts are built along Z; the 90° turn onto the X axis is
+        # folded into their location instead of rotating the shapes
+        clutch_loc = cq.Location(cq.Vector(ox + layout.clutch_center, oy, oz)) * _ROT_Y90
+
         if self.two_piece_clutch:
             inner_core = clutch_gen.generate_inner_core(spec)
-            inner_core_rotated = inner_core.rotate((0, 0, 0), (0, 1, 0), 90)
             assy.add(
-                inner_core_rotated,
-                name=f"{name_prefix}clutch_inner_core" if name_prefix else "clutch_inner_core",
-                loc=cq.Location(cq.Vector(ox + layout.clutch_center, oy, oz)),
-                color=cq.Color("forestgreen"),
+                inner_core,
+                name=prefix + "clutch_inner_core",
+                loc=clutch_loc,
+                color=_COLOR_CLUTCH,
             )
 
             outer_sleeve = clutch_gen.generate_outer_sleeve(spec)
-            outer_sleeve_rotated = outer_sleeve.rotate((0, 0, 0), (0, 1, 0), 90)
             assy.add(
-                outer_sleeve_rotated,
-                name=f"{name_prefix}clutch_outer_sleeve" if name_prefix else "clutch_outer_sleeve",
-                loc=cq.Location(cq.Vector(ox + layout.clutch_center, oy, oz)),
-                color=cq.Color("limegreen"),
+                outer_sleeve,
+                name=prefix + "clutch_outer_sleeve",
+                loc=clutch_loc,
+                color=_COLOR_CLUTCH_SLEEVE,
             )
         else:
-            placement_clutch = PartPlacement(part_type=PartType.DOG_CLUTCH, part_id="dog_clutch")
-            dog_clutch = clutch_gen.generate(spec, placement_clutch)
-            clutch_rotated = dog_clutch.rotate((0, 0, 0), (0, 1, 0), 90)
+            dog_clutch = clutch_gen.generate(spec, _PLACEMENT_DOG_CLUTCH)
             assy.add(
-                clutch_rotated,
-                name=f"{name_prefix}dog_clutch" if name_prefix else "dog_clutch",
-                loc=cq.Location(cq.Vector(ox + layout.clutch_center, oy, oz)),
-                color=cq.Color("forestgreen"),
+                dog_clutch,
+                name=prefix + "dog_clutch",
+                loc=clutch_loc,
+                color=_COLOR_CLUTCH,
             )
 
         if self.include_axle:
@@ -149,6 +163,7 @@ class SelectorMechanismGenerator:
         C-clips provide axial retention for gears.
         """
         ox, oy, oz = origin
+        prefix = name_prefix or ""
         d_flat_depth = spec.tolerances.d_flat_depth
         shaft_dia = layout.shaft_diameter
 
@@ -157,19 +172,14 @@ class SelectorMechanismGenerator:
         axle_start = ox + housing_layout.axle_start_x
         axle_length = housing_layout.axle_length
 
-        # Build D-flat axle along X
-        axle = make_d_flat_axle(shaft_dia, axle_length, d_flat_depth)
-        axle = axle.translate((axle_start, oy, oz))
-
         # Add C-clip retention grooves outboard of each gear
         # Groove just left of gear A
         groove_offset = 1.0  # mm from gear edge
         groove_x_left = ox + layout.gear_a_center - groove_offset
-        axle = add_groove_to_axle(axle, groove_x_left, shaft_dia)
 
         # Groove just right of gear B
         groove_x_right = ox + layout.gear_b_center + layout.face_width + groove_offset
-        axle = add_groove_to_axle(axle, groove_x_right, shaft_dia)
+        groove_positions = [groove_x_left, groove_x_right]
 
         if self.two_piece_clutch:
             # C-clip grooves flanking the inner core for axial retention
@@ -177,13 +187,19 @@ class SelectorMechanismGenerator:
             core_length = clutch_width + 2 * layout.engagement_travel + 2.0
             core_groove_left = ox + layout.clutch_center - core_length / 2 - 1.0
             core_groove_right = ox + layout.clutch_center + core_length / 2 + 1.0
-            axle = add_groove_to_axle(axle, core_groove_left, shaft_dia)
-            axle = add_groove_to_axle(axle, core_groove_right, shaft_dia)
+            groove_positions += [core_groove_left, core_groove_right]
+
+        # Build D-flat axle along X (memoized, placed by Location)
+        axle = make_grooved_d_flat_axle(
+            shaft_dia, axle_length, d_flat_depth,
+            tuple(x - axle_start for x in groove_positions),
+        )
 
         assy.add(
             axle,
-            name=f"{name_prefix}selector_axle" if name_prefix else "selector_axle",
-            color=cq.Color("gray")
+            name=prefix + "selector_axle",
+            loc=cq.Location(cq.Vector(axle_start, oy, oz)),
+            color=_COLOR_AXLE
         )
 
     def get_layout(self, spec: LogicElementSpec) -> SelectorLayout:
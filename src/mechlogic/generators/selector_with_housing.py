@@ -4,6 +4,8 @@ Creates the selector mechanism (gears + clutch) with lower housing plates,
 without the bevel lever control system.
 """
 
+import functools
+
 import cadquery as cq
 
 from ..models.spec import LogicElementSpec
@@ -11,6 +13,42 @@ from ..models.geometry import PartPlacement, PartMetadata, PartType
 from .layout import LayoutCalculator
 from .selector_mechanism import SelectorMechanismGenerator
 from .lower_housing import LowerHousingGenerator
+from .base import build_in_processes, shape_to_brep
+
+
+_HOUSING_PARTS = ("left_plate", "right_plate", "front_wall", "back_wall")
+
+
+def _housing_part_brep(spec: LogicElementSpec, part: str) -> bytes:
+    """Build one lower housing part in a worker process."""
+    housing_gen = LowerHousingGenerator(spec=spec)
+    return shape_to_brep(getattr(housing_gen, f"generate_{part}")().val())
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_housing(spec: LogicElementSpec, parallel: bool = False) -> tuple[cq.Compound, cq.Compound]:
+    """Build the lower housing for a spec, grouped by color.
+
+    Returns (sides, walls): the left/right plates and the front/back walls,
+    each as one compound. Memoized per spec; the compounds are shared
+    between assemblies and must not be modified.
+
+    With ``parallel`` the four parts are built in separate processes and
+    sent back as BREP; if that fails (e.g. no process support) they are
+    built in this process instead.
+    """
+    parts = None
+    if parallel:
+        parts = build_in_processes([(_housing_part_brep, (spec, part)) for part in _HOUSING_PARTS])
+
+    if parts is None:
+        housing_gen = LowerHousingGenerator(spec=spec)
+        parts = [getattr(housing_gen, f"generate_{part}")().val() for part in _HOUSING_PARTS]
+
+    left_plate, right_plate, front_wall, back_wall = parts
+    sides = cq.Compound.makeCompound([left_plate, right_plate])
+    walls = cq.Compound.makeCompound([front_wall, back_wall])
+    return sides, walls
 
 
 class SelectorWithHousingGenerator:
@@ -27,15 +65,19 @@ class SelectorWithHousingGenerator:
         self,
         include_axle: bool = True,
         housing_transparent: bool = False,
+        parallel: bool = False,
     ):
         """Initialize the generator.
 
         Args:
             include_axle: Whether to include the selector axle.
             housing_transparent: Whether to render housing semi-transparent.
+            parallel: If True, build the four housing parts in worker
+                processes (falls back to in-process if that fails).
         """
         self.include_axle = include_axle
         self.housing_transparent = housing_transparent
+        self.parallel = parallel
 
     def generate(self, spec: LogicElementSpec, placement: PartPlacement) -> cq.Assembly:
         """Generate selector mechanism with housing assembly.
@@ -80,13 +122,9 @@ class SelectorWithHousingGenerator:
         name_prefix: str,
     ) -> None:
         """Add lower housing enclosure to the assembly."""
-        housing_gen = LowerHousingGenerator(spec=spec)
-
-        # Generate all housing parts
-        left_plate = housing_gen.generate_left_plate()
-        right_plate = housing_gen.generate_right_plate()
-        front_wall = housing_gen.generate_front_wall()
-        back_wall = housing_gen.generate_back_wall()
+        # Housing parts are shared between calls with the same spec, and
+        # same-colored parts are added as one body each
+        sides, walls = _cached_housing(spec, self.parallel)
 
         if self.housing_transparent:
             side_color = cq.Color(0.7, 0.7, 0.7, 0.3)
@@ -96,23 +134,13 @@ class SelectorWithHousingGenerator:
             wall_color = cq.Color(0.6, 0.6, 0.6)
 
         assy.add(
-            left_plate,
-            name=f"{name_prefix}housing_left" if name_prefix else "housing_left",
-            color=side_color,
-        )
-        assy.add(
-            right_plate,
-            name=f"{name_prefix}housing_right" if name_prefix else "housing_right",
+            sides,
+            name=name_prefix + "housing_sides",
             color=side_color,
         )
         assy.add(
-            front_wall,
-            name=f"{name_prefix}housing_front" if name_prefix else "housing_front",
-            color=wall_color,
-        )
-        assy.add(
-            back_wall,
-            name=f"{name_prefix}housing_back" if name_prefix else "housing_back",
+            walls,
+            name=name_prefix + "housing_walls",
             color=wall_color,
         )
 
@@ -1,6 +1,7 @@
 """Serpentine/meander flexure generator for compliant Y-axis motion."""
 
 import cadquery as cq
+import numpy as np
 from dataclasses import dataclass
 
 
@@ -65,72 +66,45 @@ class SerpentineFlexureGenerator:
     def __init__(self, params: SerpentineFlexureParams = None):
         self.params = params or SerpentineFlexureParams()
 
-    def _create_serpentine_beam(self, start_x: float, direction: int) -> cq.Workplane:
-        """Create one serpentine beam structure.
+    def _serpentine_centers(
+        self, start_x: float, direction: int
+    ) -> tuple[list[tuple[float, float]], list[tuple[float, float]]]:
+        """Compute the segment centers of one serpentine beam.
 
         Args:
             start_x: X position where beam connects to platform
             direction: +1 for right side, -1 for left side
 
         Returns:
-            CadQuery workplane with the serpentine beam
+            (vertical segment centers, fold connector centers)
         """
         p = self.params
 
-        # Calculate dimensions
         fold_pitch = p.beam_width + p.beam_spacing  # Distance between fold centers
-        total_folds_width = (p.num_folds - 1) * fold_pitch + p.beam_width
-
-        # Start building the serpentine path
-        # We'll create it as a series of rectangles and unions
-
-        segments = []
-
-        # Current position tracking
-        x = start_x
-        y_bottom = -p.segment_length / 2
-        y_top = p.segment_length / 2
-
-        for i in range(p.num_folds):
-            # Vertical segment
-            seg = (
-                cq.Workplane("XY")
-                .center(x, 0)
-                .rect(p.beam_width, p.segment_length)
-                .extrude(p.thickness)
-            )
-            segments.append(seg)
-
-            # Horizontal connector to next fold (except for last fold)
-            if i < p.num_folds - 1:
-                # Alternate between top and bottom connections
-                if i % 2 == 0:
-                    # Connect at top
-                    conn_y = y_top - p.beam_width / 2
-                else:
-                    # Connect at bottom
-                    conn_y = y_bottom + p.beam_width / 2
-
-                conn_x = x + direction * fold_pitch / 2
-                conn = (
-                    cq.Workplane("XY")
-                    .center(conn_x, conn_y)
-                    .rect(fold_pitch, p.beam_width)
-                    .extrude(p.thickness)
-                )
-                segments.append(conn)
-
-                x += direction * fold_pitch
-
-        # Union all segments
-        result = segments[0]
-        for seg in segments[1:]:
-            result = result.union(seg)
-
-        return result
+        step = direction * fold_pitch
+        half_step = step / 2
+
+        # Connectors alternate between the top (even folds) and bottom (odd
+        # folds) of the segments
+        conn_y_top = p.segment_length / 2 - p.beam_width / 2
+        conn_y_bottom = -p.segment_length / 2 + p.beam_width / 2
+
+        num_connectors = p.num_folds - 1
+        vertical_centers = [(start_x + i * step, 0) for i in range(p.num_folds)]
+        connector_centers = [
+            (start_x + i * step + half_step, conn_y_top if i % 2 == 0 else conn_y_bottom)
+            for i in range(num_connectors)
+        ]
+
+        return vertical_centers, connector_centers
 
     def generate(self) -> cq.Workplane:
-        """Generate the serpentine flexure."""
+        """Generate the serpentine flexure.
+
+        The whole footprint (frame, platform, beams, connectors and holes) is
+        built as one 2D sketch and extruded once, so no solid booleans are
+        needed.
+        """
         p = self.params
 
         # Calculate overall dimensions
@@ -145,63 +119,33 @@ class SerpentineFlexureGenerator:
         outer_width = inner_width + 2 * p.frame_thickness
         outer_height = inner_height + 2 * p.frame_thickness
 
-        # Create outer frame
-        frame = (
-            cq.Workplane("XY")
+        # Outer frame with the inner cavity removed, plus the floating platform
+        sketch = (
+            cq.Sketch()
             .rect(outer_width, outer_height)
-            .extrude(p.thickness)
-        )
-
-        # Cut out inner cavity
-        frame = (
-            frame
-            .faces(">Z")
-            .workplane()
-            .rect(inner_width, inner_height)
-            .cutThruAll()
-        )
-
-        # Create the floating platform
-        platform = (
-            cq.Workplane("XY")
+            .rect(inner_width, inner_height, mode="s")
             .rect(p.platform_width, p.platform_height)
-            .extrude(p.thickness)
-        )
-
-        # Cut axle hole
-        platform = (
-            platform
-            .faces(">Z")
-            .workplane()
-            .hole(p.axle_diameter + p.axle_clearance * 2)
         )
 
-        # Create serpentine beams on each side
+        # Serpentine beams on each side
         # Right side beam (connects platform +X edge to frame +X edge)
         right_start_x = p.platform_width / 2 + p.beam_spacing + p.beam_width / 2
-        right_beam = self._create_serpentine_beam(right_start_x, direction=1)
-
         # Left side beam (connects platform -X edge to frame -X edge)
         left_start_x = -(p.platform_width / 2 + p.beam_spacing + p.beam_width / 2)
-        left_beam = self._create_serpentine_beam(left_start_x, direction=-1)
+
+        for start_x, direction in ((right_start_x, 1), (left_start_x, -1)):
+            vertical_centers, connector_centers = self._serpentine_centers(start_x, direction)
+            sketch = sketch.push(vertical_centers).rect(p.beam_width, p.segment_length)
+            if connector_centers:
+                sketch = sketch.push(connector_centers).rect(fold_pitch, p.beam_width)
 
         # Connection from platform to first fold of each beam
-        # Right connection
         right_conn_x = (p.platform_width / 2 + right_start_x) / 2
-        right_conn = (
-            cq.Workplane("XY")
-            .center(right_conn_x, 0)
-            .rect(p.beam_spacing + p.beam_width, p.beam_width)
-            .extrude(p.thickness)
-        )
-
-        # Left connection
         left_conn_x = -(p.platform_width / 2 - left_start_x) / 2
-        left_conn = (
-            cq.Workplane("XY")
-            .center(left_conn_x, 0)
+        sketch = (
+            sketch
+            .push([(right_conn_x, 0), (left_conn_x, 0)])
             .rect(p.beam_spacing + p.beam_width, p.beam_width)
-            .extrude(p.thickness)
         )
 
         # Connection from last fold to frame
@@ -219,32 +163,26 @@ class SerpentineFlexureGenerator:
 
         right_frame_conn_x = (last_fold_x_right + frame_inner_x) / 2
         right_frame_conn_width = frame_inner_x - last_fold_x_right + p.beam_width
-        right_frame_conn = (
-            cq.Workplane("XY")
-            .center(right_frame_conn_x, conn_y)
+        sketch = (
+            sketch
+            .push([(right_frame_conn_x, conn_y)])
             .rect(right_frame_conn_width, p.beam_width)
-            .extrude(p.thickness)
         )
 
         # Left side frame connection
         last_fold_x_left = left_start_x - (p.num_folds - 1) * fold_pitch
         left_frame_conn_x = (last_fold_x_left + (-frame_inner_x)) / 2
         left_frame_conn_width = abs(-frame_inner_x - last_fold_x_left) + p.beam_width
-        left_frame_conn = (
-            cq.Workplane("XY")
-            .center(left_frame_conn_x, conn_y)
+        sketch = (
+            sketch
+            .push([(left_frame_conn_x, conn_y)])
             .rect(left_frame_conn_width, p.beam_width)
-            .extrude(p.thickness)
         )
 
-        # Union all parts
-        result = frame.union(platform)
-        result = result.union(right_beam).union(left_beam)
-        result = result.union(right_conn).union(left_conn)
-        result = result.union(right_frame_conn).union(left_frame_conn)
+        # Axle hole through the platform
+        sketch = sketch.reset().circle(p.axle_diameter / 2 + p.axle_clearance, mode="s")
 
         # Add mounting holes if requested
-        # Cut holes explicitly using cylinders to avoid face selection issues after unions
         if p.include_mounting_holes:
             hole_x = outer_width / 2 - p.frame_thickness / 2
             hole_y = outer_height / 2 - p.frame_thickness / 2
@@ -255,37 +193,16 @@ class SerpentineFlexureGenerator:
                 (hole_x, -hole_y),
                 (-hole_x, -hole_y),
             ]
+            sketch = sketch.push(hole_positions).circle(p.mounting_hole_diameter / 2, mode="s")
 
-            for hx, hy in hole_positions:
-                hole_cutter = (
-                    cq.Workplane("XY")
-                    .center(hx, hy)
-                    .circle(p.mounting_hole_diameter / 2)
-                    .extrude(p.thickness + 2)
-                    .translate((0, 0, -1))
-                )
-                result = result.cut(hole_cutter)
-
-        return result
+        return cq.Workplane("XY").placeSketch(sketch.clean()).extrude(p.thickness)
 
     def get_effective_beam_length(self) -> float:
         """Calculate the effective beam length of the serpentine path."""
         p = self.params
-
-        # Each side has:
-        # - num_folds vertical segments of length segment_length
-        # - (num_folds - 1) horizontal connectors of length fold_pitch
-        fold_pitch = p.beam_width + p.beam_spacing
-
-        vertical_length = p.num_folds * p.segment_length
-        horizontal_length = (p.num_folds - 1) * fold_pitch
-
-        # Total for one side
-        one_side = vertical_length + horizontal_length
-
-        # Both sides in parallel, so effective length is one_side
-        # (parallel springs: 1/k_total = 1/k1 + 1/k2, but same length so k_total = 2*k)
-        return one_side
+        return float(effective_beam_length_np(
+            p.num_folds, p.segment_length, p.beam_width, p.beam_spacing
+        ))
 
     def get_stiffness_estimate(self, elastic_modulus: float = 2000.0) -> float:
         """Estimate Y-axis stiffness.
@@ -297,17 +214,9 @@ class SerpentineFlexureGenerator:
             Estimated stiffness in N/mm
         """
         p = self.params
-
-        # Effective beam length from serpentine path
-        L = self.get_effective_beam_length()
-        w = p.beam_width
-        t = p.thickness
-
-        # Two serpentine beams in parallel
-        # Simplified cantilever model: k = E * w * t^3 / L^3
-        k = 2 * elastic_modulus * w * (t ** 3) / (L ** 3)
-
-        return k
+        return float(stiffness_np(
+            self.get_effective_beam_length(), p.beam_width, p.thickness, elastic_modulus
+        ))
 
     def get_max_deflection_estimate(self, yield_strength: float = 50.0) -> float:
         """Estimate maximum safe deflection.
@@ -319,19 +228,48 @@ class SerpentineFlexureGenerator:
             Estimated max deflection in mm
         """
         p = self.params
+        return float(max_deflection_np(
+            self.get_effective_beam_length(), p.thickness, yield_strength
+        ))
 
-        L = self.get_effective_beam_length()
-        t = p.thickness
-        E = 2000.0  # Assume PLA
 
-        # delta_max ≈ sigma_y * L^2 / (6 * E * t)
-        delta_max = yield_strength * (L ** 2) / (6 * E * t)
+# Closed-form estimates, written against NumPy arrays so design sweeps can
+# broadcast parameter grids through them; the generator methods above call
+# them with scalars.
 
-        return delta_max
+def effective_beam_length_np(num_folds, segment_length, beam_width, beam_spacing) -> np.ndarray:
+    """Effective serpentine beam length (mm) for (broadcast) parameters.
 
+    Each side has num_folds vertical segments of length segment_length and
+    (num_folds - 1) horizontal connectors of length fold_pitch. Both sides
+    act in parallel with the same length, so the effective length is one
+    side's path length.
+    """
+    num_folds = np.asarray(num_folds)
+    fold_pitch = np.asarray(beam_width) + np.asarray(beam_spacing)
+    return num_folds * np.asarray(segment_length) + (num_folds - 1) * fold_pitch
 
-def generate_test_serpentine():
-    """Generate a test serpentine flexure."""
+
+def stiffness_np(effective_length, beam_width, thickness, elastic_modulus=2000.0) -> np.ndarray:
+    """Y-axis stiffness (N/mm) of two serpentine beams in parallel.
+
+    Simplified cantilever model per beam: k = E * w * t^3 / L^3.
+    """
+    L = np.asarray(effective_length)
+    return 2 * np.asarray(elastic_modulus) * np.asarray(beam_width) * np.asarray(thickness) ** 3 / L ** 3
+
+
+def max_deflection_np(effective_length, thickness, yield_strength=50.0, elastic_modulus=2000.0) -> np.ndarray:
+    """Maximum safe deflection (mm): delta_max ≈ sigma_y * L^2 / (6 * E * t).
+
+    The elastic modulus defaults to PLA.
+    """
+    L = np.asarray(effective_length)
+    return np.asarray(yield_strength) * L ** 2 / (6 * np.asarray(elastic_modulus) * np.asarray(thickness))
+
+
+def _test_serpentine_generator() -> SerpentineFlexureGenerator:
+    """Generator with the reference test flexure parameters."""
     params = SerpentineFlexureParams(
         axle_diameter=6.0,
         platform_width=14.0,
@@ -343,11 +281,18 @@ def generate_test_serpentine():
         frame_thickness=5.0,
         thickness=5.0,
     )
+    return SerpentineFlexureGenerator(params)
 
-    gen = SerpentineFlexureGenerator(params)
-    flexure = gen.generate()
 
-    # Print estimates
+def generate_test_serpentine():
+    """Generate a test serpentine flexure (no console output)."""
+    return _test_serpentine_generator().generate()
+
+
+def _print_stats(gen: SerpentineFlexureGenerator) -> None:
+    """Print size and compliance estimates for a flexure generator."""
+    params = gen.params
+
     L_eff = gen.get_effective_beam_length()
     k = gen.get_stiffness_estimate()
     d = gen.get_max_deflection_estimate()
@@ -360,7 +305,7 @@ def generate_test_serpentine():
     outer_width = inner_width + 2 * params.frame_thickness
     outer_height = inner_height + 2 * params.frame_thickness
 
-    print(f"Serpentine Flexure:")
+    print("Serpentine Flexure:")
     print(f"  Folds per side: {params.num_folds}")
     print(f"  Segment length: {params.segment_length} mm")
     print(f"  Beam width: {params.beam_width} mm")
@@ -369,10 +314,10 @@ def generate_test_serpentine():
     print(f"  Estimated stiffness: {k:.2f} N/mm")
     print(f"  Estimated max deflection: {d:.2f} mm")
 
-    return flexure
-
 
 if __name__ == "__main__":
-    flexure = generate_test_serpentine()
-    cq.exporters.export(flexure, "serpentine_flexure.step")
+    gen = _test_serpentine_generator()
+    flexure = gen.generate()
+    _print_stats(gen)
+    flexure.val().exportStep("serpentine_flexure.step")
     print("\nExported: serpentine_flexure.step")
@@ -7,12 +7,24 @@ Creates a stepped-bore rigid coupling that connects:
 The coupling has set screw holes for securing to both shafts.
 """
 
+import functools
+
 import cadquery as cq
 from typing import Optional
 
 from .motor_mount_params import ShaftCouplingParams
 
 
+# Half turn about Y: swaps which end of the coupling faces +X
+_FLIP_Y180 = cq.Location(cq.Vector(0, 0, 0), cq.Vector(0, 1, 0), 180)
+
+
+@functools.lru_cache(maxsize=16)
+def _coupling_shape(params: ShaftCouplingParams) -> cq.Workplane:
+    """Build the coupling for a parameter set (memoized)."""
+    return ShaftCouplingGenerator(params)._build()
+
+
 class ShaftCouplingGenerator:
     """Generator for motor-to-mechanism shaft couplings."""
 
@@ -32,62 +44,89 @@ class ShaftCouplingGenerator:
         - Mechanism bore on +X side (larger diameter)
         - Center at origin
 
+        The geometry is memoized per parameter set and shared between
+        generators; transform it (translate/rotate) rather than modifying it.
+
         Returns:
             CadQuery Workplane with the coupling geometry.
         """
+        return _coupling_shape(self.params)
+
+    def _build(self) -> cq.Workplane:
+        """Build the coupling geometry (uncached)."""
         p = self.params
 
-        # Create outer cylinder
+        # Revolve the stepped half-profile (X along the axis, Y as radius)
+        # about X; both bores come out of the revolve with no boolean cuts
         coupling = (
-            cq.Workplane('YZ')
-            .circle(p.outer_diameter / 2)
-            .extrude(p.length)
-            .translate((-p.length / 2, 0, 0))
+            cq.Workplane('XY')
+            .polyline(self._half_profile())
+            .close()
+            .revolve(360, (0, 0, 0), (1, 0, 0))
         )
 
-        # Cut motor shaft bore (-X side)
-        motor_bore = (
-            cq.Workplane('YZ')
-            .circle(p.motor_shaft_diameter / 2)
-            .extrude(p.motor_bore_length)
-            .translate((-p.length / 2, 0, 0))
-        )
-        coupling = coupling.cut(motor_bore)
-
-        # Cut mechanism shaft bore (+X side)
-        mechanism_bore = (
-            cq.Workplane('YZ')
-            .circle(p.mechanism_shaft_diameter / 2)
-            .extrude(p.mechanism_bore_length)
-            .translate((p.length / 2 - p.mechanism_bore_length, 0, 0))
-        )
-        coupling = coupling.cut(mechanism_bore)
-
-        # Add set screw holes by cutting cylinders from outside (+Y direction toward center)
-        # Motor side set screw
+        # Drill both set screw holes in one pass, from the +Y surface toward
+        # the axis (plane normal is +Y, so a negative cutBlind goes inward)
         motor_set_screw_x = -p.length / 2 + p.motor_bore_length / 2
-        motor_set_screw = (
-            cq.Workplane('XZ')
-            .center(motor_set_screw_x, 0)
-            .circle(p.set_screw_diameter / 2)
-            .extrude(-p.set_screw_depth)  # Extrude in -Y direction (toward center)
-            .translate((0, p.outer_diameter / 2, 0))
-        )
-        coupling = coupling.cut(motor_set_screw)
-
-        # Mechanism side set screw
         mechanism_set_screw_x = p.length / 2 - p.mechanism_bore_length / 2
-        mechanism_set_screw = (
-            cq.Workplane('XZ')
-            .center(mechanism_set_screw_x, 0)
+        set_screw_plane = cq.Plane(
+            origin=(0, p.outer_diameter / 2, 0), xDir=(1, 0, 0), normal=(0, 1, 0)
+        )
+        coupling = (
+            coupling
+            .copyWorkplane(cq.Workplane(set_screw_plane))
+            .pushPoints([(motor_set_screw_x, 0), (mechanism_set_screw_x, 0)])
             .circle(p.set_screw_diameter / 2)
-            .extrude(-p.set_screw_depth)  # Extrude in -Y direction (toward center)
-            .translate((0, p.outer_diameter / 2, 0))
+            .cutBlind(-p.set_screw_depth)
         )
-        coupling = coupling.cut(mechanism_set_screw)
 
         return coupling
 
+    def _half_profile(self) -> list[tuple[float, float]]:
+        """Closed (x, r) outline of the coupling wall, for revolving about X.
+
+        The bore radius at any X is the larger of the bores open there (0
+        where neither reaches), so overlapping or separated bores both work.
+        Steps between bores are vertical edges of the outline.
+        """
+        p = self.params
+        x_left = -p.length / 2
+        x_right = p.length / 2
+        motor_end = x_left + p.motor_bore_length
+        mechanism_start = x_right - p.mechanism_bore_length
+        motor_r = p.motor_shaft_diameter / 2
+        mechanism_r = p.mechanism_shaft_diameter / 2
+
+        def bore_radius(x: float) -> float:
+            r = 0.0
+            if x < motor_end:
+                r = max(r, motor_r)
+            if x > mechanism_start:
+                r = max(r, mechanism_r)
+            return r
+
+        # Bore radius is constant between consecutive breakpoints; merge
+        # neighbouring spans with the same radius
+        breaks = sorted({
+            x_left, x_right,
+            min(max(motor_end, x_left), x_right),
+            min(max(mechanism_start, x_left), x_right),
+        })
+        spans = []
+        for x0, x1 in zip(breaks, breaks[1:]):
+            r = bore_radius((x0 + x1) / 2)
+            if spans and spans[-1][2] == r:
+                spans[-1][1] = x1
+            else:
+                spans.append([x0, x1, r])
+
+        points = []
+        for x0, x1, r in spans:
+            points += [(x0, r), (x1, r)]
+
+        outer_r = p.outer_diameter / 2
+        return points + [(x_right, outer_r), (x_left, outer_r)]
+
     def generate_positioned(
         self,
         position: tuple[float, float, float],
@@ -103,14 +142,32 @@ class ShaftCouplingGenerator:
         Returns:
             Positioned coupling geometry.
         """
-        coupling = self.generate()
+        coupling = self.generate().val()
+        return cq.Workplane(obj=coupling.moved(self.get_location(position, motor_side)))
+
+    def get_location(
+        self,
+        position: tuple[float, float, float],
+        motor_side: str = '-X',
+    ) -> cq.Location:
+        """Get the placement of a coupling as a Location.
+
+        Pass this as ``loc=`` when adding ``generate()`` to an assembly so
+        the shared coupling shape is placed without transforming it.
+
+        Args:
+            position: (x, y, z) position for coupling center.
+            motor_side: Which side the motor connects to.
+                        '-X' means motor on left, '+X' means motor on right.
 
+        Returns:
+            Location placing the origin-centered coupling.
+        """
+        loc = cq.Location(cq.Vector(*position))
         if motor_side == '+X':
             # Flip coupling so motor bore is on +X side
-            coupling = coupling.rotate((0, 0, 0), (0, 1, 0), 180)
-
-        coupling = coupling.translate(position)
-        return coupling
+            loc = loc * _FLIP_Y180
+        return loc
 
     def get_dimensions(self) -> dict:
         """Get coupling dimensions for reference.
@@ -6,7 +6,7 @@ import cadquery as cq
 from ..models.spec import LogicElementSpec
 from ..models.geometry import PartPlacement, PartMetadata, PartType
 from .layout import LayoutCalculator
-from .axle_profile import make_d_flat_cylinder
+from .axle_profile import make_d_flat_wire
 
 
 class ShiftLeverGenerator:
@@ -55,65 +55,61 @@ class ShiftLeverGenerator:
         # Build lever in YZ plane, extrude in X direction
         # Y is vertical (up), Z is horizontal, X is thickness (into groove)
 
-        # Pivot block - built in YZ plane with thickness in X (like arm and fork)
-        pivot_block = (
-            cq.Workplane("YZ")
-            .rect(pivot_block_size, arm_width)
-            .extrude(pivot_block_thickness)
-            .translate((-pivot_block_thickness / 2, pivot_y, 0))
-        )
-
-        # Cut D-flat pivot hole along Z axis
+        # Pivot block with its D-flat pivot hole (along Z) sketched into the
+        # profile: block outline in XY minus the D, extruded along Z. This
+        # gives the same block as the YZ-plane build without a separate cut.
         d_flat_depth = spec.tolerances.d_flat_depth
-        pivot_hole_length = pivot_block_size * 2
-        d_flat_hole = (
-            make_d_flat_cylinder(pivot_hole_dia, pivot_hole_length, d_flat_depth)
-            .translate((0, pivot_y, 0))
+        pivot_sketch = (
+            cq.Sketch()
+            .push([(0, pivot_y)])
+            .rect(pivot_block_thickness, pivot_block_size)
+            .face(make_d_flat_wire(pivot_hole_dia, d_flat_depth), mode="s")
+        )
+        pivot_block = (
+            cq.Workplane("XY")
+            .placeSketch(pivot_sketch)
+            .extrude(arm_width / 2, both=True)
+            .val()
         )
-        pivot_block = pivot_block.cut(d_flat_hole)
 
         # Arm - connects pivot block to fork area
         arm_top = pivot_y - pivot_block_size / 2
         arm_bottom = fork_outer_radius + 1  # Just above the fork
         arm_height = arm_top - arm_bottom
 
-        arm = (
-            cq.Workplane("YZ")
-            .rect(arm_height, arm_width)
-            .extrude(lever_thickness)
-            .translate((-lever_thickness / 2, arm_bottom + arm_height / 2, 0))
+        arm = cq.Solid.makeBox(
+            lever_thickness, arm_height, arm_width,
+            cq.Vector(-lever_thickness / 2, arm_bottom, -arm_width / 2),
         )
 
         # Fork - C-shape opening downward (-Y direction)
-        # Create as a ring in YZ plane
-        fork_ring = (
-            cq.Workplane("YZ")
+        # Ring in YZ plane (local x = Y, local y = Z) with the -Y half removed,
+        # all in one sketch
+        fork_sketch = (
+            cq.Sketch()
             .circle(fork_outer_radius)
-            .circle(fork_inner_radius)
-            .extrude(lever_thickness)
-            .translate((-lever_thickness / 2, 0, 0))
+            .circle(fork_inner_radius, mode="s")
+            .push([(-fork_outer_radius, 0)])
+            .rect(fork_outer_radius * 2, fork_outer_radius * 3, mode="s")
         )
-
-        # Cut away bottom half to create opening facing -Y
-        cut_box = (
-            cq.Workplane("YZ")
-            .rect(fork_outer_radius * 2, fork_outer_radius * 3)
-            .extrude(lever_thickness * 2)
-            .translate((-lever_thickness, -fork_outer_radius, 0))
+        fork = (
+            cq.Workplane("YZ", origin=(-lever_thickness / 2, 0, 0))
+            .placeSketch(fork_sketch)
+            .extrude(lever_thickness)
+            .val()
         )
-        fork = fork_ring.cut(cut_box)
 
         # Connecting piece between arm bottom and fork top
         connector_height = arm_bottom - fork_outer_radius
-        connector = (
-            cq.Workplane("YZ")
-            .rect(connector_height + 1, arm_width)  # Overlap for solid union
-            .extrude(lever_thickness)
-            .translate((-lever_thickness / 2, fork_outer_radius + connector_height / 2 - 0.5, 0))
+        connector = cq.Solid.makeBox(
+            lever_thickness, connector_height + 1, arm_width,  # Overlap for solid union
+            cq.Vector(-lever_thickness / 2, fork_outer_radius - 1, -arm_width / 2),
         )
 
-        # Combine all parts
-        lever = pivot_block.union(arm).union(connector).union(fork)
+        # Combine all parts in a single fuse (kept as one solid for the
+        # clearance checks and STEP export); parts stay plain shapes until
+        # the final Workplane wrap for callers
+        lever = cq.Workplane(obj=pivot_block.fuse(arm, connector, fork).clean())
 
         return lever
 
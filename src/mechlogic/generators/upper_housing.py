@@ -8,11 +8,20 @@ The driving bevel axle uses YZ plates (like lower housing).
 The driven bevel axle uses XY plates.
 """
 
-import cadquery as cq
+import dataclasses
+import functools
+import hashlib
+import os
+import shutil
 from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+import cadquery as cq
 
 
-@dataclass
+@dataclass(frozen=True)
 class UpperHousingParams:
     """Parameters for the upper housing plates."""
 
@@ -38,34 +47,36 @@ class UpperHousingParams:
     plate_thickness: float = 6.0
     plate_size: float = 14.0  # Width/height of plates around holes
 
-    # Optional explicit plate positions (if None, calculated from gear positions)
+    # Optional explicit plate positions (if None, calculated from gear positions).
+    # The derived positions below are cached on first access; cached_property
+    # writes straight to the instance __dict__, so it works on a frozen dataclass.
     _driving_left_plate_x: float = None
     _driving_right_plate_x: float = None
     _driven_front_plate_z: float = None
     _driven_back_plate_z: float = None
 
-    @property
+    @functools.cached_property
     def driving_left_plate_x(self) -> float:
         """X position for left driving bevel plate (away from gear)."""
         if self._driving_left_plate_x is not None:
             return self._driving_left_plate_x
         return self.driving_bevel_x - self.bevel_gear_radius - self.gear_clearance - 5
 
-    @property
+    @functools.cached_property
     def driving_right_plate_x(self) -> float:
         """X position for right driving bevel plate (away from gear)."""
         if self._driving_right_plate_x is not None:
             return self._driving_right_plate_x
         return self.driving_bevel_x + self.bevel_gear_radius + self.gear_clearance + 3
 
-    @property
+    @functools.cached_property
     def driven_front_plate_z(self) -> float:
         """Z position for front driven bevel plate (away from gear)."""
         if self._driven_front_plate_z is not None:
             return self._driven_front_plate_z
         return self.driven_bevel_z - self.bevel_gear_radius - self.gear_clearance - 5
 
-    @property
+    @functools.cached_property
     def driven_back_plate_z(self) -> float:
         """Z position for back driven bevel plate (away from gear)."""
         if self._driven_back_plate_z is not None:
@@ -73,35 +84,87 @@ class UpperHousingParams:
         return self.driven_bevel_z + self.bevel_gear_radius + self.gear_clearance + 3
 
 
+@functools.lru_cache(maxsize=64)
+def _build_yz_plate(
+    bevel_y: float,
+    bevel_z: float,
+    plate_size: float,
+    plate_thickness: float,
+    hole_diameter: float,
+) -> cq.Solid:
+    """Build a YZ plate with an axle hole, centered on X=0.
+
+    Plates at other X positions are moved copies of this template. Cached
+    plates are shared between callers, so they must not be modified
+    in place.
+    """
+    plate = (
+        cq.Workplane('YZ')
+        .center(bevel_y, bevel_z)
+        .rect(plate_size, plate_size)
+        .circle(hole_diameter / 2)  # Nested wire becomes the axle hole
+        .extrude(plate_thickness, clean=False)
+        .translate((-plate_thickness / 2, 0, 0))
+    )
+
+    return plate.val()
+
+
+@functools.lru_cache(maxsize=64)
+def _build_xy_plate(
+    bevel_x: float,
+    bevel_y: float,
+    plate_size: float,
+    plate_thickness: float,
+    hole_diameter: float,
+) -> cq.Solid:
+    """Build an XY plate with an axle hole, centered on Z=0.
+
+    Plates at other Z positions are moved copies of this template. Cached
+    plates are shared between callers, so they must not be modified
+    in place.
+    """
+    plate = (
+        cq.Workplane('XY')
+        .center(bevel_x, bevel_y)
+        .rect(plate_size, plate_size)
+        .circle(hole_diameter / 2)  # Nested wire becomes the axle hole
+        .extrude(plate_thickness, clean=False)
+        .translate((0, 0, -plate_thickness / 2))
+    )
+
+    return plate.val()
+
+
 class UpperHousingGenerator:
     """Generator for upper housing plates."""
 
     def __init__(self, params: UpperHousingParams = None):
         self.params = params or UpperHousingParams()
 
-    def generate_driving_plate(self, plate_x: float) -> cq.Workplane:
-        """Generate a YZ plate for the driving bevel axle at given X position."""
+        # Every plate is a moved copy of one of these two templates, so the
+        # BRep is only built once per set of plate dimensions.
         p = self.params
         hole_diameter = p.axle_diameter + p.axle_clearance * 2
-
-        # Create plate in YZ plane
-        plate = (
-            cq.Workplane('YZ')
-            .center(p.driving_bevel_y, p.driving_bevel_z)
-            .rect(p.plate_size, p.plate_size)
-            .extrude(p.plate_thickness)
-            .translate((plate_x - p.plate_thickness / 2, 0, 0))
+        self._driving_template = _build_yz_plate(
+            p.driving_bevel_y,
+            p.driving_bevel_z,
+            p.plate_size,
+            p.plate_thickness,
+            hole_diameter,
         )
-
-        # Cut hole for axle
-        plate = (
-            plate
-            .faces(">X")
-            .workplane()
-            .hole(hole_diameter)
+        self._driven_template = _build_xy_plate(
+            p.driven_bevel_x,
+            p.driven_bevel_y,
+            p.plate_size,
+            p.plate_thickness,
+            hole_diameter,
         )
+        self._plate_positions: Optional[Mapping[str, float]] = None
 
-        return plate
+    def generate_driving_plate(self, plate_x: float) -> cq.Workplane:
+        """Generate a YZ plate for the driving bevel axle at given X position."""
+        return cq.Workplane(obj=self._driving_template.moved(cq.Location(cq.Vector(plate_x, 0, 0))))
 
     def generate_driving_left_plate(self) -> cq.Workplane:
         """Generate the left plate for driving bevel axle."""
@@ -113,27 +176,7 @@ class UpperHousingGenerator:
 
     def generate_driven_plate(self, plate_z: float) -> cq.Workplane:
         """Generate an XY plate for the driven bevel axle at given Z position."""
-        p = self.params
-        hole_diameter = p.axle_diameter + p.axle_clearance * 2
-
-        # Create plate in XY plane
-        plate = (
-            cq.Workplane('XY')
-            .center(p.driven_bevel_x, p.driven_bevel_y)
-            .rect(p.plate_size, p.plate_size)
-            .extrude(p.plate_thickness)
-            .translate((0, 0, plate_z - p.plate_thickness / 2))
-        )
-
-        # Cut hole for axle
-        plate = (
-            plate
-            .faces(">Z")
-            .workplane()
-            .hole(hole_diameter)
-        )
-
-        return plate
+        return cq.Workplane(obj=self._driven_template.moved(cq.Location(cq.Vector(0, 0, plate_z))))
 
     def generate_driven_front_plate(self) -> cq.Workplane:
         """Generate the front plate for driven bevel axle."""
@@ -143,32 +186,46 @@ class UpperHousingGenerator:
         """Generate the back plate for driven bevel axle."""
         return self.generate_driven_plate(self.params.driven_back_plate_z)
 
-    def generate(self, cantilevered: bool = True) -> cq.Workplane:
-        """Generate upper housing plates as a single solid.
+    def generate(self, cantilevered: bool = True, clean: bool = False) -> cq.Workplane:
+        """Generate upper housing plates as a single compound.
+
+        The plates are physically disjoint, so they are grouped into a
+        Compound rather than fused; each plate remains a separate body.
 
         Args:
             cantilevered: If True (default), only generate outer plates to avoid
                          axle intersection at the lever pivot. If False, generate
                          all 4 plates (may cause axle intersection issues).
+            clean: If True, run CadQuery's clean() on the result. Plates are
+                   built without it since a slab with one hole has no
+                   redundant faces to merge.
         """
-        driving_left = self.generate_driving_left_plate()
-        driven_front = self.generate_driven_front_plate()
-
-        result = driving_left.union(driven_front)
+        plates = [
+            self.generate_driving_left_plate(),
+            self.generate_driven_front_plate(),
+        ]
 
         if not cantilevered:
             # Add inner plates (warning: axles will intersect if both extend fully)
-            driving_right = self.generate_driving_right_plate()
-            driven_back = self.generate_driven_back_plate()
-            result = result.union(driving_right)
-            result = result.union(driven_back)
+            plates.append(self.generate_driving_right_plate())
+            plates.append(self.generate_driven_back_plate())
 
+        result = cq.Workplane(obj=cq.Compound.makeCompound([p.val() for p in plates]))
+        if clean:
+            result = result.clean()
         return result
 
-    def get_plate_positions(self) -> dict:
-        """Return the plate positions for reference."""
+    def get_plate_positions(self) -> Mapping[str, float]:
+        """Return the plate positions for reference.
+
+        Computed on first call and shared afterwards as a read-only mapping;
+        params are fixed at construction so it never needs invalidating.
+        """
+        if self._plate_positions is not None:
+            return self._plate_positions
+
         p = self.params
-        return {
+        self._plate_positions = MappingProxyType({
             'driving_bevel_y': p.driving_bevel_y,
             'driving_bevel_z': p.driving_bevel_z,
             'driven_bevel_x': p.driven_bevel_x,
@@ -178,7 +235,8 @@ class UpperHousingGenerator:
             'driven_front_plate_z': p.driven_front_plate_z,
             'driven_back_plate_z': p.driven_back_plate_z,
             'hole_diameter': p.axle_diameter + p.axle_clearance * 2,
-        }
+        })
+        return self._plate_positions
 
 
 def main():
@@ -186,7 +244,6 @@ def main():
     params = UpperHousingParams()
     gen = UpperHousingGenerator(params)
 
-    housing = gen.generate()
     info = gen.get_plate_positions()
 
     print("Upper Housing Plates:")
@@ -200,7 +257,29 @@ def main():
     print()
     print(f"  Hole diameter: {info['hole_diameter']} mm")
 
-    cq.exporters.export(housing, "upper_housing.step")
+    # Keep one STEP per parameter set and generator source, and only
+    # regenerate on a cache miss; hashing this module invalidates the cache
+    # whenever the geometry code changes
+    digest = hashlib.blake2b(repr(dataclasses.asdict(params)).encode())
+    digest.update(Path(__file__).read_bytes())
+    key = digest.hexdigest()[:16]
+    cached = Path(f"upper_housing.{key}.step")
+    if cached.exists():
+        print(f"\nUsing cached {cached}")
+    else:
+        # Export under a temporary name and move it into place, so an
+        # interrupted export never leaves a truncated file that looks cached
+        partial = cached.with_name(f"{cached.name}.partial")
+        try:
+            cq.exporters.export(gen.generate(), str(partial))
+            os.replace(partial, cached)
+        finally:
+            partial.unlink(missing_ok=True)
+        # Drop files cached under older params or generator versions
+        for stale in Path().glob("upper_housing.*.step"):
+            if stale != cached:
+                stale.unlink()
+    shutil.copyfile(cached, "upper_housing.step")
     print("\nExported: upper_housing.step")
 
 
@@ -2,69 +2,168 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Optional, List, Dict, Tuple
+from enum import IntEnum
+from typing import TYPE_CHECKING, Optional, List, Dict, Sequence, Tuple
 
-import cadquery as cq
+import numpy as np
 
+# cadquery (and OCP) are only needed to build Locations; import them on
+# first use so the data models load without the CAD kernel.
+if TYPE_CHECKING:
+    import cadquery as cq
 
-class PartType(Enum):
-    """Types of parts in the assembly."""
 
-    HOUSING_FRONT = "housing_front"
-    HOUSING_BACK = "housing_back"
-    GEAR_A = "gear_a"
-    GEAR_B = "gear_b"
-    DOG_CLUTCH = "dog_clutch"
-    LEVER = "lever"
-    LEVER_PIVOT = "lever_pivot"
-    BEVEL_DRIVE = "bevel_drive"
-    BEVEL_DRIVEN = "bevel_driven"
-    FLEXURE_BLOCK = "flexure_block"
-    AXLE_MAIN = "axle_main"
-    AXLE_S = "axle_s"
-    SPACER = "spacer"
+class PartType(IntEnum):
+    """Types of parts in the assembly.
 
+    Integer-valued so type checks are plain int compares; use name.lower()
+    for the string form.
+    """
 
-@dataclass
+    HOUSING_FRONT = 0
+    HOUSING_BACK = 1
+    GEAR_A = 2
+    GEAR_B = 3
+    DOG_CLUTCH = 4
+    LEVER = 5
+    LEVER_PIVOT = 6
+    BEVEL_DRIVE = 7
+    BEVEL_DRIVEN = 8
+    FLEXURE_BLOCK = 9
+    AXLE_MAIN = 10
+    AXLE_S = 11
+    SPACER = 12
+
+
+def euler_xyz_matrices(rotations: np.ndarray) -> np.ndarray:
+    """Rotation matrices for intrinsic XYZ Euler angles.
+
+    Args:
+        rotations: (N, 3) array of (rx, ry, rz) angles in degrees.
+
+    Returns:
+        (N, 3, 3) array of Rx @ Ry @ Rz, matching PartPlacement.to_location.
+    """
+    rx, ry, rz = np.radians(np.asarray(rotations, dtype=np.float64)).T
+    n = rx.shape[0]
+    ones, zeros = np.ones(n), np.zeros(n)
+    cx, sx = np.cos(rx), np.sin(rx)
+    cy, sy = np.cos(ry), np.sin(ry)
+    cz, sz = np.cos(rz), np.sin(rz)
+
+    mx = np.stack([ones, zeros, zeros, zeros, cx, -sx, zeros, sx, cx], axis=-1).reshape(n, 3, 3)
+    my = np.stack([cy, zeros, sy, zeros, ones, zeros, -sy, zeros, cy], axis=-1).reshape(n, 3, 3)
+    mz = np.stack([cz, -sz, zeros, sz, cz, zeros, zeros, zeros, ones], axis=-1).reshape(n, 3, 3)
+    return mx @ my @ mz
+
+
+@dataclass(frozen=True)
 class PartPlacement:
-    """Placement of a part in the assembly coordinate frame."""
+    """Placement of a part in the assembly coordinate frame.
+
+    Immutable; use dataclasses.replace() to derive a modified placement.
+    """
 
     part_type: PartType
     part_id: str
     origin: tuple[float, float, float] = (0.0, 0.0, 0.0)
     rotation: tuple[float, float, float] = (0.0, 0.0, 0.0)  # Euler angles (degrees)
-    metadata: Optional[Dict[str, float]] = None  # Part-specific parameters (e.g., length)
+    metadata: Optional[Dict[str, float]] = field(default=None, hash=False)  # Part-specific parameters (e.g., length)
 
     def to_location(self) -> cq.Location:
-        """Convert to CadQuery Location for assembly positioning."""
-        return cq.Location(
-            cq.Vector(*self.origin),
-            cq.Vector(1, 0, 0),
-            self.rotation[0],
-        ) * cq.Location(
-            cq.Vector(0, 0, 0),
-            cq.Vector(0, 1, 0),
-            self.rotation[1],
-        ) * cq.Location(
-            cq.Vector(0, 0, 0),
-            cq.Vector(0, 0, 1),
-            self.rotation[2],
+        """Convert to CadQuery Location for assembly positioning.
+
+        The rotation is applied about X, then the rotated Y, then the rotated
+        Z (intrinsic XYZ), followed by the translation to origin. A new
+        Location is returned on each call, so callers may modify it freely.
+        """
+        import cadquery as cq
+        from OCP.gp import gp_Intrinsic_XYZ, gp_Quaternion, gp_Trsf, gp_Vec
+
+        rx, ry, rz = self.rotation
+        q = gp_Quaternion()
+        q.SetEulerAngles(gp_Intrinsic_XYZ, math.radians(rx), math.radians(ry), math.radians(rz))
+
+        trsf = gp_Trsf()
+        trsf.SetRotation(q)
+        trsf.SetTranslationPart(gp_Vec(*self.origin))
+        return cq.Location(trsf)
+
+
+def compute_locations(placements: Sequence[PartPlacement]) -> list[cq.Location]:
+    """Locations for many placements, with all rotations computed in one pass.
+
+    Origins and rotations are stacked into (N, 3) arrays and converted to
+    rotation matrices with a single euler_xyz_matrices call. Equivalent to
+    calling to_location() on each placement.
+    """
+    import cadquery as cq
+    from OCP.gp import gp_Trsf
+
+    origins = np.array([p.origin for p in placements], dtype=np.float64).reshape(-1, 3)
+    rotations = np.array([p.rotation for p in placements], dtype=np.float64).reshape(-1, 3)
+
+    locations = []
+    for m, (x, y, z) in zip(euler_xyz_matrices(rotations), origins):
+        trsf = gp_Trsf()
+        trsf.SetValues(
+            m[0, 0], m[0, 1], m[0, 2], x,
+            m[1, 0], m[1, 1], m[1, 2], y,
+            m[2, 0], m[2, 1], m[2, 2], z,
         )
+        locations.append(cq.Location(trsf))
+    return locations
 
 
-@dataclass
+@dataclass(frozen=True)
 class ShaftAxis:
-    """Defines a shaft axis for coaxial alignment constraints."""
+    """Defines a shaft axis for coaxial alignment constraints.
+
+    direction is normalized once on construction and kept as a tuple so it
+    takes part in equality and hashing; direction_vec and origin_vec are
+    read-only float64 arrays of the direction and origin. The parts list
+    itself stays mutable.
+    """
 
     axis_id: str
     direction: tuple[float, float, float]  # Unit vector
     origin: tuple[float, float, float]
-    parts: list[str] = field(default_factory=list)  # Part IDs on this axis
+    parts: list[str] = field(default_factory=list, hash=False)  # Part IDs on this axis
+    origin_vec: np.ndarray = field(init=False, repr=False, compare=False)
+    _direction_vec: np.ndarray = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        d = np.asarray(self.direction, dtype=np.float64)
+        direction_vec = d / np.linalg.norm(d)
+        origin_vec = np.array(self.origin, dtype=np.float64)
+        direction_vec.flags.writeable = False
+        origin_vec.flags.writeable = False
+        object.__setattr__(self, "direction", tuple(direction_vec.tolist()))
+        object.__setattr__(self, "_direction_vec", direction_vec)
+        object.__setattr__(self, "origin_vec", origin_vec)
 
-@dataclass
+    @property
+    def direction_vec(self) -> np.ndarray:
+        """The unit direction as a read-only (3,) array."""
+        return self._direction_vec
+
+    def dot(self, v) -> float:
+        """Dot product of the axis direction with v."""
+        return float(np.dot(self._direction_vec, v))
+
+    def cross(self, v) -> np.ndarray:
+        """Cross product of the axis direction with v."""
+        return np.cross(self._direction_vec, v)
+
+    def residuals(self, points: np.ndarray) -> np.ndarray:
+        """Perpendicular distance from each of the (N, 3) points to this axis."""
+        offsets = np.asarray(points, dtype=np.float64).reshape(-1, 3) - self.origin_vec
+        return np.linalg.norm(np.cross(offsets, self._direction_vec), axis=1)
+
+
+@dataclass(frozen=True)
 class MatePair:
     """Mating constraint between two parts (e.g., shaft in hole)."""
 
@@ -74,16 +173,19 @@ class MatePair:
     clearance: float = 0.0
 
 
-@dataclass
+@dataclass(frozen=True)
 class PartMetadata:
-    """Metadata for BOM generation."""
+    """Metadata for BOM generation.
+
+    Immutable; use dataclasses.replace() to derive a modified copy.
+    """
 
     part_id: str
     part_type: PartType
     name: str
     material: str = "PLA"
     count: int = 1
-    dimensions: dict[str, float] = field(default_factory=dict)
+    dimensions: dict[str, float] = field(default_factory=dict, hash=False)
     notes: Optional[str] = None
 
 
@@ -115,6 +217,28 @@ class AssemblyModel:
         self.parts[part_id] = placement
         return placement
 
+    def origins_array(self) -> np.ndarray:
+        """Part origins as an (N, 3) array, in parts order."""
+        return np.array([p.origin for p in self.parts.values()], dtype=np.float64).reshape(-1, 3)
+
+    def rotations_array(self) -> np.ndarray:
+        """Part Euler rotations (degrees) as an (N, 3) array, in parts order."""
+        return np.array([p.rotation for p in self.parts.values()], dtype=np.float64).reshape(-1, 3)
+
+    def part_types_array(self) -> np.ndarray:
+        """Part types as an (N,) int32 array, in parts order.
+
+        Filter with e.g. np.flatnonzero(types == PartType.GEAR_A).
+        """
+        return np.array([p.part_type for p in self.parts.values()], dtype=np.int32)
+
+    def to_locations_batch(self) -> dict[str, cq.Location]:
+        """Locations for every part, with all rotations computed in one pass.
+
+        Equivalent to calling to_location() on each placement.
+        """
+        return dict(zip(self.parts, compute_locations(list(self.parts.values()))))
+
     def add_shaft_axis(
         self,
         axis_id: str,
@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Optional, List, Dict, Tuple
 
+import numpy as np
+
 
 class LogicValue(IntEnum):
     """Logic values encoded as rotation direction."""
@@ -14,17 +16,55 @@ class LogicValue(IntEnum):
     ONE = 1  # Counterclockwise
 
 
-@dataclass
+# All (A, B, S) input combinations, one row each, in truth-table order
+_MUX_INPUTS = np.array(np.meshgrid([0, 1], [0, 1], [0, 1], indexing="ij")).reshape(3, -1).T
+
+# MUX output for each row of _MUX_INPUTS: O = S ? B : A
+_MUX_OUTPUTS = np.where(_MUX_INPUTS[:, 2] == 1, _MUX_INPUTS[:, 1], _MUX_INPUTS[:, 0])
+
+_MUX_KEYS = tuple(map(tuple, _MUX_INPUTS.tolist()))
+
+
+@dataclass(frozen=True)
 class GearPath:
     """A path through the gear train from input to output."""
 
     path_id: str
     input_name: str
     output_name: str
-    gear_stages: list[str]  # List of gear part IDs in the path
+    gear_stages: list[str] = field(hash=False)  # List of gear part IDs in the path
     total_ratio: float = 1.0  # Combined gear ratio (negative = inversion)
 
 
+# MUX model contents, built once. create_mux copies the containers so each
+# model can be edited independently; the frozen GearPaths are shared.
+_MUX_PATHS = {
+    "path_a": GearPath(
+        path_id="path_a",
+        input_name="a",
+        output_name="o",
+        gear_stages=["gear_a", "dog_clutch"],
+        total_ratio=1.0,  # Direct pass-through
+    ),
+    "path_b": GearPath(
+        path_id="path_b",
+        input_name="b",
+        output_name="o",
+        gear_stages=["gear_b", "dog_clutch"],
+        total_ratio=1.0,  # Direct pass-through
+    ),
+}
+
+# S=0 (CW) -> clutch engages A path
+# S=1 (CCW) -> clutch engages B path
+_MUX_ACTIVE_PATH = {0: "path_a", 1: "path_b"}
+
+# When S=0: O = A (clutch engages gear_a)
+# When S=1: O = B (clutch engages gear_b)
+# Also the reference that verify_truth_table checks models against.
+_MUX_TRUTH_TABLE = dict(zip(_MUX_KEYS, _MUX_OUTPUTS.tolist()))
+
+
 @dataclass
 class KinematicModel:
     """Kinematic model for verifying logic behavior."""
@@ -42,41 +82,12 @@ class KinematicModel:
     @classmethod
     def create_mux(cls) -> "KinematicModel":
         """Create kinematic model for a 2:1 MUX (O = S ? B : A)."""
-        model = cls()
-
-        # Define gear paths
-        model.paths["path_a"] = GearPath(
-            path_id="path_a",
-            input_name="a",
-            output_name="o",
-            gear_stages=["gear_a", "dog_clutch"],
-            total_ratio=1.0,  # Direct pass-through
-        )
-        model.paths["path_b"] = GearPath(
-            path_id="path_b",
-            input_name="b",
-            output_name="o",
-            gear_stages=["gear_b", "dog_clutch"],
-            total_ratio=1.0,  # Direct pass-through
+        return cls(
+            truth_table=dict(_MUX_TRUTH_TABLE),
+            paths=dict(_MUX_PATHS),
+            active_path=dict(_MUX_ACTIVE_PATH),
         )
 
-        # S=0 (CW) -> clutch engages A path
-        # S=1 (CCW) -> clutch engages B path
-        model.active_path[0] = "path_a"
-        model.active_path[1] = "path_b"
-
-        # Build truth table
-        # When S=0: O = A (clutch engages gear_a)
-        # When S=1: O = B (clutch engages gear_b)
-        for a in (0, 1):
-            for b in (0, 1):
-                # S=0: O follows A
-                model.truth_table[(a, b, 0)] = a
-                # S=1: O follows B
-                model.truth_table[(a, b, 1)] = b
-
-        return model
-
     def get_output(self, a: int, b: int, s: int) -> Optional[int]:
         """Get expected output for given inputs."""
         return self.truth_table.get((a, b, s))
@@ -90,33 +101,24 @@ class KinematicModel:
 
     def verify_truth_table(self) -> list[str]:
         """Verify the truth table is complete and consistent. Returns list of errors."""
+        # Common case: the table is exactly the MUX reference
+        if self.truth_table == _MUX_TRUTH_TABLE:
+            return []
+
         errors = []
 
         # Check all input combinations are defined
-        for a in (0, 1):
-            for b in (0, 1):
-                for s in (0, 1):
-                    if (a, b, s) not in self.truth_table:
-                        errors.append(f"Missing truth table entry for (A={a}, B={b}, S={s})")
+        for a, b, s in _MUX_KEYS:
+            if (a, b, s) not in self.truth_table:
+                errors.append(f"Missing truth table entry for (A={a}, B={b}, S={s})")
 
         # Verify MUX behavior: S=0 -> O=A, S=1 -> O=B
-        for a in (0, 1):
-            for b in (0, 1):
-                expected_s0 = a  # When S=0, O should equal A
-                expected_s1 = b  # When S=1, O should equal B
-
-                actual_s0 = self.truth_table.get((a, b, 0))
-                actual_s1 = self.truth_table.get((a, b, 1))
-
-                if actual_s0 is not None and actual_s0 != expected_s0:
-                    errors.append(
-                        f"MUX violation at (A={a}, B={b}, S=0): "
-                        f"expected O={expected_s0}, got O={actual_s0}"
-                    )
-                if actual_s1 is not None and actual_s1 != expected_s1:
-                    errors.append(
-                        f"MUX violation at (A={a}, B={b}, S=1): "
-                        f"expected O={expected_s1}, got O={actual_s1}"
-                    )
+        for (a, b, s), expected in _MUX_TRUTH_TABLE.items():
+            actual = self.truth_table.get((a, b, s))
+            if actual is not None and actual != expected:
+                errors.append(
+                    f"MUX violation at (A={a}, B={b}, S={s}): "
+                    f"expected O={expected}, got O={actual}"
+                )
 
         return errors
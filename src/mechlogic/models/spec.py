@@ -2,21 +2,48 @@
 
 from __future__ import annotations
 
-from typing import Literal, Dict, Optional
+import functools
+import json
+from typing import Annotated, Literal, Dict, Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, model_validator
 
 
 class ShaftSpec(BaseModel):
     """Specification for a shaft/axle."""
 
+    model_config = ConfigDict(frozen=True)
+
     # Individual shaft_diameter is optional - uses top-level if not specified
     shaft_diameter: Optional[float] = Field(default=None, gt=0, description="Shaft diameter in mm (optional override)")
 
 
+class _ReadOnlyDict(dict):
+    """Dict that rejects mutation, so specs holding one stay hashable.
+
+    A dict subclass (rather than MappingProxyType) so pydantic can serialize
+    it and specs can still be pickled for worker processes.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} does not support item assignment")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+ShaftSpecMap = Annotated[dict[str, ShaftSpec], AfterValidator(_ReadOnlyDict)]
+
+
 class ElementInfo(BaseModel):
     """Basic information about the logic element."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(min_length=1, description="Element identifier")
     type: Literal["mux"] = Field(default="mux", description="Element type (mux for MVP)")
 
@@ -24,6 +51,8 @@ class ElementInfo(BaseModel):
 class DogClutchSpec(BaseModel):
     """Specification for dog clutch teeth."""
 
+    model_config = ConfigDict(frozen=True)
+
     teeth: int = Field(ge=3, le=12, description="Number of dog teeth")
     tooth_height: float = Field(gt=0, description="Height of dog teeth in mm")
     engagement_depth: float = Field(gt=0, description="Depth of tooth engagement in mm")
@@ -38,6 +67,8 @@ class DogClutchSpec(BaseModel):
 class GearSpec(BaseModel):
     """Specification for gear parameters."""
 
+    model_config = ConfigDict(frozen=True)
+
     module: float = Field(gt=0, le=5, description="Gear module in mm")
     pressure_angle: float = Field(
         default=20, ge=14.5, le=25, description="Pressure angle in degrees"
@@ -50,6 +81,8 @@ class GearSpec(BaseModel):
 class GeometrySpec(BaseModel):
     """Specification for assembly geometry."""
 
+    model_config = ConfigDict(frozen=True)
+
     axle_length: float = Field(gt=0, description="Total axle length in mm")
     housing_thickness: float = Field(gt=0, description="Housing plate thickness in mm")
     lever_throw: float = Field(gt=0, description="Total lever travel distance in mm")
@@ -63,6 +96,8 @@ class GeometrySpec(BaseModel):
 class FlexureSpec(BaseModel):
     """Specification for compliant flexure mechanism."""
 
+    model_config = ConfigDict(frozen=True)
+
     thickness: float = Field(gt=0, description="Flexure beam thickness in mm")
     length: float = Field(gt=0, description="Flexure beam length in mm")
     max_deflection: float = Field(gt=0, description="Maximum deflection target in mm")
@@ -78,6 +113,8 @@ class FlexureSpec(BaseModel):
 class ToleranceSpec(BaseModel):
     """Specification for manufacturing tolerances (FDM defaults)."""
 
+    model_config = ConfigDict(frozen=True)
+
     shaft_clearance: float = Field(
         default=0.2, ge=0, description="Clearance added to holes for shaft fit in mm"
     )
@@ -93,12 +130,19 @@ class ToleranceSpec(BaseModel):
 
 
 class LogicElementSpec(BaseModel):
-    """Top-level specification for a mechanical logic element."""
+    """Top-level specification for a mechanical logic element.
+
+    Specs are frozen and hashable so generators can memoize geometry per
+    spec: every nested model is frozen and the inputs/output mappings are
+    read-only.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     element: ElementInfo
     shaft_diameter: float = Field(gt=0, description="Primary shaft/axle diameter in mm (used for all shafts)")
-    inputs: dict[str, ShaftSpec] = Field(description="Input shaft specifications")
-    output: dict[str, ShaftSpec] = Field(description="Output shaft specifications")
+    inputs: ShaftSpecMap = Field(description="Input shaft specifications")
+    output: ShaftSpecMap = Field(description="Output shaft specifications")
     gears: GearSpec
     geometry: GeometrySpec
     flexure: FlexureSpec
@@ -128,7 +172,43 @@ class LogicElementSpec(BaseModel):
             )
         return self
 
+    @classmethod
+    def fast_validate(cls, data: dict) -> "LogicElementSpec":
+        """Validate a raw spec dict, reusing the result for identical input.
+
+        The dict is canonicalized to JSON and validated in one pass by
+        pydantic-core's JSON parser; the result is cached per JSON string, so
+        repeated loads of the same spec skip validation entirely and return
+        the same (immutable) instance. Invalid input raises ValidationError
+        on every call, as model_validate does. Data that is not
+        JSON-serializable falls back to model_validate.
+        """
+        try:
+            raw = json.dumps(data, sort_keys=True)
+        except TypeError:
+            return cls.model_validate(data)
+        return _validate_spec_json(cls, raw)
+
+    def __hash__(self) -> int:
+        # Consistent with ==: the nested models are frozen (and hashable),
+        # and the mappings are hashed by sorted items so key order is ignored
+        return hash((
+            self.element,
+            self.shaft_diameter,
+            tuple(sorted(self.inputs.items())),
+            tuple(sorted(self.output.items())),
+            self.gears,
+            self.geometry,
+            self.flexure,
+            self.tolerances,
+        ))
+
     @property
     def primary_shaft_diameter(self) -> float:
         """Get the primary shaft diameter."""
         return self.shaft_diameter
+
+
+@functools.lru_cache(maxsize=64)
+def _validate_spec_json(cls: type[LogicElementSpec], raw: str) -> LogicElementSpec:
+    return cls.model_validate_json(raw)
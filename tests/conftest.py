@@ -0,0 +1,63 @@
+"""Shared pytest configuration."""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--slow",
+        action="store_true",
+        default=False,
+        help="Run slow OCCT regression checks",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: slow OCCT regression check (run with --slow)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def bevel_spec_data():
+    """Return the spec data shared by the bevel gear tests (do not mutate)."""
+    return {
+        "element": {"name": "test_mux", "type": "mux"},
+        "inputs": {
+            "a": {"shaft_diameter": 6.0},
+            "b": {"shaft_diameter": 6.0},
+            "s": {"shaft_diameter": 6.0},
+        },
+        "output": {"o": {"shaft_diameter": 6.0}},
+        "gears": {
+            "module": 1.5,
+            "pressure_angle": 20,
+            "coaxial_teeth": 24,
+            "bevel_teeth": 16,
+            "dog_clutch": {
+                "teeth": 6,
+                "tooth_height": 2.0,
+                "engagement_depth": 1.5,
+            },
+        },
+        "geometry": {
+            "axle_length": 60.0,
+            "housing_thickness": 4.0,
+            "lever_throw": 8.0,
+            "clutch_width": 10.0,
+            "gear_face_width": 8.0,
+            "gear_spacing": 3.0,
+        },
+        "flexure": {
+            "thickness": 1.2,
+            "length": 15.0,
+            "max_deflection": 2.0,
+        },
+    }
@@ -0,0 +1,162 @@
+"""Analytic intersection checks for axis-aligned axle cylinders.
+
+Axles in the intersection tests are finite, axis-aligned cylinders, so
+overlap can be decided in closed form instead of with an OCCT boolean. The
+pair check is a float-only kernel, compiled with Numba when it is installed.
+"""
+
+import math
+from dataclasses import dataclass
+
+import cadquery as cq
+import numpy as np
+
+from mechlogic.generators.layout import jit_kernel
+
+
+_AXES = {'x': 0, 'y': 1, 'z': 2}
+
+
+@dataclass(frozen=True)
+class Cylinder:
+    """Finite cylinder of radius r whose axis runs from p0 to p1.
+
+    p0 and p1 differ only in the coordinate named by axis ('x', 'y' or 'z').
+    """
+
+    axis: str
+    p0: tuple[float, float, float]
+    p1: tuple[float, float, float]
+    r: float
+
+    @property
+    def index(self) -> int:
+        return _AXES[self.axis]
+
+    @property
+    def extent(self) -> tuple[float, float]:
+        """(start, end) along the axis."""
+        i = self.index
+        return min(self.p0[i], self.p1[i]), max(self.p0[i], self.p1[i])
+
+    @property
+    def aabb(self) -> tuple[tuple[float, ...], tuple[float, ...]]:
+        """Axis-aligned bounding box (mins, maxs), from the parameters alone."""
+        i = self.index
+        start, end = self.extent
+        mins = tuple(start if axis == i else self.p0[axis] - self.r for axis in range(3))
+        maxs = tuple(end if axis == i else self.p0[axis] + self.r for axis in range(3))
+        return mins, maxs
+
+    def to_solid(self) -> cq.Solid:
+        """Build the equivalent OCCT solid (for regression checks)."""
+        start, end = self.extent
+        direction = [0.0, 0.0, 0.0]
+        direction[self.index] = 1.0
+        base = list(self.p0)
+        base[self.index] = start
+        return cq.Solid.makeCylinder(self.r, end - start, cq.Vector(*base), cq.Vector(*direction))
+
+
+def aabb_overlap(a: Cylinder, b: Cylinder) -> bool:
+    """Broad-phase check: do the bounding boxes of a and b overlap?"""
+    (a_min, a_max), (b_min, b_max) = a.aabb, b.aabb
+    return all(a_max[axis] >= b_min[axis] and b_max[axis] >= a_min[axis] for axis in range(3))
+
+
+@jit_kernel
+def _cylinder_pair_hits(i, pa, a_start, a_end, ra, k, pb, b_start, b_end, rb, tol):
+    """Scalar kernel behind cylinders_intersect.
+
+    i and k are the axis indices of A and B, pa and pb points on each axis
+    (3-tuples of floats) and start/end their extents along that axis.
+    """
+    # Broad phase: bounding boxes
+    for axis in range(3):
+        a_lo, a_hi = (a_start, a_end) if axis == i else (pa[axis] - ra, pa[axis] + ra)
+        b_lo, b_hi = (b_start, b_end) if axis == k else (pb[axis] - rb, pb[axis] + rb)
+        if a_hi < b_lo or b_hi < a_lo:
+            return False
+
+    if i == k:
+        if min(a_end, b_end) - max(a_start, b_start) <= tol:
+            return False
+        gap_sq = 0.0
+        for axis in range(3):
+            if axis != i:
+                gap_sq += (pa[axis] - pb[axis]) ** 2
+        return math.sqrt(gap_sq) < ra + rb - tol
+
+    j = 3 - i - k
+    # How far B's axis lies outside A's extent, and vice versa
+    dx = max(a_start - pb[i], 0.0, pb[i] - a_end)
+    dz = max(b_start - pa[k], 0.0, pa[k] - b_end)
+    if dx >= rb or dz >= ra:
+        return False
+
+    # Half-widths of each cylinder's cross-section at those closest points
+    reach = math.sqrt(ra ** 2 - dz ** 2) + math.sqrt(rb ** 2 - dx ** 2)
+    return abs(pa[j] - pb[j]) < reach - tol
+
+
+def cylinders_intersect(a: Cylinder, b: Cylinder, tol: float = 0.001) -> bool:
+    """Check whether two axis-aligned cylinders overlap by more than tol.
+
+    Parallel cylinders overlap when their axial extents overlap and their
+    axes are closer than the summed radii. For perpendicular cylinders
+    (A along i, B along k, third axis j), the closest approach is found by
+    taking the point of each extent nearest the other axis; what remains
+    is a 1-D check along j. Both cases are exact for flat-ended cylinders.
+    Pairs with disjoint bounding boxes are rejected first.
+    """
+    return bool(_cylinder_pair_hits(
+        a.index, tuple(map(float, a.p0)), *map(float, a.extent), float(a.r),
+        b.index, tuple(map(float, b.p0)), *map(float, b.extent), float(b.r),
+        float(tol),
+    ))
+
+
+def intersection_matrix(cylinders, tol: float = 0.001) -> np.ndarray:
+    """Pairwise cylinders_intersect over a sequence of cylinders.
+
+    Evaluates every pair in one set of array operations and returns a
+    symmetric (N, N) boolean matrix with a False diagonal.
+    """
+    p0 = np.array([c.p0 for c in cylinders], dtype=float)
+    axis = np.array([c.index for c in cylinders])
+    r = np.array([c.r for c in cylinders], dtype=float)
+    extents = np.array([c.extent for c in cylinders], dtype=float)
+    start, end = extents[:, 0], extents[:, 1]
+    rows = np.arange(len(cylinders))
+
+    mins = p0 - r[:, None]
+    maxs = p0 + r[:, None]
+    mins[rows, axis] = start
+    maxs[rows, axis] = end
+    aabb = np.all((maxs[:, None] >= mins[None]) & (maxs[None] >= mins[:, None]), axis=-1)
+
+    delta = p0[:, None] - p0[None]
+    same_axis = axis[:, None] == axis[None]
+
+    # Parallel: axial overlap and transverse distance between the axes
+    overlap = np.minimum(end[:, None], end[None]) - np.maximum(start[:, None], start[None])
+    transverse = np.where(np.eye(3, dtype=bool)[axis][:, None], 0.0, delta)
+    gap = np.linalg.norm(transverse, axis=-1)
+    parallel = (overlap > tol) & (gap < r[:, None] + r[None] - tol)
+
+    # Perpendicular (A along i, B along k, third axis j); entry [a, b] of
+    # p0.T[axis] is B's coordinate along A's axis
+    b_on_a = p0.T[axis]
+    a_on_b = b_on_a.T
+    dx = np.maximum.reduce([start[:, None] - b_on_a, np.zeros_like(b_on_a), b_on_a - end[:, None]])
+    dz = np.maximum.reduce([start[None] - a_on_b, np.zeros_like(a_on_b), a_on_b - end[None]])
+    j = np.where(same_axis, 0, 3 - axis[:, None] - axis[None])
+    dj = np.abs(np.take_along_axis(delta, j[..., None], axis=-1)[..., 0])
+    ra, rb = np.broadcast_arrays(r[:, None], r[None])
+    with np.errstate(invalid='ignore'):
+        reach = np.sqrt(ra ** 2 - dz ** 2) + np.sqrt(rb ** 2 - dx ** 2)
+    perpendicular = (dx < rb) & (dz < ra) & (dj < reach - tol)
+
+    hits = aabb & np.where(same_axis, parallel, perpendicular)
+    np.fill_diagonal(hits, False)
+    return hits
@@ -8,7 +8,7 @@ from mechlogic.models.spec import LogicElementSpec
 from mechlogic.assembly.builder import AssemblyBuilder
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def spec_data():
     return {
         "element": {"name": "test_mux", "type": "mux"},
@@ -45,51 +45,53 @@ def spec_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def spec(spec_data):
-    return LogicElementSpec.model_validate(spec_data)
+    return LogicElementSpec.fast_validate(spec_data)
+
+
+@pytest.fixture(scope="class")
+def _built(spec):
+    """Build the assembly once per test class; tests only inspect it."""
+    builder = AssemblyBuilder(spec)
+    return builder, builder.build()
+
+
+@pytest.fixture(scope="class")
+def built_builder(_built):
+    return _built[0]
+
+
+@pytest.fixture(scope="class")
+def assembly(_built):
+    return _built[1]
 
 
 class TestFullAssembly:
     """Integration tests for complete assembly."""
 
-    def test_build_assembly_succeeds(self, spec):
-        builder = AssemblyBuilder(spec)
-        assembly = builder.build()
-
+    def test_build_assembly_succeeds(self, assembly):
         assert assembly is not None
         assert assembly.name == "test_mux"
 
-    def test_assembly_contains_bevel_gears(self, spec):
-        builder = AssemblyBuilder(spec)
-        assembly = builder.build()
-
+    def test_assembly_contains_bevel_gears(self, assembly):
         part_names = [child.name for child in assembly.children]
 
         assert "bevel_driving" in part_names
         assert "bevel_driven" in part_names
 
-    def test_assembly_contains_lever_pivot(self, spec):
-        builder = AssemblyBuilder(spec)
-        assembly = builder.build()
-
+    def test_assembly_contains_lever_pivot(self, assembly):
         part_names = [child.name for child in assembly.children]
 
         assert "lever_pivot" in part_names
 
-    def test_assembly_contains_flexure_block(self, spec):
-        builder = AssemblyBuilder(spec)
-        assembly = builder.build()
-
+    def test_assembly_contains_flexure_block(self, assembly):
         part_names = [child.name for child in assembly.children]
 
         assert "flexure_block" in part_names
 
-    def test_bom_includes_new_parts(self, spec):
-        builder = AssemblyBuilder(spec)
-        builder.build()
-
-        bom = builder.get_bom()
+    def test_bom_includes_new_parts(self, built_builder):
+        bom = built_builder.get_bom()
         part_ids = [item["part_id"] for item in bom]
 
         assert "bevel_driving" in part_ids
@@ -97,13 +99,148 @@ class TestFullAssembly:
         assert "lever_pivot" in part_ids
         assert "flexure_block" in part_ids
 
-    def test_export_step(self, spec):
-        builder = AssemblyBuilder(spec)
-        assembly = builder.build()
-
+    def test_export_step(self, assembly):
         with tempfile.TemporaryDirectory() as tmpdir:
             step_path = Path(tmpdir) / "assembly.step"
             assembly.save(str(step_path))
 
             assert step_path.exists()
             assert step_path.stat().st_size > 0
+
+
+class TestMuxSelectorInstancing:
+    """Tests for prototype-based mux selector instancing."""
+
+    def test_instances_share_shapes(self, spec):
+        import cadquery as cq
+        from mechlogic.generators.mux_selector import MuxSelectorGenerator
+        from mechlogic.models.geometry import PartPlacement, PartType
+
+        gen = MuxSelectorGenerator()
+        outer = cq.Assembly()
+        for i, x in enumerate((0.0, 100.0)):
+            placement = PartPlacement(
+                part_type=PartType.GEAR_A, part_id=f"mux_{i}", origin=(x, 0.0, 0.0)
+            )
+            gen.add_instance(outer, spec, placement, name_prefix=f"mux_{i}_")
+
+        first, second = outer.children
+        assert [c.name for c in first.children] == [c.name for c in second.children]
+        assert first.children[0].obj is second.children[0].obj
+        assert second.loc.toTuple()[0] == pytest.approx((100.0, 0.0, 0.0))
+
+    def test_build_many_places_each_instance(self, spec):
+        from mechlogic.generators.mux_selector import MuxSelectorGenerator
+        from mechlogic.models.geometry import PartPlacement, PartType
+
+        placements = [
+            PartPlacement(part_type=PartType.GEAR_A, part_id=f"mux_{i}", origin=(50.0 * i, 0.0, 0.0))
+            for i in range(3)
+        ]
+        assy = MuxSelectorGenerator().build_many([(spec, p) for p in placements], max_workers=2)
+
+        assert [c.name for c in assy.children] == [f"mux_{i}_mux_selector" for i in range(3)]
+        assert assy.children[0].children[0].obj is assy.children[2].children[0].obj
+
+    def test_build_many_builds_each_prototype_once(self, spec, monkeypatch):
+        from mechlogic.generators import mux_selector
+        from mechlogic.models.geometry import PartPlacement, PartType
+
+        calls = []
+        build = mux_selector._prototype_assembly.__wrapped__
+
+        def counting_build(*args):
+            calls.append(args)
+            return build(*args)
+
+        # Uncached, so any lookup after the thread pool would rebuild
+        monkeypatch.setattr(mux_selector, "_prototype_assembly", counting_build)
+        placements = [
+            PartPlacement(part_type=PartType.GEAR_A, part_id=f"mux_{i}", origin=(50.0 * i, 0.0, 0.0))
+            for i in range(3)
+        ]
+        mux_selector.MuxSelectorGenerator().build_many([(spec, p) for p in placements])
+
+        assert len(calls) == 1
+
+    def test_metadata_is_shared_and_read_only(self, spec):
+        from mechlogic.generators.mux_selector import MuxSelectorGenerator
+
+        gen = MuxSelectorGenerator()
+        meta = gen.get_metadata(spec)
+        assert gen.get_metadata(spec) is meta
+        with pytest.raises(TypeError):
+            meta.dimensions["pivot_y"] = 0.0
+
+
+class TestPartPlacementLocation:
+    """Tests for converting placements to CadQuery locations."""
+
+    def test_location_matches_chained_axis_rotations(self):
+        import cadquery as cq
+        from mechlogic.models.geometry import PartPlacement, PartType
+
+        placement = PartPlacement(
+            part_type=PartType.LEVER,
+            part_id="lever",
+            origin=(1.0, -2.0, 3.5),
+            rotation=(30.0, -45.0, 90.0),
+        )
+        expected = (
+            cq.Location(cq.Vector(1.0, -2.0, 3.5), cq.Vector(1, 0, 0), 30.0)
+            * cq.Location(cq.Vector(0, 0, 0), cq.Vector(0, 1, 0), -45.0)
+            * cq.Location(cq.Vector(0, 0, 0), cq.Vector(0, 0, 1), 90.0)
+        )
+
+        point = cq.Vector(1.0, 2.0, 3.0).toPnt()
+        actual = point.Transformed(placement.to_location().wrapped.Transformation())
+        wanted = point.Transformed(expected.wrapped.Transformation())
+        assert (actual.X(), actual.Y(), actual.Z()) == pytest.approx(
+            (wanted.X(), wanted.Y(), wanted.Z()), abs=1e-9
+        )
+
+    def test_locations_batch_matches_per_part(self):
+        import cadquery as cq
+        from mechlogic.models.geometry import AssemblyModel, PartType
+
+        model = AssemblyModel()
+        model.add_part(PartType.GEAR_A, "gear_a", origin=(1.0, 2.0, 3.0))
+        model.add_part(PartType.LEVER, "lever", origin=(-4.0, 0.5, 0.0), rotation=(30.0, -45.0, 90.0))
+        model.add_part(PartType.AXLE_S, "axle_s", rotation=(0.0, 90.0, 0.0))
+
+        locations = model.to_locations_batch()
+        assert list(locations) == list(model.parts)
+
+        point = cq.Vector(1.0, 2.0, 3.0).toPnt()
+        for part_id, placement in model.parts.items():
+            actual = point.Transformed(locations[part_id].wrapped.Transformation())
+            wanted = point.Transformed(placement.to_location().wrapped.Transformation())
+            assert (actual.X(), actual.Y(), actual.Z()) == pytest.approx(
+                (wanted.X(), wanted.Y(), wanted.Z()), abs=1e-9
+            )
+
+    def test_location_is_fresh_per_call(self):
+        from mechlogic.models.geometry import PartPlacement, PartType
+
+        placement = PartPlacement(part_type=PartType.GEAR_A, part_id="gear_a", origin=(1.0, 0.0, 0.0))
+        loc = placement.to_location()
+        assert placement.to_location() is not loc
+        assert loc.toTuple()[0] == pytest.approx((1.0, 0.0, 0.0))
+
+
+class TestSelectorWithHousing:
+    """Tests for the selector mechanism with lower housing."""
+
+    def test_parallel_housing_matches_sequential(self, spec):
+        from mechlogic.generators.selector_with_housing import _cached_housing
+
+        sequential = _cached_housing(spec, False)
+        parallel = _cached_housing(spec, True)
+        for seq_part, par_part in zip(sequential, parallel):
+            assert par_part.Volume() == pytest.approx(seq_part.Volume(), rel=1e-6)
+
+    def test_build_in_processes_falls_back_on_unpicklable_job(self):
+        from mechlogic.generators.base import build_in_processes, shape_to_brep
+
+        # A lambda cannot be sent to a worker process
+        assert build_in_processes([(shape_to_brep, (lambda: None,))]) is None
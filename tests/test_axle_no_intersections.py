@@ -11,54 +11,48 @@ The driving and driven bevel axles could potentially intersect since they
 both pass through Y=pivot_y.
 """
 
+import itertools
+
 import pytest
-import cadquery as cq
 import yaml
+from OCP.TopAbs import TopAbs_SOLID
+from OCP.TopExp import TopExp_Explorer
 
 from mechlogic.models.spec import LogicElementSpec
 from mechlogic.generators.gear_bevel import BevelGearGenerator
 from mechlogic.generators.lower_housing import LowerHousingParams
 from mechlogic.generators.upper_housing import UpperHousingParams
 
+from .cylinders import Cylinder, aabb_overlap, cylinders_intersect, intersection_matrix
+
 
 def shapes_intersect(shape1, shape2, tolerance=0.001):
-    """Check if two shapes intersect."""
-    try:
-        if hasattr(shape1, 'val'):
-            shape1 = shape1.val()
-        if hasattr(shape2, 'val'):
-            shape2 = shape2.val()
-        intersection = shape1.intersect(shape2)
-        return intersection.Volume() > tolerance
-    except Exception:
+    """Check if two shapes intersect.
+
+    Axle cylinders are checked analytically; other shapes use an OCCT boolean.
+    """
+    if isinstance(shape1, Cylinder) and isinstance(shape2, Cylinder):
+        return cylinders_intersect(shape1, shape2, tolerance)
+    intersection = shape1.intersect(shape2)
+    # Most pairs are disjoint: skip volume integration unless the
+    # boolean produced at least one solid
+    occt = intersection.wrapped
+    if occt is None or occt.IsNull() or not TopExp_Explorer(occt, TopAbs_SOLID).More():
         return False
+    return intersection.Volume() > tolerance
 
 
-def create_x_axle(y: float, z: float, x_start: float, x_end: float, diameter: float) -> cq.Workplane:
+def create_x_axle(y: float, z: float, x_start: float, x_end: float, diameter: float) -> Cylinder:
     """Create a cylindrical axle along the X-axis."""
-    length = x_end - x_start
-    return (
-        cq.Workplane('YZ')
-        .center(y, z)
-        .circle(diameter / 2)
-        .extrude(length)
-        .translate((x_start, 0, 0))
-    )
+    return Cylinder('x', (x_start, y, z), (x_end, y, z), diameter / 2)
 
 
-def create_z_axle(x: float, y: float, z_start: float, z_end: float, diameter: float) -> cq.Workplane:
+def create_z_axle(x: float, y: float, z_start: float, z_end: float, diameter: float) -> Cylinder:
     """Create a cylindrical axle along the Z-axis."""
-    length = z_end - z_start
-    return (
-        cq.Workplane('XY')
-        .center(x, y)
-        .circle(diameter / 2)
-        .extrude(length)
-        .translate((0, 0, z_start))
-    )
+    return Cylinder('z', (x, y, z_start), (x, y, z_end), diameter / 2)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def spec():
     """Load the mux spec."""
     with open("examples/mux_2to1.yaml") as f:
@@ -66,7 +60,7 @@ def spec():
     return LogicElementSpec.model_validate(spec_data)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mux_geometry(spec):
     """Calculate all mux geometry positions."""
     module = spec.gears.module
@@ -127,7 +121,7 @@ def mux_geometry(spec):
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def axles(mux_geometry):
     """Create all 5 axles with proper extents.
 
@@ -179,7 +173,7 @@ def axles(mux_geometry):
     driven_z_end = min(upper_params.driven_back_plate_z + 20,
                        g['driving_bevel_z'] - clearance)  # Stop before driving axle
 
-    return {
+    result = {
         'selector': create_x_axle(
             g['selector_axle_y'], g['selector_axle_z'],
             lower_x_start, lower_x_end, d
@@ -202,74 +196,70 @@ def axles(mux_geometry):
         ),
     }
 
+    # Validate once here; shapes_intersect does not guard against bad input
+    for name, axle in result.items():
+        start, end = axle.extent
+        assert axle.r > 0 and end > start, f"{name} axle is degenerate: {axle}"
+    return result
+
+
+# Every axle pair: lower-lower, upper-upper, then lower-upper
+AXLE_PAIRS = [
+    ('selector', 'input_a'),
+    ('selector', 'input_b'),
+    ('input_a', 'input_b'),
+    ('driving_bevel', 'driven_bevel'),
+    ('selector', 'driving_bevel'),
+    ('selector', 'driven_bevel'),
+    ('input_a', 'driving_bevel'),
+    ('input_a', 'driven_bevel'),
+    ('input_b', 'driving_bevel'),
+    ('input_b', 'driven_bevel'),
+]
+
+
+@pytest.fixture(scope="session")
+def axle_intersections(axles):
+    """Intersection flags for every axle pair, keyed by (name, name)."""
+    names = list(axles)
+    hits = intersection_matrix([axles[name] for name in names])
+    return {
+        (a, b): bool(hits[i, j])
+        for i, a in enumerate(names)
+        for j, b in enumerate(names)
+    }
+
+
+@pytest.mark.parametrize("a,b", AXLE_PAIRS, ids=[f"{a}-vs-{b}" for a, b in AXLE_PAIRS])
+def test_pair_no_intersection(axle_intersections, a, b):
+    """No two axles should intersect."""
+    assert not axle_intersections[a, b], (
+        f"{a} axle intersects with {b} axle"
+    )
+
+
+def test_intersection_matrix_matches_pairwise(axles, axle_intersections):
+    """The batched matrix agrees with the per-pair analytic check."""
+    for name_a, name_b in itertools.permutations(axles, 2):
+        expected = shapes_intersect(axles[name_a], axles[name_b])
+        assert axle_intersections[name_a, name_b] == expected, f"{name_a} vs {name_b}"
+
+
+@pytest.mark.slow
+class TestAnalyticMatchesOcct:
+    """Regression check of the analytic cylinder test against OCCT booleans."""
+
+    def test_all_pairs_match_occt(self, axles):
+        for name_a, name_b in itertools.combinations(axles, 2):
+            a, b = axles[name_a], axles[name_b]
+            occt = shapes_intersect(a.to_solid(), b.to_solid())
+            assert shapes_intersect(a, b) == occt, f"{name_a} vs {name_b}"
+            if occt:
+                assert aabb_overlap(a, b), f"{name_a} vs {name_b}"
 
-class TestLowerAxlesNoIntersections:
-    """Tests that lower axles don't intersect each other."""
-
-    def test_selector_input_a_no_intersection(self, axles):
-        """Selector and Input A axles should not intersect."""
-        assert not shapes_intersect(axles['selector'], axles['input_a']), (
-            "Selector axle intersects with Input A axle"
-        )
-
-    def test_selector_input_b_no_intersection(self, axles):
-        """Selector and Input B axles should not intersect."""
-        assert not shapes_intersect(axles['selector'], axles['input_b']), (
-            "Selector axle intersects with Input B axle"
-        )
-
-    def test_input_a_input_b_no_intersection(self, axles):
-        """Input A and Input B axles should not intersect."""
-        assert not shapes_intersect(axles['input_a'], axles['input_b']), (
-            "Input A axle intersects with Input B axle"
-        )
-
-
-class TestUpperAxlesNoIntersections:
-    """Tests that upper axles don't intersect each other."""
-
-    def test_driving_driven_bevel_no_intersection(self, axles):
-        """Driving and driven bevel axles should not intersect."""
-        assert not shapes_intersect(axles['driving_bevel'], axles['driven_bevel']), (
-            "Driving bevel axle intersects with driven bevel axle"
-        )
-
-
-class TestLowerUpperAxlesNoIntersections:
-    """Tests that lower and upper axles don't intersect each other."""
-
-    def test_selector_driving_bevel_no_intersection(self, axles):
-        """Selector and driving bevel axles should not intersect."""
-        assert not shapes_intersect(axles['selector'], axles['driving_bevel']), (
-            "Selector axle intersects with driving bevel axle"
-        )
-
-    def test_selector_driven_bevel_no_intersection(self, axles):
-        """Selector and driven bevel axles should not intersect."""
-        assert not shapes_intersect(axles['selector'], axles['driven_bevel']), (
-            "Selector axle intersects with driven bevel axle"
-        )
-
-    def test_input_a_driving_bevel_no_intersection(self, axles):
-        """Input A and driving bevel axles should not intersect."""
-        assert not shapes_intersect(axles['input_a'], axles['driving_bevel']), (
-            "Input A axle intersects with driving bevel axle"
-        )
-
-    def test_input_a_driven_bevel_no_intersection(self, axles):
-        """Input A and driven bevel axles should not intersect."""
-        assert not shapes_intersect(axles['input_a'], axles['driven_bevel']), (
-            "Input A axle intersects with driven bevel axle"
-        )
-
-    def test_input_b_driving_bevel_no_intersection(self, axles):
-        """Input B and driving bevel axles should not intersect."""
-        assert not shapes_intersect(axles['input_b'], axles['driving_bevel']), (
-            "Input B axle intersects with driving bevel axle"
-        )
-
-    def test_input_b_driven_bevel_no_intersection(self, axles):
-        """Input B and driven bevel axles should not intersect."""
-        assert not shapes_intersect(axles['input_b'], axles['driven_bevel']), (
-            "Input B axle intersects with driven bevel axle"
-        )
+    def test_aabb_matches_occt_bounding_box(self, axles):
+        for axle in axles.values():
+            bb = axle.to_solid().BoundingBox()
+            mins, maxs = axle.aabb
+            assert mins == pytest.approx((bb.xmin, bb.ymin, bb.zmin), abs=1e-3)
+            assert maxs == pytest.approx((bb.xmax, bb.ymax, bb.zmax), abs=1e-3)
@@ -0,0 +1,60 @@
+"""Tests for D-flat axle helpers."""
+
+import pytest
+import cadquery as cq
+
+from mechlogic.generators.axle_profile import (
+    add_groove_to_axle,
+    make_d_flat_axle,
+    make_d_flat_axle_along_z,
+    make_d_flat_cylinder,
+    make_d_flat_wire,
+    make_d_flat_axle_with_grooves,
+)
+
+
+@pytest.mark.parametrize("groove_positions", [
+    (),
+    (10.0, 40.0),
+    (0.5, 25.0, 59.5),  # Grooves clipped at both axle ends
+    (20.0, 20.5),       # Overlapping grooves
+])
+def test_revolved_axle_matches_boolean_grooves(groove_positions):
+    """Revolved axle should match the axle built by cutting each groove."""
+    diameter, length, d_flat_depth = 6.0, 60.0, 0.5
+
+    expected = make_d_flat_axle(diameter, length, d_flat_depth)
+    for x in groove_positions:
+        expected = add_groove_to_axle(expected, x, diameter)
+
+    axle = make_d_flat_axle_with_grooves(diameter, length, d_flat_depth, groove_positions)
+
+    assert axle.val().isValid()
+    assert axle.val().Volume() == pytest.approx(expected.val().Volume(), rel=1e-4)
+    assert axle.val().intersect(expected.val()).Volume() == pytest.approx(
+        expected.val().Volume(), rel=1e-4
+    )
+
+
+def test_d_flat_axles_span_expected_bounds():
+    """Direct-cylinder axles should keep the extents of the extruded ones."""
+    diameter, length, d_flat_depth = 6.0, 60.0, 0.5
+
+    bb = make_d_flat_axle(diameter, length, d_flat_depth).val().BoundingBox()
+    assert (bb.xmin, bb.xmax) == pytest.approx((0.0, length), abs=1e-6)
+    assert (bb.ymin, bb.ymax) == pytest.approx((-3.0, 2.5), abs=1e-6)
+
+    bb = make_d_flat_axle_along_z(diameter, length, d_flat_depth, z_start=5.0).val().BoundingBox()
+    assert (bb.zmin, bb.zmax) == pytest.approx((5.0, 5.0 + length), abs=1e-6)
+    assert (bb.ymin, bb.ymax) == pytest.approx((-3.0, 2.5), abs=1e-6)
+
+
+def test_d_flat_wire_matches_cylinder_section():
+    """D-flat wire should enclose the same section as the D-flat cylinder."""
+    diameter, d_flat_depth, length = 6.0, 0.5, 10.0
+
+    face = cq.Face.makeFromWires(make_d_flat_wire(diameter, d_flat_depth))
+    cylinder = make_d_flat_cylinder(diameter, length, d_flat_depth).val()
+
+    assert face.Area() == pytest.approx(cylinder.Volume() / length, rel=1e-6)
+    assert face.BoundingBox().ymax == pytest.approx(diameter / 2 - d_flat_depth)
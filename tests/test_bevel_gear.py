@@ -1,5 +1,7 @@
 """Tests for bevel gear generator."""
 
+import functools
+
 import pytest
 import math
 
@@ -7,47 +9,22 @@ from mechlogic.models.spec import LogicElementSpec
 from mechlogic.models.geometry import PartPlacement, PartType
 
 
-@pytest.fixture
-def spec_data():
-    """Return valid specification data."""
-    return {
-        "element": {"name": "test_mux", "type": "mux"},
-        "inputs": {
-            "a": {"shaft_diameter": 6.0},
-            "b": {"shaft_diameter": 6.0},
-            "s": {"shaft_diameter": 6.0},
-        },
-        "output": {"o": {"shaft_diameter": 6.0}},
-        "gears": {
-            "module": 1.5,
-            "pressure_angle": 20,
-            "coaxial_teeth": 24,
-            "bevel_teeth": 16,
-            "dog_clutch": {
-                "teeth": 6,
-                "tooth_height": 2.0,
-                "engagement_depth": 1.5,
-            },
-        },
-        "geometry": {
-            "axle_length": 60.0,
-            "housing_thickness": 4.0,
-            "lever_throw": 8.0,
-            "clutch_width": 10.0,
-            "gear_face_width": 8.0,
-            "gear_spacing": 3.0,
-        },
-        "flexure": {
-            "thickness": 1.2,
-            "length": 15.0,
-            "max_deflection": 2.0,
-        },
-    }
-
-
-@pytest.fixture
-def spec(spec_data):
-    return LogicElementSpec.model_validate(spec_data)
+@pytest.fixture(scope="module")
+def spec(bevel_spec_data):
+    return LogicElementSpec.model_validate(bevel_spec_data)
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_driving_gear(spec):
+    """Generate the driving bevel gear once per spec (tests only inspect it)."""
+    from mechlogic.generators.gear_bevel import BevelGearGenerator
+
+    gen = BevelGearGenerator(gear_id="driving")
+    placement = PartPlacement(
+        part_type=PartType.BEVEL_DRIVE,
+        part_id="bevel_driving",
+    )
+    return gen.generate(spec, placement)
 
 
 class TestBevelGearGenerator:
@@ -58,15 +35,7 @@ class TestBevelGearGenerator:
         assert BevelGearGenerator is not None
 
     def test_driving_gear_is_conical(self, spec):
-        from mechlogic.generators.gear_bevel import BevelGearGenerator
-
-        gen = BevelGearGenerator(gear_id="driving")
-        placement = PartPlacement(
-            part_type=PartType.BEVEL_DRIVE,
-            part_id="bevel_driving",
-        )
-
-        gear = gen.generate(spec, placement)
+        gear = _cached_driving_gear(spec)
         bb = gear.val().BoundingBox()
 
         # Gear should be conical - height (Z) should be significant
@@ -81,17 +50,9 @@ class TestBevelGearGenerator:
         assert bb.ylen >= pitch_dia * 0.9, f"Y diameter {bb.ylen} too small"
 
     def test_gear_has_teeth(self, spec):
-        from mechlogic.generators.gear_bevel import BevelGearGenerator
-
-        gen = BevelGearGenerator(gear_id="driving")
-        placement = PartPlacement(
-            part_type=PartType.BEVEL_DRIVE,
-            part_id="bevel_driving",
-        )
-
-        gear = gen.generate(spec, placement)
+        solid = _cached_driving_gear(spec).val()
 
-        actual_volume = gear.val().Volume()
+        actual_volume = solid.Volume()
 
         # Basic sanity checks - gear should have positive volume
         assert actual_volume > 0, f"Gear volume should be positive: {actual_volume:.1f}"
@@ -100,6 +61,11 @@ class TestBevelGearGenerator:
         # Rough estimate: at least 200 mm^3 for a gear with ~24mm pitch diameter
         assert actual_volume > 200, f"Gear volume too small: {actual_volume:.1f}"
 
+        # Each tooth adds at least two flank faces; a plain cone has only a few
+        num_faces = len(solid.Faces())
+        min_faces = 2 * spec.gears.bevel_teeth
+        assert num_faces >= min_faces, f"Gear has {num_faces} faces, expected teeth"
+
     def test_metadata_driving(self, spec):
         from mechlogic.generators.gear_bevel import BevelGearGenerator
 
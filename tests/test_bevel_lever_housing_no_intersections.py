@@ -4,8 +4,16 @@ Validates that:
 - Housing walls don't intersect with bevel gears
 - Housing walls don't intersect with shift lever
 - Housing walls don't intersect with axles
+
+Every test only reads shared, cached shapes, so the module can be split
+across pytest-xdist workers. Use ``pytest -n auto --dist loadscope`` to keep
+each class on one worker so its class-scoped fixtures are built once.
 """
 
+import functools
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple
+
 import pytest
 import cadquery as cq
 import yaml
@@ -20,19 +28,74 @@ from mechlogic.generators.serpentine_flexure import SerpentineFlexureGenerator,
 
 
 def shapes_intersect(shape1, shape2, tolerance=0.001):
-    """Check if two shapes intersect by computing intersection volume."""
+    """Check if two shapes intersect by computing intersection volume.
+
+    Pairs with disjoint bounding boxes are rejected without running the
+    OCCT boolean; most pairs checked here are expected not to touch.
+    """
     try:
         if hasattr(shape1, 'val'):
             shape1 = shape1.val()
         if hasattr(shape2, 'val'):
             shape2 = shape2.val()
+        if shape1.BoundingBox().wrapped.IsOut(shape2.BoundingBox().wrapped):
+            return False
         intersection = shape1.intersect(shape2)
         return intersection.Volume() > tolerance
     except Exception:
         return False
 
 
-@pytest.fixture
+class _HousingBuild(NamedTuple):
+    """Upper housing shape and the generator state the tests read from it."""
+    housing: cq.Workplane
+    wall_positions: Mapping[str, Any]
+    flexure_params: Any
+    flexure_gen: Any
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_housing(spec, include_flexure: bool, origin: tuple) -> _HousingBuild:
+    """Build the upper housing once per (spec, include_flexure, origin).
+
+    Many fixtures only need the wall positions recorded while building the
+    housing; the build itself is the expensive part. include_axles does not
+    affect the housing walls, so it is not part of the key. Results are
+    shared between fixtures and must not be modified.
+    """
+    generator = BevelLeverWithUpperHousingGenerator(
+        include_axles=False,
+        include_flexure=include_flexure,
+    )
+    housing = generator._generate_upper_housing(spec, origin=origin)
+    return _HousingBuild(
+        housing=housing,
+        wall_positions=MappingProxyType(dict(generator._wall_positions)),
+        flexure_params=generator._flexure_params,
+        flexure_gen=generator._flexure_gen,
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _base_components(spec) -> tuple:
+    """Generate the bevel gear and shift lever once per spec, unpositioned.
+
+    Both bevel gears are the same part (gear_id only affects metadata), so
+    they share one shape. Callers position copies with rotate/translate,
+    which return new shapes, so the cached ones are never modified.
+    """
+    placement = PartPlacement(part_type=PartType.BEVEL_DRIVE, part_id='test')
+    bevel = BevelGearGenerator(gear_id='driving').generate(spec, placement)
+    shift_lever = ShiftLeverGenerator().generate(spec, placement)
+    return bevel, shift_lever
+
+
+def _housing_origin(bevel_geometry) -> tuple:
+    """Housing origin at clutch_center (same as mux_assembly)."""
+    return (float(bevel_geometry['clutch_center']), 0.0, 0.0)
+
+
+@pytest.fixture(scope="module")
 def spec():
     """Load the mux spec."""
     with open("examples/mux_2to1.yaml") as f:
@@ -40,7 +103,7 @@ def spec():
     return LogicElementSpec.model_validate(spec_data)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def bevel_geometry(spec):
     """Calculate bevel lever geometry positions."""
     bevel_layout = LayoutCalculator.calculate_bevel_layout(spec)
@@ -59,27 +122,21 @@ def bevel_geometry(spec):
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def upper_housing(spec, bevel_geometry):
     """Generate upper housing walls only (no axles, no mechanism)."""
-    generator = BevelLeverWithUpperHousingGenerator(include_axles=False)
-    # Generate housing at clutch_center origin (same as mux_assembly)
-    origin = (bevel_geometry['clutch_center'], 0, 0)
-    housing = generator._generate_upper_housing(spec, origin=origin)
-    return housing
+    return _cached_housing(spec, False, _housing_origin(bevel_geometry)).housing
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def components(spec, bevel_geometry):
     """Generate all bevel lever components in their final positions."""
     g = bevel_geometry
     ox = g['clutch_center']  # Origin X at clutch center (same as mux_assembly)
-    placement = PartPlacement(part_type=PartType.BEVEL_DRIVE, part_id='test')
 
-    # Generate components
-    driving_bevel = BevelGearGenerator(gear_id='driving').generate(spec, placement)
-    driven_bevel = BevelGearGenerator(gear_id='driven').generate(spec, placement)
-    shift_lever = ShiftLeverGenerator().generate(spec, placement)
+    # Generate components (shared base shapes, positioned below)
+    bevel, shift_lever = _base_components(spec)
+    driving_bevel = driven_bevel = bevel
 
     # Position components (origin at clutch axis = (clutch_center, 0, 0))
     # Driven bevel: on Z-axis below apex, teeth pointing up
@@ -131,10 +188,9 @@ class TestBevelLeverHousingNoIntersections:
 class TestBevelLeverAxleNoIntersections:
     """Tests that axles don't intersect with mechanism components."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def axles(self, spec, bevel_geometry):
         """Generate axles as standalone shapes."""
-        generator = BevelLeverWithUpperHousingGenerator(include_axles=True)
         housing_layout = LayoutCalculator.calculate_housing_layout(spec)
         bevel_layout = LayoutCalculator.calculate_bevel_layout(spec)
         pivot_y = LayoutCalculator.calculate_pivot_y(spec)
@@ -143,10 +199,8 @@ class TestBevelLeverAxleNoIntersections:
         axle_overhang = housing_layout.axle_overhang
         wall_thickness = spec.geometry.housing_thickness
 
-        # Generate housing to get wall positions (at clutch_center origin)
-        origin = (bevel_geometry['clutch_center'], 0, 0)
-        generator._generate_upper_housing(spec, origin=origin)
-        wp = generator._wall_positions
+        # Wall positions from the housing built at clutch_center origin
+        wp = _cached_housing(spec, False, _housing_origin(bevel_geometry)).wall_positions
 
         # Generate driving axle shape directly
         driving_axle_start = wp['left_wall_x'] - wall_thickness / 2 - axle_overhang
@@ -201,37 +255,26 @@ class TestBevelLeverAxleNoIntersections:
 class TestFlexureNoIntersections:
     """Tests that serpentine flexure doesn't intersect with mechanism components."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def housing_with_flexure(self, spec, bevel_geometry):
         """Generate upper housing with flexure enabled."""
-        generator = BevelLeverWithUpperHousingGenerator(
-            include_axles=False,
-            include_flexure=True,
-        )
-        origin = (bevel_geometry['clutch_center'], 0, 0)
-        housing = generator._generate_upper_housing(spec, origin=origin)
-        return housing
+        return _cached_housing(spec, True, _housing_origin(bevel_geometry)).housing
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def flexure(self, spec, bevel_geometry):
         """Generate the serpentine flexure in its mounted position."""
-        generator = BevelLeverWithUpperHousingGenerator(
-            include_axles=False,
-            include_flexure=True,
-        )
-        # Generate housing to set up wall positions (at clutch_center origin)
-        origin = (bevel_geometry['clutch_center'], 0, 0)
-        generator._generate_upper_housing(spec, origin=origin)
-        wp = generator._wall_positions
+        # Wall positions from the housing built at clutch_center origin
+        build = _cached_housing(spec, True, _housing_origin(bevel_geometry))
+        wp = build.wall_positions
 
         # Generate flexure
-        flexure_shape = generator._flexure_gen.generate()
+        flexure_shape = build.flexure_gen.generate()
 
         # Position flexure on inside of left wall (must match _add_flexure method)
         # After rotating 90° around Y, the flexure's original Z (thickness) becomes +X
         left_wall_x = wp['left_wall_x']
         wall_thickness = wp['wall_thickness']
-        flexure_thickness = generator._flexure_params.thickness
+        flexure_thickness = build.flexure_params.thickness
         flexure_wall_gap = 0.5  # Must match gap in _add_flexure
         flexure_x = left_wall_x + wall_thickness / 2 + flexure_wall_gap
 
@@ -279,18 +322,12 @@ class TestFlexureNoIntersections:
 class TestHousingWallsFlush:
     """Tests that housing walls are flush with each other."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def wall_positions(self, spec, bevel_geometry):
         """Get wall positions from generator."""
-        generator = BevelLeverWithUpperHousingGenerator(
-            include_axles=False,
-            include_flexure=True,
-        )
-        origin = (bevel_geometry['clutch_center'], 0, 0)
-        generator._generate_upper_housing(spec, origin=origin)
-        return generator._wall_positions
+        return _cached_housing(spec, True, _housing_origin(bevel_geometry)).wall_positions
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def wall_bounds(self, spec, wall_positions):
         """Calculate actual wall bounds."""
         wp = wall_positions
@@ -403,17 +440,12 @@ class TestHousingWallsFlush:
 class TestMountingHolesClearance:
     """Tests that flexure mounting holes have clearance from front/back walls."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mounting_geometry(self, spec, bevel_geometry):
         """Get mounting hole and wall positions."""
-        generator = BevelLeverWithUpperHousingGenerator(
-            include_axles=False,
-            include_flexure=True,
-        )
-        origin = (bevel_geometry['clutch_center'], 0, 0)
-        generator._generate_upper_housing(spec, origin=origin)
-        wp = generator._wall_positions
-        fp = generator._flexure_params
+        build = _cached_housing(spec, True, _housing_origin(bevel_geometry))
+        wp = build.wall_positions
+        fp = build.flexure_params
         t = wp['wall_thickness']
 
         # Calculate flexure outer dimensions
@@ -472,19 +504,17 @@ class TestMountingHolesClearance:
 class TestRightWallNoIntersections:
     """Tests that right wall doesn't intersect with driven bevel gear."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def right_wall(self, spec, bevel_geometry):
         """Generate the right wall in isolation."""
+        wp = _cached_housing(spec, True, _housing_origin(bevel_geometry)).wall_positions
+        t = wp['wall_thickness']
+
+        # Recreate right wall using same logic as generator
         generator = BevelLeverWithUpperHousingGenerator(
             include_axles=False,
             include_flexure=True,
         )
-        origin = (bevel_geometry['clutch_center'], 0, 0)
-        generator._generate_upper_housing(spec, origin=origin)
-        wp = generator._wall_positions
-        t = wp['wall_thickness']
-
-        # Recreate right wall using same logic as generator
         right_wall = generator._make_right_wall(
             wall_x=wp['right_wall_x'],
             y_min=wp['wall_bottom_y'],
@@ -505,17 +535,11 @@ class TestRightWallNoIntersections:
 class TestUpperLowerHousingAlignment:
     """Tests that upper housing walls are aligned with lower housing plates."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def housing_positions(self, spec, bevel_geometry):
         """Get positions of both upper and lower housing."""
         # Get upper housing wall positions
-        upper_gen = BevelLeverWithUpperHousingGenerator(
-            include_axles=False,
-            include_flexure=True,
-        )
-        origin = (bevel_geometry['clutch_center'], 0, 0)
-        upper_gen._generate_upper_housing(spec, origin=origin)
-        upper_wp = upper_gen._wall_positions
+        upper_wp = _cached_housing(spec, True, _housing_origin(bevel_geometry)).wall_positions
 
         # Get lower housing plate positions
         housing_layout = LayoutCalculator.calculate_housing_layout(spec)
@@ -545,18 +569,12 @@ class TestUpperLowerHousingAlignment:
 class TestDrivingAxleNoLeverIntersection:
     """Test that driving bevel axle doesn't intersect with shift lever."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def driving_axle_with_flexure(self, spec, bevel_geometry):
         """Generate the driving bevel axle from housing with flexure."""
-        generator = BevelLeverWithUpperHousingGenerator(
-            include_axles=True,
-            include_flexure=True,
-        )
-        # Generate housing to set up wall positions (at clutch_center origin)
+        # Wall positions from the housing built at clutch_center origin
         ox = bevel_geometry['clutch_center']
-        origin = (ox, 0, 0)
-        generator._generate_upper_housing(spec, origin=origin)
-        wp = generator._wall_positions
+        wp = _cached_housing(spec, True, _housing_origin(bevel_geometry)).wall_positions
         housing_layout = LayoutCalculator.calculate_housing_layout(spec)
         bevel_layout = LayoutCalculator.calculate_bevel_layout(spec)
 
@@ -592,7 +610,7 @@ class TestDrivingAxleNoLeverIntersection:
 class TestLowerHousingEnclosure:
     """Tests that lower housing enclosure walls are flush with plates."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def lower_housing_positions(self, spec):
         """Get lower housing plate and wall positions."""
         from mechlogic.generators.lower_housing import LowerHousingGenerator
@@ -678,7 +696,7 @@ class TestLowerHousingEnclosure:
 class TestExtendedWallsNoIntersections:
     """Tests that extended L-shaped walls don't intersect with gears."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def extended_housing(self, spec, bevel_geometry):
         """Generate upper housing with wall extensions enabled."""
         from mechlogic.generators.lower_housing import LowerHousingParams
@@ -696,7 +714,7 @@ class TestExtendedWallsNoIntersections:
         housing = generator._generate_upper_housing(spec, origin=origin)
         return housing, generator._wall_positions
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def selector_gears(self, spec, bevel_geometry):
         """Generate selector mechanism gears in their positions."""
         from mechlogic.generators.gear_spur import SpurGearGenerator
@@ -733,7 +751,7 @@ class TestExtendedWallsNoIntersections:
             'clutch': clutch_positioned,
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def input_gears(self, spec):
         """Generate input gears in their positions."""
         from mechlogic.generators.gear_spur import SpurGearGenerator
@@ -63,3 +63,24 @@ class TestKinematicModel:
         errors = model.verify_truth_table()
         assert len(errors) > 0
         assert any("MUX violation" in e for e in errors)
+
+    def test_get_output_matches_truth_table(self):
+        model = KinematicModel.create_mux()
+        for (a, b, s), o in model.truth_table.items():
+            assert model.get_output(a, b, s) == o
+
+        # Inputs outside the table have no output
+        assert model.get_output(2, 0, 0) is None
+
+    def test_get_output_reflects_edited_table(self):
+        model = KinematicModel.create_mux()
+        model.truth_table[(1, 0, 0)] = 0
+
+        assert model.get_output(1, 0, 0) == 0
+
+    def test_create_mux_models_independent(self):
+        model = KinematicModel.create_mux()
+        model.truth_table[(0, 1, 0)] = 1
+
+        assert KinematicModel.create_mux().truth_table[(0, 1, 0)] == 0
+        assert KinematicModel.create_mux().verify_truth_table() == []
@@ -1,9 +1,10 @@
 """Tests for layout solver bevel gear positioning."""
 
+import numpy as np
 import pytest
 
 from mechlogic.models.spec import LogicElementSpec
-from mechlogic.models.geometry import PartType
+from mechlogic.models.geometry import PartType, ShaftAxis
 from mechlogic.assembly.layout import LayoutSolver
 
 
@@ -189,3 +190,111 @@ class TestLayoutBevelGears:
         expected_z = housing_z - housing_t / 2
         assert abs(flexure.origin[2] - expected_z) < 5.0, \
             f"Flexure Z {flexure.origin[2]} not near housing outer face {expected_z}"
+
+
+class TestLayoutCalculatorCache:
+    """Tests for per-spec memoization of LayoutCalculator layouts."""
+
+    def test_equal_specs_share_layouts(self, spec, spec_data):
+        """Equal specs should share the cached mux layout and agree on the rest."""
+        from mechlogic.generators.layout import LayoutCalculator
+
+        other = LogicElementSpec.model_validate(spec_data)
+        assert LayoutCalculator.calculate_mux_layout(spec) is LayoutCalculator.calculate_mux_layout(other)
+        assert LayoutCalculator.calculate_housing_layout(spec) == LayoutCalculator.calculate_housing_layout(other)
+
+    def test_different_specs_get_own_layouts(self, spec, spec_data):
+        """Changing the spec should produce a freshly calculated layout."""
+        from mechlogic.generators.layout import LayoutCalculator
+
+        spec_data["geometry"]["gear_spacing"] = 5.0
+        other = LogicElementSpec.model_validate(spec_data)
+        layout = LayoutCalculator.calculate_selector_layout(spec)
+        other_layout = LayoutCalculator.calculate_selector_layout(other)
+        assert other_layout is not layout
+        assert other_layout.engagement_travel == layout.engagement_travel + 2.0
+
+
+class TestShaftAxes:
+    """Tests for shaft axis vector helpers."""
+
+    def test_direction_normalized(self, spec):
+        model = LayoutSolver(spec).solve()
+        for shaft in model.shafts:
+            assert np.linalg.norm(shaft.direction) == pytest.approx(1.0)
+
+    def test_residuals_measure_perpendicular_distance(self, spec):
+        model = LayoutSolver(spec).solve()
+        main_axis = next(s for s in model.shafts if s.axis_id == "main_axis")
+
+        points = main_axis.origin_vec + np.array([
+            5.0 * main_axis.direction_vec,   # On the axis
+            3.0 * main_axis.cross((1.0, 0.0, 0.0)),  # Off the axis
+        ])
+        offset = np.linalg.norm(points[1] - main_axis.origin_vec)
+        assert main_axis.residuals(points) == pytest.approx([0.0, offset])
+
+    def test_direction_takes_part_in_equality(self):
+        x_axis = ShaftAxis(axis_id="a", direction=(2.0, 0.0, 0.0), origin=(0.0, 0.0, 0.0))
+        y_axis = ShaftAxis(axis_id="a", direction=(0.0, 1.0, 0.0), origin=(0.0, 0.0, 0.0))
+
+        assert x_axis.direction == (1.0, 0.0, 0.0)
+        assert x_axis != y_axis
+        assert x_axis == ShaftAxis(axis_id="a", direction=(1.0, 0.0, 0.0), origin=(0.0, 0.0, 0.0))
+        assert not x_axis.direction_vec.flags.writeable
+
+
+class TestPartTypes:
+    """Tests for integer part type encoding."""
+
+    def test_part_types_array_matches_parts(self, spec):
+        model = LayoutSolver(spec).solve()
+        types = model.part_types_array()
+
+        part_ids = list(model.parts)
+        assert [part_ids[i] for i in np.flatnonzero(types == PartType.BEVEL_DRIVE)] == ["bevel_driving"]
+        assert len(types) == len(part_ids)
+
+    @pytest.mark.parametrize("module_name,class_name,kwargs,expected", [
+        ("gear_spur", "SpurGearGenerator", {"gear_id": "a"}, "gear_a"),
+        ("gear_spur", "SpurGearGenerator", {"gear_id": "b"}, "gear_b"),
+        ("gear_bevel", "BevelGearGenerator", {"gear_id": "driving"}, "bevel_drive"),
+        ("gear_bevel", "BevelGearGenerator", {"gear_id": "driven"}, "bevel_driven"),
+        ("axle", "AxleGenerator", {"axle_type": "main"}, "axle_main"),
+        ("axle", "AxleGenerator", {"axle_type": "s"}, "axle_s"),
+        ("axle", "AxleGenerator", {"axle_type": "lever"}, "lever_pivot"),
+        ("dog_clutch", "DogClutchGenerator", {}, "dog_clutch"),
+        ("flexure_block", "FlexureBlockGenerator", {}, "flexure_block"),
+        ("shift_lever", "ShiftLeverGenerator", {}, "shift_lever"),
+    ])
+    def test_metadata_part_id_is_string(self, spec, module_name, class_name, kwargs, expected):
+        import importlib
+
+        module = importlib.import_module(f"mechlogic.generators.{module_name}")
+        meta = getattr(module, class_name)(**kwargs).get_metadata(spec)
+        assert meta.part_id == expected
+
+
+class TestComputeLocations:
+    """Tests for batched placement locations."""
+
+    def test_compute_locations_matches_to_location(self, spec):
+        import cadquery as cq
+        from mechlogic.models.geometry import compute_locations
+
+        placements = list(LayoutSolver(spec).solve().parts.values())
+        locations = compute_locations(placements)
+
+        assert len(locations) == len(placements)
+        for placement, loc in zip(placements, locations):
+            for point in (cq.Vector(0, 0, 0).toPnt(), cq.Vector(1, 2, 3).toPnt()):
+                actual = point.Transformed(loc.wrapped.Transformation())
+                expected = point.Transformed(placement.to_location().wrapped.Transformation())
+                assert (actual.X(), actual.Y(), actual.Z()) == pytest.approx(
+                    (expected.X(), expected.Y(), expected.Z()), abs=1e-9
+                )
+
+    def test_compute_locations_empty(self):
+        from mechlogic.models.geometry import compute_locations
+
+        assert compute_locations([]) == []
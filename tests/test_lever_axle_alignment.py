@@ -16,28 +16,19 @@ from mechlogic.generators.shift_lever import ShiftLeverGenerator
 from mechlogic.generators.gear_bevel import BevelGearGenerator
 
 
-def shapes_intersect(shape1, shape2, tolerance=0.001):
+def shapes_intersect(shape1: cq.Shape, shape2: cq.Shape, tolerance=0.001):
     """Check if two shapes intersect."""
     try:
-        if hasattr(shape1, 'val'):
-            shape1 = shape1.val()
-        if hasattr(shape2, 'val'):
-            shape2 = shape2.val()
         intersection = shape1.intersect(shape2)
         return intersection.Volume() > tolerance
     except Exception:
         return False
 
 
-def create_z_axle(x: float, y: float, z_start: float, z_end: float, diameter: float) -> cq.Workplane:
+def create_z_axle(x: float, y: float, z_start: float, z_end: float, diameter: float) -> cq.Solid:
     """Create a cylindrical axle along the Z-axis."""
-    length = z_end - z_start
-    return (
-        cq.Workplane('XY')
-        .center(x, y)
-        .circle(diameter / 2)
-        .extrude(length)
-        .translate((0, 0, z_start))
+    return cq.Solid.makeCylinder(
+        diameter / 2, z_end - z_start, cq.Vector(x, y, z_start), cq.Vector(0, 0, 1)
     )
 
 
@@ -89,7 +80,7 @@ def lever(spec, mux_geometry):
     # The lever is built with pivot at (0, pivot_y, 0), so translate X to clutch_center
     lever_positioned = lever.translate((g['clutch_center'], 0, 0))
 
-    return lever_positioned
+    return lever_positioned.val()
 
 
 @pytest.fixture
@@ -7,6 +7,8 @@ Validates that:
 - Couplings fit in the available space
 """
 
+import math
+
 import pytest
 import cadquery as cq
 import yaml
@@ -64,6 +66,15 @@ class TestRightMotorMountGeneration:
         mount = gen.generate()
         assert mount.val().Volume() > 0, "Right motor mount has no volume"
 
+    def test_right_mount_parallel_matches_serial(self, spec, motor_params):
+        """Building sub-parts in worker processes should give the same solid."""
+        gen = RightMotorMountGenerator(params=motor_params, spec=spec)
+        serial = gen.generate().val().Volume()
+        parallel = gen.generate(parallel=True).val().Volume()
+        assert abs(serial - parallel) < 0.01, (
+            f"Parallel volume ({parallel}) differs from serial ({serial})"
+        )
+
     def test_right_mount_has_two_motor_positions(self, spec, motor_params):
         """Right motor mount should have positions for two motors (A and B)."""
         gen = RightMotorMountGenerator(params=motor_params, spec=spec)
@@ -84,6 +95,31 @@ class TestRightMotorMountGeneration:
         motor_b_z = positions[1][2]  # (x, y, z)
         assert motor_b_z < 0, f"Motor B Z ({motor_b_z}) should be negative"
 
+    def test_default_layout_is_shared(self):
+        """Default params without a spec should reuse one precomputed layout."""
+        layout_1 = RightMotorMountGenerator().get_layout()
+        layout_2 = RightMotorMountGenerator().get_layout()
+        assert layout_1 is layout_2
+        assert (layout_1.motor_a_z, layout_1.motor_b_z) == (36.0, -36.0)
+
+        custom = RightMotorMountGenerator(params=MotorMountParams(plate_thickness=8.0))
+        assert custom.get_layout() is not layout_1
+
+    def test_layout_is_hashable_and_comparable(self, spec, motor_params):
+        """Layouts with equal values compare equal and hash alike."""
+        layout_1 = RightMotorMountGenerator(params=motor_params, spec=spec).get_layout()
+        layout_2 = RightMotorMountGenerator(params=motor_params, spec=spec).get_layout()
+        assert layout_1 == layout_2
+        assert hash(layout_1) == hash(layout_2)
+        assert len(layout_1.mounting_hole_positions) == 4
+
+    def test_derived_params_follow_edits(self):
+        """Derived pocket dimensions reflect later edits to the params."""
+        params = MotorMountParams()
+        assert params.body_radius == pytest.approx(10.3)
+        params.motor_body_clearance = 0.5
+        assert params.body_radius == pytest.approx(10.5)
+
 
 class TestLeftMotorMountGeneration:
     """Tests for left motor mount plate generation."""
@@ -129,6 +165,44 @@ class TestShaftCouplingGeneration:
         center_x = (bbox.xmin + bbox.xmax) / 2
         assert abs(center_x) < 0.001, f"Coupling center X ({center_x}) should be 0"
 
+    def test_coupling_volume_matches_stepped_bores(self, coupling_params):
+        """Revolved coupling should have the volume of a cylinder minus both bores."""
+        p = coupling_params
+        params = ShaftCouplingParams(set_screw_diameter=0.01)  # Negligible set screws
+        coupling = ShaftCouplingGenerator(params=params).generate()
+        expected = math.pi * (
+            (p.outer_diameter / 2) ** 2 * p.length
+            - (p.motor_shaft_diameter / 2) ** 2 * p.motor_bore_length
+            - (p.mechanism_shaft_diameter / 2) ** 2 * p.mechanism_bore_length
+        )
+        assert coupling.val().Volume() == pytest.approx(expected, rel=1e-4)
+
+    def test_coupling_set_screws_cut_into_wall(self, coupling_params):
+        """Set screw holes should remove material from the coupling wall."""
+        with_screws = ShaftCouplingGenerator(params=coupling_params).generate()
+        without_screws = ShaftCouplingGenerator(
+            params=ShaftCouplingParams(set_screw_diameter=0.01)
+        ).generate()
+        assert with_screws.val().Volume() < without_screws.val().Volume() - 1.0
+
+    def test_coupling_is_shared_per_params(self, coupling_params):
+        """Generators with equal params should share one coupling shape."""
+        first = ShaftCouplingGenerator(params=coupling_params).generate()
+        second = ShaftCouplingGenerator(params=ShaftCouplingParams()).generate()
+        assert first is second
+
+    def test_positioned_coupling_flips_motor_bore(self, coupling_params):
+        """A '+X' coupling should be centered at its position with the motor bore on +X."""
+        gen = ShaftCouplingGenerator(params=coupling_params)
+        coupling = gen.generate_positioned((10.0, 5.0, -3.0), motor_side='+X').val()
+
+        center = coupling.BoundingBox().center
+        assert (center.x, center.y, center.z) == pytest.approx((10.0, 5.0, -3.0), abs=1e-3)
+        # Motor bore (small) is open at the +X end, so the +X face has the larger area
+        plus_x = max(coupling.Faces(), key=lambda f: f.Center().x)
+        minus_x = min(coupling.Faces(), key=lambda f: f.Center().x)
+        assert plus_x.Area() > minus_x.Area()
+
     def test_coupling_dimensions_match_params(self, coupling_params):
         """Coupling dimensions should match parameters."""
         gen = ShaftCouplingGenerator(params=coupling_params)
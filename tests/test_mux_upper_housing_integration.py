@@ -13,40 +13,26 @@ from mechlogic.generators.upper_housing import UpperHousingGenerator, UpperHousi
 from mechlogic.generators.gear_bevel import BevelGearGenerator
 
 
-def shapes_intersect(shape1, shape2, tolerance=0.001):
+def shapes_intersect(shape1: cq.Shape, shape2: cq.Shape, tolerance=0.001):
     """Check if two shapes intersect."""
     try:
-        if hasattr(shape1, 'val'):
-            shape1 = shape1.val()
-        if hasattr(shape2, 'val'):
-            shape2 = shape2.val()
         intersection = shape1.intersect(shape2)
         return intersection.Volume() > tolerance
     except Exception:
         return False
 
 
-def create_x_axle(y: float, z: float, x_start: float, x_end: float, diameter: float) -> cq.Workplane:
+def create_x_axle(y: float, z: float, x_start: float, x_end: float, diameter: float) -> cq.Solid:
     """Create a cylindrical axle along the X-axis."""
-    length = x_end - x_start
-    return (
-        cq.Workplane('YZ')
-        .center(y, z)
-        .circle(diameter / 2)
-        .extrude(length)
-        .translate((x_start, 0, 0))
+    return cq.Solid.makeCylinder(
+        diameter / 2, x_end - x_start, cq.Vector(x_start, y, z), cq.Vector(1, 0, 0)
     )
 
 
-def create_z_axle(x: float, y: float, z_start: float, z_end: float, diameter: float) -> cq.Workplane:
+def create_z_axle(x: float, y: float, z_start: float, z_end: float, diameter: float) -> cq.Solid:
     """Create a cylindrical axle along the Z-axis."""
-    length = z_end - z_start
-    return (
-        cq.Workplane('XY')
-        .center(x, y)
-        .circle(diameter / 2)
-        .extrude(length)
-        .translate((0, 0, z_start))
+    return cq.Solid.makeCylinder(
+        diameter / 2, z_end - z_start, cq.Vector(x, y, z_start), cq.Vector(0, 0, 1)
     )
 
 
@@ -126,7 +112,7 @@ def housing_params(mux_geometry):
 def housing(housing_params):
     """Generate the upper housing."""
     gen = UpperHousingGenerator(housing_params)
-    return gen.generate()
+    return gen.generate().val()
 
 
 @pytest.fixture
@@ -176,7 +162,7 @@ class TestMuxUpperHousingDrivingAxleOffset:
 
     OFFSET = 0.3  # mm (clearance + 0.1mm)
 
-    def _offset_housing(self, housing, dy: float, dz: float) -> cq.Workplane:
+    def _offset_housing(self, housing, dy: float, dz: float) -> cq.Shape:
         return housing.translate((0, dy, dz))
 
     def test_driving_axle_intersects_with_positive_y_offset(self, housing, mux_axles):
@@ -209,7 +195,7 @@ class TestMuxUpperHousingDrivenAxleOffset:
 
     OFFSET = 0.3  # mm (clearance + 0.1mm)
 
-    def _offset_housing(self, housing, dx: float, dy: float) -> cq.Workplane:
+    def _offset_housing(self, housing, dx: float, dy: float) -> cq.Shape:
         return housing.translate((dx, dy, 0))
 
     def test_driven_axle_intersects_with_positive_x_offset(self, housing, mux_axles):
@@ -242,28 +228,28 @@ class TestMuxUpperAxleExtent:
 
     def test_driving_axle_extends_past_left_plate(self, mux_axles, housing_params):
         axle = mux_axles['driving']
-        bbox = axle.val().BoundingBox()
+        bbox = axle.BoundingBox()
         assert bbox.xmin < housing_params.driving_left_plate_x, (
             f"Driving axle xmin ({bbox.xmin}) should be < left plate ({housing_params.driving_left_plate_x})"
         )
 
     def test_driving_axle_extends_past_right_plate(self, mux_axles, housing_params):
         axle = mux_axles['driving']
-        bbox = axle.val().BoundingBox()
+        bbox = axle.BoundingBox()
         assert bbox.xmax > housing_params.driving_right_plate_x, (
             f"Driving axle xmax ({bbox.xmax}) should be > right plate ({housing_params.driving_right_plate_x})"
         )
 
     def test_driven_axle_extends_past_front_plate(self, mux_axles, housing_params):
         axle = mux_axles['driven']
-        bbox = axle.val().BoundingBox()
+        bbox = axle.BoundingBox()
         assert bbox.zmin < housing_params.driven_front_plate_z, (
             f"Driven axle zmin ({bbox.zmin}) should be < front plate ({housing_params.driven_front_plate_z})"
         )
 
     def test_driven_axle_extends_past_back_plate(self, mux_axles, housing_params):
         axle = mux_axles['driven']
-        bbox = axle.val().BoundingBox()
+        bbox = axle.BoundingBox()
         assert bbox.zmax > housing_params.driven_back_plate_z, (
             f"Driven axle zmax ({bbox.zmax}) should be > back plate ({housing_params.driven_back_plate_z})"
         )
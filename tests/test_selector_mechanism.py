@@ -218,3 +218,24 @@ class TestSelectorMechanismClutch:
             "Clutch should intersect gear B when rotated to misalign teeth "
             "(teeth collide instead of interleaving)"
         )
+
+
+class TestSpurGearCache:
+    """Tests for the memoized rotated spur gear builder."""
+
+    def test_same_spec_reuses_gear(self, spec):
+        """Repeated requests for the same gear return the cached shape."""
+        from mechlogic.generators.gear_spur import make_spur_gear_along_x
+
+        assert make_spur_gear_along_x(spec, "a") is make_spur_gear_along_x(spec, "a")
+        assert make_spur_gear_along_x(spec, "a") is not make_spur_gear_along_x(spec, "b")
+
+    def test_cached_gear_matches_direct_build(self, spec):
+        """The cached gear has the same geometry as a directly built one."""
+        from mechlogic.generators.gear_spur import make_spur_gear_along_x
+
+        components = create_selector_components(spec)
+        cached = make_spur_gear_along_x(spec, "a").val()
+        direct = components["gear_a"].val()
+        assert abs(cached.Volume() - direct.Volume()) < 0.01
+        assert cached.BoundingBox().xmax == pytest.approx(direct.BoundingBox().xmax, abs=0.01)
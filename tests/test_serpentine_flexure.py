@@ -1,11 +1,14 @@
 """Tests for serpentine flexure geometry."""
 
+import numpy as np
 import pytest
 import cadquery as cq
 
 from mechlogic.generators.serpentine_flexure import (
     SerpentineFlexureGenerator,
     SerpentineFlexureParams,
+    effective_beam_length_np,
+    stiffness_np,
 )
 
 
@@ -31,6 +34,10 @@ class TestSerpentineFlexureGeometry:
         assert solid is not None
         assert solid.Volume() > 0
 
+    def test_is_single_connected_solid(self, flexure):
+        """Platform, beams and frame should form one connected solid."""
+        assert len(flexure.solids().vals()) == 1
+
     def test_has_correct_thickness(self, default_params, flexure):
         """Flexure should have the specified Z thickness."""
         solid = flexure.val()
@@ -116,6 +123,21 @@ class TestSerpentineFlexureStiffness:
 
         assert d_many > d_few
 
+    def test_vectorized_sweep_matches_scalar_estimates(self):
+        """Broadcast sweep should match the per-generator scalar estimates."""
+        folds = np.array([3, 4, 6])[:, None]
+        lengths = np.array([10.0, 15.0, 25.0])
+
+        k = stiffness_np(effective_beam_length_np(folds, lengths, 0.8, 2.5), 0.8, 5.0)
+
+        assert k.shape == (3, 3)
+        for i, n in enumerate(folds[:, 0]):
+            for j, length in enumerate(lengths):
+                gen = SerpentineFlexureGenerator(
+                    SerpentineFlexureParams(num_folds=int(n), segment_length=float(length))
+                )
+                assert k[i, j] == pytest.approx(gen.get_stiffness_estimate())
+
 
 class TestSerpentineFlexureForBevelDisengagement:
     """Tests specific to bevel gear disengagement use case."""
@@ -3,6 +3,7 @@
 import pytest
 import yaml
 from pathlib import Path
+from pydantic import ValidationError
 
 from mechlogic.models.spec import (
     LogicElementSpec,
@@ -126,3 +127,93 @@ class TestYAMLParsing:
         spec = LogicElementSpec.model_validate(data)
         assert spec.element.name == "mux_2to1"
         assert spec.gears.coaxial_teeth == 24
+
+    def test_fast_validate_matches_model_validate(self):
+        example_path = Path(__file__).parent.parent / "examples" / "mux_2to1.yaml"
+        if not example_path.exists():
+            pytest.skip("Example file not found")
+
+        with open(example_path) as f:
+            data = yaml.safe_load(f)
+
+        spec = LogicElementSpec.fast_validate(data)
+        assert spec == LogicElementSpec.model_validate(data)
+        assert LogicElementSpec.fast_validate(data) == spec
+
+        # The cached spec is immutable, so sharing it cannot leak edits
+        with pytest.raises(TypeError):
+            del spec.inputs["a"]
+        assert "a" in LogicElementSpec.fast_validate(data).inputs
+
+        data["geometry"]["lever_throw"] = 0.5
+        with pytest.raises(ValueError, match="lever_throw"):
+            LogicElementSpec.fast_validate(data)
+
+    def test_nested_specs_are_frozen(self):
+        example_path = Path(__file__).parent.parent / "examples" / "mux_2to1.yaml"
+        if not example_path.exists():
+            pytest.skip("Example file not found")
+
+        with open(example_path) as f:
+            data = yaml.safe_load(f)
+
+        spec = LogicElementSpec.model_validate(data)
+        spec_hash = hash(spec)
+        with pytest.raises(ValidationError):
+            spec.gears.module = 99.0
+        with pytest.raises(ValidationError):
+            spec.gears.dog_clutch.teeth = 3
+        with pytest.raises(TypeError):
+            spec.inputs["x"] = spec.inputs["a"]
+        with pytest.raises(TypeError):
+            spec.output.clear()
+        assert hash(spec) == spec_hash
+
+    def test_hash_ignores_mapping_key_order(self):
+        example_path = Path(__file__).parent.parent / "examples" / "mux_2to1.yaml"
+        if not example_path.exists():
+            pytest.skip("Example file not found")
+
+        with open(example_path) as f:
+            data = yaml.safe_load(f)
+
+        spec = LogicElementSpec.model_validate(data)
+        data["inputs"] = dict(reversed(list(data["inputs"].items())))
+        reordered = LogicElementSpec.model_validate(data)
+        assert list(reordered.inputs) != list(spec.inputs)
+        assert reordered == spec
+        assert hash(reordered) == hash(spec)
+
+    def test_spec_survives_pickle(self):
+        import pickle
+
+        example_path = Path(__file__).parent.parent / "examples" / "mux_2to1.yaml"
+        if not example_path.exists():
+            pytest.skip("Example file not found")
+
+        with open(example_path) as f:
+            data = yaml.safe_load(f)
+
+        spec = LogicElementSpec.model_validate(data)
+        restored = pickle.loads(pickle.dumps(spec))
+        assert restored == spec
+        assert hash(restored) == hash(spec)
+        with pytest.raises(TypeError):
+            restored.inputs["x"] = restored.inputs["a"]
+
+
+class TestModelImports:
+    """Tests for lightweight model imports."""
+
+    def test_models_import_without_cadquery(self):
+        import os
+        import subprocess
+        import sys
+
+        code = (
+            "import sys; import mechlogic.models; "
+            "sys.exit('cadquery' in sys.modules)"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run([sys.executable, "-c", code], env=env)
+        assert result.returncode == 0
@@ -24,27 +24,17 @@ def shapes_intersect(shape1, shape2, tolerance=0.001):
         return False
 
 
-def create_x_axle(y: float, z: float, x_start: float, x_end: float, diameter: float) -> cq.Workplane:
+def create_x_axle(y: float, z: float, x_start: float, x_end: float, diameter: float) -> cq.Solid:
     """Create a cylindrical axle along the X-axis."""
-    length = x_end - x_start
-    return (
-        cq.Workplane('YZ')
-        .center(y, z)
-        .circle(diameter / 2)
-        .extrude(length)
-        .translate((x_start, 0, 0))
+    return cq.Solid.makeCylinder(
+        diameter / 2, x_end - x_start, cq.Vector(x_start, y, z), cq.Vector(1, 0, 0)
     )
 
 
-def create_z_axle(x: float, y: float, z_start: float, z_end: float, diameter: float) -> cq.Workplane:
+def create_z_axle(x: float, y: float, z_start: float, z_end: float, diameter: float) -> cq.Solid:
     """Create a cylindrical axle along the Z-axis."""
-    length = z_end - z_start
-    return (
-        cq.Workplane('XY')
-        .center(x, y)
-        .circle(diameter / 2)
-        .extrude(length)
-        .translate((0, 0, z_start))
+    return cq.Solid.makeCylinder(
+        diameter / 2, z_end - z_start, cq.Vector(x, y, z_start), cq.Vector(0, 0, 1)
     )
 
 
@@ -190,7 +180,7 @@ class TestUpperHousingAxleExtent:
     def test_driving_axle_extends_past_left_plate(self, axles, default_params):
         """Driving axle should extend past the left (outer) plate."""
         axle = axles['driving']
-        bbox = axle.val().BoundingBox()
+        bbox = axle.BoundingBox()
         assert bbox.xmin < default_params.driving_left_plate_x, (
             f"Driving axle xmin ({bbox.xmin}) should be < left plate ({default_params.driving_left_plate_x})"
         )
@@ -198,7 +188,7 @@ class TestUpperHousingAxleExtent:
     def test_driving_axle_reaches_gear_position(self, axles, default_params):
         """Driving axle should reach past the gear position."""
         axle = axles['driving']
-        bbox = axle.val().BoundingBox()
+        bbox = axle.BoundingBox()
         # Axle should extend past the gear (at driving_bevel_x)
         assert bbox.xmax > default_params.driving_bevel_x, (
             f"Driving axle xmax ({bbox.xmax}) should be > gear position ({default_params.driving_bevel_x})"
@@ -207,7 +197,7 @@ class TestUpperHousingAxleExtent:
     def test_driven_axle_extends_past_front_plate(self, axles, default_params):
         """Driven axle should extend past the front (outer) plate."""
         axle = axles['driven']
-        bbox = axle.val().BoundingBox()
+        bbox = axle.BoundingBox()
         assert bbox.zmin < default_params.driven_front_plate_z, (
             f"Driven axle zmin ({bbox.zmin}) should be < front plate ({default_params.driven_front_plate_z})"
         )
@@ -215,7 +205,7 @@ class TestUpperHousingAxleExtent:
     def test_driven_axle_reaches_gear_position(self, axles, default_params):
         """Driven axle should reach past the gear position."""
         axle = axles['driven']
-        bbox = axle.val().BoundingBox()
+        bbox = axle.BoundingBox()
         # Axle should extend past the gear (at driven_bevel_z)
         assert bbox.zmax > default_params.driven_bevel_z, (
             f"Driven axle zmax ({bbox.zmax}) should be > gear position ({default_params.driven_bevel_z})"
@@ -273,3 +263,62 @@ class TestUpperHousingGeometry:
         assert not shapes_intersect(driven_front, driven_back), (
             "Driven front and back plates should not intersect"
         )
+
+    def test_plate_templates_shared(self, default_params):
+        """Generators with equal params should share the plate templates."""
+        gen = UpperHousingGenerator(default_params)
+        other_gen = UpperHousingGenerator(UpperHousingParams())
+
+        assert gen._driving_template is other_gen._driving_template
+        assert gen._driven_template is other_gen._driven_template
+
+    def test_plates_centered_on_position(self, default_params):
+        """Moved template plates should be centered on their plate position."""
+        gen = UpperHousingGenerator(default_params)
+        half = default_params.plate_thickness / 2
+
+        left = gen.generate_driving_left_plate().val().BoundingBox()
+        front = gen.generate_driven_front_plate().val().BoundingBox()
+
+        assert left.xmin == pytest.approx(default_params.driving_left_plate_x - half)
+        assert left.xmax == pytest.approx(default_params.driving_left_plate_x + half)
+        assert front.zmin == pytest.approx(default_params.driven_front_plate_z - half)
+        assert front.zmax == pytest.approx(default_params.driven_front_plate_z + half)
+
+    def test_generate_keeps_plates_as_separate_solids(self, default_params):
+        """generate() should group plates into a compound without fusing them."""
+        gen = UpperHousingGenerator(default_params)
+
+        assert len(gen.generate(cantilevered=True).val().Solids()) == 2
+        assert len(gen.generate(cantilevered=False).val().Solids()) == 4
+
+    def test_params_hashable_with_cached_positions(self, default_params):
+        """Frozen params should hash the same before and after reading positions."""
+        before = hash(default_params)
+        left_x = default_params.driving_left_plate_x
+
+        assert default_params.driving_left_plate_x == left_x
+        assert hash(default_params) == before
+        assert default_params == UpperHousingParams()
+
+    def test_plate_hole_volume(self, default_params):
+        """Plates should be a square slab minus one through-hole."""
+        import math
+
+        p = default_params
+        gen = UpperHousingGenerator(p)
+        hole_radius = p.axle_diameter / 2 + p.axle_clearance
+        expected = (p.plate_size ** 2 - math.pi * hole_radius ** 2) * p.plate_thickness
+
+        assert gen.generate_driving_left_plate().val().Volume() == pytest.approx(expected, rel=1e-3)
+        assert gen.generate_driven_front_plate().val().Volume() == pytest.approx(expected, rel=1e-3)
+
+    def test_plate_positions_cached_read_only(self, default_params):
+        """get_plate_positions should return one shared, read-only mapping."""
+        gen = UpperHousingGenerator(default_params)
+        info = gen.get_plate_positions()
+
+        assert gen.get_plate_positions() is info
+        assert info['driving_left_plate_x'] == default_params.driving_left_plate_x
+        with pytest.raises(TypeError):
+            info['driving_left_plate_x'] = 0.0